@@ -20,6 +20,8 @@ from models import db, User, Settings
 from functools import wraps
 from datetime import datetime, timedelta
 from utils.helpers import parse_iso_date
+from utils.json_provider import OrjsonProvider
+from utils.conflict_kernel import warm_up as warm_up_conflict_kernel
 
 # Validation constants
 VALID_SUN_EXPOSURES = ['full', 'partial', 'shade']
@@ -82,6 +84,7 @@ def get_mulch_type_on_date(garden_bed_id, user_id, query_date):
     return bed.mulch_type if bed else 'none'
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)  # Faster JSON encode/decode for API responses
 # Database: Use instance folder for SQLite (where your actual data lives)
 # sqlite:/// (3 slashes) = relative path from app root
 # Using os.path.join ensures correct path regardless of working directory
@@ -165,6 +168,9 @@ with app.app_context():
         db.session.commit()
         print("[OK] Created default admin user (admin/admin123)")
 
+# Compile the conflict-check kernel now rather than on the first request
+warm_up_conflict_kernel()
+
 # ==================== ALL ROUTES NOW HANDLED BY BLUEPRINTS ====================
 #
 # All application routes have been refactored into modular blueprints.
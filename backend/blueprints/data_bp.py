@@ -16,6 +16,8 @@ Routes:
 - GET /api/bed-templates/<id> - Get specific template
 - GET /api/structures - Get all structures and user's garden beds
 """
+from dataclasses import asdict
+
 from flask import Blueprint, jsonify
 from flask_login import login_required, current_user
 
@@ -27,7 +29,9 @@ from garden_methods import (
     PLANT_GUILDS,
     get_methods_list,
     get_template_by_id,
-    get_guild_by_id
+    get_guild_by_id,
+    Placement,
+    placement_to_dict
 )
 from models import GardenBed
 
@@ -51,6 +55,25 @@ def _normalize_plant_keys(plant_dict):
     return result
 
 
+def _guild_to_dict(guild):
+    """Expand a guild's GuildPlant records for API response."""
+    result = dict(guild)
+    result['plants'] = [asdict(p) for p in guild['plants']]
+    return result
+
+
+def _template_to_dict(template):
+    """Expand a bed template's Placement tuples for API response."""
+    if 'plants' not in template:
+        return template
+    result = dict(template)
+    result['plants'] = [
+        placement_to_dict(p) if isinstance(p, Placement) else p
+        for p in template['plants']
+    ]
+    return result
+
+
 # ==================== PLANT DATA ====================
 
 @data_bp.route('/plants')
@@ -75,7 +98,7 @@ def get_plant(plant_id):
 @data_bp.route('/guilds')
 def get_guilds():
     """Get all plant guilds (companion planting templates)"""
-    return jsonify(PLANT_GUILDS)
+    return jsonify({guild_id: _guild_to_dict(g) for guild_id, g in PLANT_GUILDS.items()})
 
 
 @data_bp.route('/guilds/<guild_id>')
@@ -83,14 +106,14 @@ def get_guild(guild_id):
     """Get specific plant guild"""
     guild = get_guild_by_id(guild_id)
     if guild:
-        return jsonify(guild)
+        return jsonify(_guild_to_dict(guild))
     return jsonify({'error': 'Guild not found'}), 404
 
 
 @data_bp.route('/plant-guilds')
 def get_plant_guilds():
     """Get all plant guilds (alias for /guilds)"""
-    return jsonify(PLANT_GUILDS)
+    return get_guilds()
 
 
 @data_bp.route('/plant-guilds/<guild_id>')
@@ -99,7 +122,7 @@ def get_plant_guild(guild_id):
     guild = get_guild_by_id(guild_id)
     if not guild:
         return jsonify({'error': 'Guild not found'}), 404
-    return jsonify(guild)
+    return jsonify(_guild_to_dict(guild))
 
 
 # ==================== GARDEN METHODS ====================
@@ -127,7 +150,7 @@ def get_garden_method(method_id):
 @data_bp.route('/bed-templates')
 def get_bed_templates():
     """Get all bed templates"""
-    return jsonify(BED_TEMPLATES)
+    return jsonify([_template_to_dict(t) for t in BED_TEMPLATES])
 
 
 @data_bp.route('/bed-templates/<template_id>')
@@ -136,7 +159,7 @@ def get_bed_template(template_id):
     template = get_template_by_id(template_id)
     if not template:
         return jsonify({'error': 'Template not found'}), 404
-    return jsonify(template)
+    return jsonify(_template_to_dict(template))
 
 
 # ==================== STRUCTURES ====================
@@ -16,9 +16,15 @@ from models import db, GardenBed, PlantedItem, PlantingEvent, IndoorSeedStart, G
 from sqlalchemy import func as sa_func
 from plant_database import get_plant_by_id
 from blueprints.garden_planner_bp import _adjust_auto_plan_item
-from garden_methods import GARDEN_METHODS
-from conflict_checker import has_conflict, validate_planting_conflict, get_primary_planting_date, query_candidate_items
+from blueprints.utilities_bp import cache_bed_protection
+from garden_methods import GARDEN_METHODS, get_method_grid_size
+from conflict_checker import (
+    BedConflictIndex, ConflictEvent, has_conflict, has_conflicts_batch,
+    validate_planting_conflict, get_primary_planting_date, query_candidate_items,
+    query_candidate_items_by_bed,
+)
 from services.space_calculator import calculate_space_requirement
+from services.planting_service import unlink_planting_events
 from simulation_clock import get_now, get_utc_now
 
 
@@ -211,7 +217,7 @@ def garden_beds():
             height = 12.0
 
         # Get grid size based on method
-        grid_size = GARDEN_METHODS.get(planning_method, {}).get('gridSize', 12)
+        grid_size = get_method_grid_size(planning_method)
 
         # Auto-generate name if not provided
         name = data.get('name') or f"{width}' x {length}' Bed"
@@ -241,6 +247,7 @@ def garden_beds():
                 season_extension=season_extension_json,
                 zone=zone
             )
+            cache_bed_protection(bed)
             db.session.add(bed)
             db.session.commit()
             return jsonify(bed.to_dict()), 201
@@ -264,6 +271,8 @@ def garden_bed(bed_id):
         return jsonify({'error': 'Unauthorized'}), 403
 
     if request.method == 'DELETE':
+        # The bed's PlantedItems are deleted with it (cascade)
+        unlink_planting_events(db.select(PlantedItem.id).filter_by(garden_bed_id=bed.id))
         db.session.delete(bed)
         db.session.commit()
         return '', 204
@@ -285,12 +294,13 @@ def garden_bed(bed_id):
             bed.zone = data.get('zone')
 
         # Auto-set grid size based on planning method (same as CREATE)
-        bed.grid_size = GARDEN_METHODS.get(bed.planning_method, {}).get('gridSize', 12)
+        bed.grid_size = get_method_grid_size(bed.planning_method)
 
         # Handle season extension update
         if 'seasonExtension' in data:
             season_ext = data.get('seasonExtension')
             bed.season_extension = json.dumps(season_ext) if season_ext else None
+            cache_bed_protection(bed)
 
         db.session.commit()
 
@@ -412,6 +422,7 @@ def add_planted_item():
                 db.session.rollback()  # Rollback PlantedItem too
                 return jsonify(error_response), 409
 
+        planting_event.planted_item = item
         db.session.add(planting_event)
         db.session.flush()  # Get planting_event.id for linking
 
@@ -529,6 +540,7 @@ def batch_add_planted_items():
         # Create all items in transaction
         created_items = []
         created_events = []  # Track PlantingEvents for indoor seed start auto-creation
+        conflict_index = None  # Bed's existing items, queried once for the whole batch
 
         # DEBUG: Log incoming positions
         print(f"=== BACKEND BATCH DEBUG ===")
@@ -635,7 +647,9 @@ def batch_add_planted_items():
                 # PlantedItems in the session would get flushed to DB, "reviving"
                 # orphaned PlantingEvents and causing false 409 conflicts.
                 with db.session.no_autoflush:
-                    is_valid, error_response = validate_planting_conflict({
+                    if conflict_index is None:
+                        conflict_index = BedConflictIndex(bed, current_user.id)
+                    is_valid, error_response = conflict_index.check({
                         'garden_bed_id': planting_event.garden_bed_id,
                         'position_x': planting_event.position_x,
                         'position_y': planting_event.position_y,
@@ -646,7 +660,7 @@ def batch_add_planted_items():
                         'start_date': start_date,
                         'end_date': planting_event.expected_harvest_date,
                         'conflict_override': conflict_override  # Use value from request
-                    }, current_user.id)
+                    })
 
                 if not is_valid:
                     db.session.rollback()  # Rollback entire batch
@@ -663,6 +677,7 @@ def batch_add_planted_items():
                         'message': f"Batch creation failed at position ({pos['x']}, {pos['y']}). {conflict_details}"
                     }), 409
 
+            planting_event.planted_item = item
             db.session.add(item)
             db.session.add(planting_event)
             created_items.append(item)
@@ -835,12 +850,14 @@ def clear_bed_by_date(bed_id, date_str):
 
     # Delete PlantedItems at those positions
     for pos_x, pos_y in positions_to_delete:
-        PlantedItem.query.filter_by(
+        delete_filter = PlantedItem.query.filter_by(
             garden_bed_id=bed_id,
             position_x=pos_x,
             position_y=pos_y,
             user_id=current_user.id
-        ).delete(synchronize_session=False)
+        )
+        unlink_planting_events(delete_filter.with_entities(PlantedItem.id).scalar_subquery())
+        delete_filter.delete(synchronize_session=False)
 
     # Commit deletions first so they persist even if plan adjustment fails
     db.session.commit()
@@ -943,6 +960,7 @@ def remove_all_by_plant(bed_id, plant_id):
     )
     if variety:
         delete_filter = delete_filter.filter_by(variety=variety)
+    unlink_planting_events(delete_filter.with_entities(PlantedItem.id).scalar_subquery())
     delete_filter.delete(synchronize_session=False)
 
     # Commit deletions first so they persist even if plan adjustment fails
@@ -1013,6 +1031,9 @@ def clear_bed(bed_id):
     PlantingEvent.query.filter_by(garden_bed_id=bed_id, user_id=current_user.id).delete()
 
     # Delete all planted items for this bed
+    unlink_planting_events(
+        db.select(PlantedItem.id).filter_by(garden_bed_id=bed_id, user_id=current_user.id)
+    )
     PlantedItem.query.filter_by(garden_bed_id=bed_id, user_id=current_user.id).delete()
 
     # Commit deletions first so they persist even if plan adjustment fails
@@ -1072,6 +1093,7 @@ def planted_item(item_id):
         item_quantity = item.quantity or 1
         item_bed_id = item.garden_bed_id
 
+        unlink_planting_events([item.id])
         db.session.delete(item)
         db.session.commit()
 
@@ -2239,17 +2261,17 @@ def check_planting_conflict_route():
         )
 
         # Create temporary event object for conflict checking
-        temp_event = type('TempEvent', (), {
-            'position_x': data['positionX'],
-            'position_y': data['positionY'],
-            'garden_bed_id': data['gardenBedId'],
-            'plant_id': data['plantId'],
-            'transplant_date': parse_iso_date(data.get('transplantDate')) if data.get('transplantDate') else None,
-            'direct_seed_date': parse_iso_date(data.get('directSeedDate')) if data.get('directSeedDate') else None,
-            'seed_start_date': parse_iso_date(data.get('seedStartDate')) if data.get('seedStartDate') else None,
-            'expected_harvest_date': end_date,
-            'id': exclude_item_id
-        })()
+        temp_event = ConflictEvent(
+            id=exclude_item_id,
+            position_x=data['positionX'],
+            position_y=data['positionY'],
+            garden_bed_id=data['gardenBedId'],
+            plant_id=data['plantId'],
+            transplant_date=parse_iso_date(data.get('transplantDate')) if data.get('transplantDate') else None,
+            direct_seed_date=parse_iso_date(data.get('directSeedDate')) if data.get('directSeedDate') else None,
+            seed_start_date=parse_iso_date(data.get('seedStartDate')) if data.get('seedStartDate') else None,
+            expected_harvest_date=end_date,
+        )
 
         # Check for conflicts
         result = has_conflict(temp_event, candidate_events, garden_bed)
@@ -2419,9 +2441,10 @@ def audit_conflicts():
     # Query PlantedItems directly — ground truth, no orphan issues
     # Group by garden bed for efficient checking
     beds = GardenBed.query.filter_by(user_id=user_id).all()
+    events_by_bed = query_candidate_items_by_bed(user_id, [bed.id for bed in beds])
     beds_map = {}
     for bed in beds:
-        events = query_candidate_items(bed.id, user_id)
+        events = events_by_bed.get(bed.id)
         if events:
             beds_map[bed.id] = {'bed': bed, 'events': events}
 
@@ -2433,45 +2456,49 @@ def audit_conflicts():
         bed = bed_data['bed']
         bed_events = bed_data['events']
 
+        # Check every event against the rest of its bed in one batch
+        position_of = {event.id: i for i, event in enumerate(bed_events)}
+        results = has_conflicts_batch(bed_events, bed_events, bed)
+
         for i, event_a in enumerate(bed_events):
-            for event_b in bed_events[i+1:]:  # Only check each pair once
+            for conflict in results[i]['conflicts']:
+                j = position_of[conflict['eventId']]
+                if j <= i:  # Only report each pair once
+                    continue
+                event_b = bed_events[j]
                 pair_key = tuple(sorted([event_a.id, event_b.id]))
                 if pair_key in checked_pairs:
                     continue
                 checked_pairs.add(pair_key)
 
-                # Check if these two events conflict
-                result = has_conflict(event_a, [event_b], bed)
-
-                if result['has_conflict']:
-                    plant_a = get_plant_by_id(event_a.plant_id)
-                    plant_b = get_plant_by_id(event_b.plant_id)
-
-                    start_a = get_primary_planting_date(event_a)
-                    start_b = get_primary_planting_date(event_b)
-
-                    conflicts_found.append({
-                        'gardenBedId': bed_id,
-                        'gardenBedName': bed.name if bed else f'Bed {bed_id}',
-                        'position': {
-                            'x': event_a.position_x,
-                            'y': event_a.position_y
-                        },
-                        'eventA': {
-                            'id': event_a.id,
-                            'plantName': plant_a.get('name', 'Unknown') if plant_a else 'Unknown',
-                            'variety': event_a.variety,
-                            'startDate': start_a.isoformat() if start_a else None,
-                            'endDate': event_a.expected_harvest_date.isoformat() if event_a.expected_harvest_date else None
-                        },
-                        'eventB': {
-                            'id': event_b.id,
-                            'plantName': plant_b.get('name', 'Unknown') if plant_b else 'Unknown',
-                            'variety': event_b.variety,
-                            'startDate': start_b.isoformat() if start_b else None,
-                            'endDate': event_b.expected_harvest_date.isoformat() if event_b.expected_harvest_date else None
-                        }
-                    })
+                plant_a = get_plant_by_id(event_a.plant_id)
+                plant_b = get_plant_by_id(event_b.plant_id)
+
+                start_a = get_primary_planting_date(event_a)
+                start_b = get_primary_planting_date(event_b)
+
+                conflicts_found.append({
+                    'gardenBedId': bed_id,
+                    'gardenBedName': bed.name if bed else f'Bed {bed_id}',
+                    'position': {
+                        'x': event_a.position_x,
+                        'y': event_a.position_y
+                    },
+                    'eventA': {
+                        'id': event_a.id,
+                        'plantName': plant_a.get('name', 'Unknown') if plant_a else 'Unknown',
+                        'variety': event_a.variety,
+                        'startDate': start_a.isoformat() if start_a else None,
+                        'endDate': event_a.expected_harvest_date.isoformat() if event_a.expected_harvest_date else None
+                    },
+                    'eventB': {
+                        'id': event_b.id,
+                        'plantName': plant_b.get('name', 'Unknown') if plant_b else 'Unknown',
+                        'variety': event_b.variety,
+                        'startDate': start_b.isoformat() if start_b else None,
+                        'endDate': event_b.expected_harvest_date.isoformat() if event_b.expected_harvest_date else None
+                    }
+                })
 
     return jsonify({
         'total_conflicts': len(conflicts_found),
@@ -16,7 +16,7 @@ from structures_database import STRUCTURES_DATABASE, get_structure_by_id
 from collision_validator import validate_structure_placement
 from services.geocoding_service import geocoding_service
 from utils.helpers import parse_iso_date
-from frost_date_lookup import get_frost_dates_for_user
+from frost_date_lookup import get_frost_dates_for_user, clear_frost_date_cache
 
 properties_bp = Blueprint('properties', __name__, url_prefix='/api')
 
@@ -51,6 +51,7 @@ def properties():
             prop.first_frost_date = parsed.date() if hasattr(parsed, 'date') else parsed
         db.session.add(prop)
         db.session.commit()
+        clear_frost_date_cache(current_user.id)
         return jsonify(prop.to_dict()), 201
 
     # Filter by current user
@@ -71,6 +72,7 @@ def property_detail(property_id):
     if request.method == 'DELETE':
         db.session.delete(prop)
         db.session.commit()
+        clear_frost_date_cache(current_user.id)
         return '', 204
 
     if request.method == 'PUT':
@@ -99,6 +101,7 @@ def property_detail(property_id):
             else:
                 prop.first_frost_date = None
         db.session.commit()
+        clear_frost_date_cache(current_user.id)
 
     return jsonify(prop.to_dict())
 
@@ -25,8 +25,9 @@ Routes:
 from flask import Blueprint, request, jsonify, send_file
 from flask_login import login_required, current_user
 from datetime import datetime, timedelta, date
+from sqlalchemy import update
 from models import db, GardenBed, PlantedItem, PlantingEvent, IndoorSeedStart, Property, PlacedStructure, Settings, SeedInventory, GardenPlan, GardenPlanItem
-from plant_database import get_plant_by_id, PLANT_DATABASE
+from plant_database import get_plant_by_id, get_plants_by_ids, PLANT_DATABASE
 from garden_methods import (
     get_sfg_quantity,
     get_row_spacing,
@@ -44,9 +45,19 @@ from soil_temperature import (
 )
 from maple_tapping_calculator import calculate_tapping_season
 from services.geocoding_service import geocoding_service
+from services.planting_service import unlink_planting_events
 from conflict_checker import validate_planting_conflict
-from season_validator import validate_planting_for_property
-from forward_planting_validator import validate_planting_date, check_future_cold_danger
+from season_validator import (
+    validate_planting_for_property,
+    validate_planting_for_property_both_methods,
+    validate_planting_validity_both_methods,
+)
+from forward_planting_validator import (
+    validate_planting_date,
+    fetch_historical_cold_window,
+    check_future_cold_danger_with_data,
+    MAX_COLD_CHECK_DAYS,
+)
 from simulation_clock import get_now, get_utc_now
 from utils.helpers import parse_iso_date
 from frost_date_lookup import get_frost_dates_for_user
@@ -57,6 +68,9 @@ import io
 import math
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
@@ -241,6 +255,65 @@ def calculate_seed_quantity(desired_plants: int, germination_rate: float) -> int
 
 # ==================== SPACING CALCULATOR ====================
 
+def _sfg_spacing(plant_id, bed_width, bed_length, bed_w_in, bed_l_in):
+    quantity = get_sfg_quantity(plant_id)
+    squares = bed_width * bed_length
+    return {
+        'method': 'square-foot',
+        'perSquare': quantity,
+        'totalSquares': squares,
+        'totalPlants': squares * quantity,
+        'gridSize': 12
+    }
+
+
+def _row_spacing(plant_id, bed_width, bed_length, bed_w_in, bed_l_in):
+    spacing = get_row_spacing(plant_id)
+    num_rows = int(bed_w_in / spacing.rowSpacing)
+    plants_per_row = int(bed_l_in / spacing.plantSpacing)
+    return {
+        'method': 'row',
+        'rowSpacing': spacing.rowSpacing,
+        'plantSpacing': spacing.plantSpacing,
+        'numRows': num_rows,
+        'plantsPerRow': plants_per_row,
+        'totalPlants': num_rows * plants_per_row
+    }
+
+
+def _intensive_spacing(plant_id, bed_width, bed_length, bed_w_in, bed_l_in):
+    return {
+        'method': 'intensive',
+        'spacing': get_intensive_spacing(plant_id),
+        'totalPlants': calculate_plants_per_bed(bed_width, bed_length, plant_id, 'intensive'),
+        'pattern': 'hexagonal'
+    }
+
+
+def _migardener_spacing(plant_id, bed_width, bed_length, bed_w_in, bed_l_in):
+    spacing = get_migardener_spacing(plant_id)
+    num_rows = int(bed_w_in / spacing.rowSpacing)
+    plants_per_row = int(bed_l_in / spacing.plantSpacing)
+    total = num_rows * plants_per_row
+    return {
+        'method': 'migardener',
+        'rowSpacing': spacing.rowSpacing,
+        'plantSpacing': spacing.plantSpacing,
+        'numRows': num_rows,
+        'plantsPerRow': plants_per_row,
+        'totalPlants': total,
+        'plantsPerSqFt': round(total / (bed_width * bed_length), 1)
+    }
+
+
+_SPACING_CALCULATORS = {
+    'square-foot': _sfg_spacing,
+    'row': _row_spacing,
+    'intensive': _intensive_spacing,
+    'migardener': _migardener_spacing,
+}
+
+
 @utilities_bp.route('/spacing-calculator', methods=['POST'])
 def calculate_spacing():
     """Calculate plant spacing and quantity for a bed"""
@@ -250,63 +323,21 @@ def calculate_spacing():
     bed_length = data.get('bedLength')
     method = data.get('method', 'square-foot')
 
-    if method == 'square-foot':
-        quantity = get_sfg_quantity(plant_id)
-        squares = bed_width * bed_length
-        total = squares * quantity
-        return jsonify({
-            'method': 'square-foot',
-            'perSquare': quantity,
-            'totalSquares': squares,
-            'totalPlants': total,
-            'gridSize': 12
-        })
+    calculator = _SPACING_CALCULATORS.get(method)
+    if calculator is None:
+        return jsonify({'error': 'Invalid method'}), 400
 
-    elif method == 'row':
-        spacing = get_row_spacing(plant_id)
-        bed_width_inches = bed_width * 12
-        bed_length_inches = bed_length * 12
-        num_rows = int(bed_width_inches / spacing['rowSpacing'])
-        plants_per_row = int(bed_length_inches / spacing['plantSpacing'])
-        total = num_rows * plants_per_row
-        return jsonify({
-            'method': 'row',
-            'rowSpacing': spacing['rowSpacing'],
-            'plantSpacing': spacing['plantSpacing'],
-            'numRows': num_rows,
-            'plantsPerRow': plants_per_row,
-            'totalPlants': total
-        })
-
-    elif method == 'intensive':
-        spacing_inches = get_intensive_spacing(plant_id)
-        total = calculate_plants_per_bed(bed_width, bed_length, plant_id, 'intensive')
-        return jsonify({
-            'method': 'intensive',
-            'spacing': spacing_inches,
-            'totalPlants': total,
-            'pattern': 'hexagonal'
-        })
+    if not plant_id:
+        return jsonify({'error': 'plantId is required'}), 400
 
-    elif method == 'migardener':
-        spacing = get_migardener_spacing(plant_id)
-        bed_width_inches = bed_width * 12
-        bed_length_inches = bed_length * 12
-        num_rows = int(bed_width_inches / spacing['rowSpacing'])
-        plants_per_row = int(bed_length_inches / spacing['plantSpacing'])
-        total = num_rows * plants_per_row
-        plants_per_sqft = total / (bed_width * bed_length)
-        return jsonify({
-            'method': 'migardener',
-            'rowSpacing': spacing['rowSpacing'],
-            'plantSpacing': spacing['plantSpacing'],
-            'numRows': num_rows,
-            'plantsPerRow': plants_per_row,
-            'totalPlants': total,
-            'plantsPerSqFt': round(plants_per_sqft, 1)
-        })
+    for value in (bed_width, bed_length):
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+            return jsonify({'error': 'bedWidth and bedLength must be positive numbers'}), 400
 
-    return jsonify({'error': 'Invalid method'}), 400
+    # Convert feet to inches once; the row-based calculators reuse these
+    bed_w_in = bed_width * 12
+    bed_l_in = bed_length * 12
+    return jsonify(calculator(plant_id, bed_width, bed_length, bed_w_in, bed_l_in))
 
 
 # ==================== PDF EXPORT ====================
@@ -442,10 +473,9 @@ def get_soil_temperature():
         # If zipcode provided, geocode it to get coordinates
         if zipcode and not (latitude and longitude):
             try:
-                geo_result = geocoding_service.validate_address(zipcode)
-                if geo_result:
-                    lat = geo_result['latitude']
-                    lon = geo_result['longitude']
+                coords = geocoding_service.get_zipcode_coordinates(zipcode)
+                if coords:
+                    lat, lon = coords
                 else:
                     return jsonify({'error': 'Could not geocode zipcode'}), 400
             except Exception as e:
@@ -469,18 +499,9 @@ def get_soil_temperature():
         temps_by_depth = multi_result['temps_by_depth']
 
         # Calculate protection offset from bed's season extension (cold frame, row cover, etc.)
-        protection_offset = 0
-        protection_label = None
-        if garden_bed and garden_bed.season_extension:
-            try:
-                season_ext = json.loads(garden_bed.season_extension)
-                ext_type = season_ext.get('type')
-                inner_type = season_ext.get('innerType')
-                protection_offset, protection_label = calculate_protection_offset(
-                    ext_type, inner_type
-                )
-            except (json.JSONDecodeError, TypeError):
-                pass
+        protection_offset, protection_label = _protection_from_season_extension(
+            garden_bed.season_extension if garden_bed else None
+        )
 
         # Apply protection offset to all depth temperatures
         if protection_offset:
@@ -674,10 +695,9 @@ def get_maple_tapping_season():
 
         if zipcode and not (latitude and longitude):
             try:
-                geo_result = geocoding_service.validate_address(zipcode)
-                if geo_result:
-                    lat = geo_result['latitude']
-                    lon = geo_result['longitude']
+                coords = geocoding_service.get_zipcode_coordinates(zipcode)
+                if coords:
+                    lat, lon = coords
                 else:
                     return jsonify({'error': 'Could not geocode zipcode'}), 400
             except Exception as e:
@@ -890,6 +910,7 @@ def indoor_seed_start_detail(id):
                     user_id=current_user.id,
                 ).all()
                 deleted_planted_items += len(planted_items)
+                unlink_planting_events([pi.id for pi in planted_items])
                 for pi in planted_items:
                     db.session.delete(pi)
 
@@ -1335,25 +1356,29 @@ def create_indoor_start_from_planting_event():
             status=initial_status
         )
 
-        db.session.add(seed_start)
-        db.session.flush()  # Get seed_start.id
-
-        # If linking to existing PlantingEvent, update its seed_start_date
+        # If linking to existing PlantingEvent, update its dates in place; the
+        # rowcount tells us whether the event exists for this user
         planting_event_id = data.get('plantingEventId')
         if planting_event_id:
-            planting_event = PlantingEvent.query.filter_by(
-                id=planting_event_id,
-                user_id=current_user.id
-            ).first()
-            if planting_event:
-                planting_event.seed_start_date = indoor_start_date
-                planting_event.transplant_date = expected_transplant_date
-                # Recalculate harvest date from new transplant date
-                days_to_maturity = plant.get('daysToMaturity', 70)
-                planting_event.expected_harvest_date = expected_transplant_date + timedelta(days=days_to_maturity)
-            else:
+            # Recalculate harvest date from new transplant date
+            days_to_maturity = plant.get('daysToMaturity', 70)
+            updated = db.session.execute(
+                update(PlantingEvent)
+                .where(
+                    PlantingEvent.id == planting_event_id,
+                    PlantingEvent.user_id == current_user.id
+                )
+                .values(
+                    seed_start_date=indoor_start_date,
+                    transplant_date=expected_transplant_date,
+                    expected_harvest_date=expected_transplant_date + timedelta(days=days_to_maturity)
+                )
+            ).rowcount
+            if not updated:
+                db.session.rollback()
                 return jsonify({'error': 'Planting event not found'}), 404
 
+        db.session.add(seed_start)
         db.session.commit()
 
         response_data = {
@@ -1380,6 +1405,53 @@ def create_indoor_start_from_planting_event():
 
 # ==================== PLANTING VALIDATION ROUTES ====================
 
+# Base temperature boost (°F) from season extension structures
+# Values based on extension service research and Coleman's data
+PROTECTION_TEMPS = {
+    'row-cover': 4,      # Extension: 2-6°F, heavy up to 8°F
+    'low-tunnel': 6,     # Hoops with row cover: 4-8°F
+    'cold-frame': 10,    # Cold frame: 8-12°F on sunny days
+    'high-tunnel': 8,    # Single plastic: few degrees more than cover
+    'greenhouse': 10,    # Similar to cold frame
+}
+
+# Human-readable labels
+PROTECTION_LABELS = {
+    'row-cover': 'Row Cover',
+    'low-tunnel': 'Low Tunnel',
+    'cold-frame': 'Cold Frame',
+    'high-tunnel': 'High Tunnel',
+    'greenhouse': 'Greenhouse',
+}
+
+# Inner structures add protection at 65% efficiency
+INNER_PROTECTION_EFFICIENCY = 0.65
+
+# (outer_type, inner_type or None) -> (offset_degrees, label) for every known combination
+_PROTECTION_COMBOS = {
+    (outer, None): (outer_temp, PROTECTION_LABELS[outer])
+    for outer, outer_temp in PROTECTION_TEMPS.items()
+}
+_PROTECTION_COMBOS.update({
+    (outer, inner): (
+        round(outer_temp + inner_temp * INNER_PROTECTION_EFFICIENCY),
+        f"{PROTECTION_LABELS[outer]} + {PROTECTION_LABELS[inner]}"
+    )
+    for outer, outer_temp in PROTECTION_TEMPS.items()
+    for inner, inner_temp in PROTECTION_TEMPS.items()
+})
+
+# Shade cloth reduces effective air temperature by shade_factor * 0.2
+SHADE_CLOTH_TEMP_FACTOR = 0.2
+
+# Offsets and labels for the shade cloth percentages offered in the UI, keyed
+# by (type, value): 50.0 == 50, but its label reads "50.0% Shade Cloth"
+_SHADE_CLOTH_OFFSETS = {
+    (int, shade_factor): (round(shade_factor * SHADE_CLOTH_TEMP_FACTOR), f"{shade_factor}% Shade Cloth")
+    for shade_factor in (30, 50, 70)
+}
+
+
 def calculate_heat_protection_offset(season_ext: dict) -> tuple:
     """
     Calculate temperature reduction from shade cloth on a garden bed.
@@ -1402,9 +1474,10 @@ def calculate_heat_protection_offset(season_ext: dict) -> tuple:
     if shade_factor <= 0:
         return 0, None
 
-    offset = shade_factor * 0.2
-    label = f"{shade_factor}% Shade Cloth"
-    return round(offset), label
+    cached = _SHADE_CLOTH_OFFSETS.get((type(shade_factor), shade_factor))
+    if cached is not None:
+        return cached
+    return round(shade_factor * SHADE_CLOTH_TEMP_FACTOR), f"{shade_factor}% Shade Cloth"
 
 
 def calculate_protection_offset(protection_type: str, inner_type: str = None) -> tuple:
@@ -1416,43 +1489,77 @@ def calculate_protection_offset(protection_type: str, inner_type: str = None) ->
     Returns:
         Tuple of (offset_degrees, human_readable_type)
     """
-    # Base temperature boost (°F)
-    # Values based on extension service research and Coleman's data
-    PROTECTION_TEMPS = {
-        'row-cover': 4,      # Extension: 2-6°F, heavy up to 8°F
-        'low-tunnel': 6,     # Hoops with row cover: 4-8°F
-        'cold-frame': 10,    # Cold frame: 8-12°F on sunny days
-        'high-tunnel': 8,    # Single plastic: few degrees more than cover
-        'greenhouse': 10,    # Similar to cold frame
-    }
-
-    # Human-readable labels
-    PROTECTION_LABELS = {
-        'row-cover': 'Row Cover',
-        'low-tunnel': 'Low Tunnel',
-        'cold-frame': 'Cold Frame',
-        'high-tunnel': 'High Tunnel',
-        'greenhouse': 'Greenhouse',
-    }
-
     if not protection_type or protection_type == 'none':
         return 0, None
 
-    # Outer structure temperature
-    outer_temp = PROTECTION_TEMPS.get(protection_type, 6)
-    label = PROTECTION_LABELS.get(protection_type, protection_type)
-    total_offset = outer_temp
+    # Unknown or 'none' inner structures add nothing
+    inner_key = inner_type if inner_type in PROTECTION_TEMPS else None
+
+    combo = _PROTECTION_COMBOS.get((protection_type, inner_key))
+    if combo is not None:
+        return combo
 
-    # Inner structure at 65% efficiency (e.g., cold frame inside greenhouse)
-    if inner_type and inner_type != 'none' and inner_type in PROTECTION_TEMPS:
-        inner_temp = PROTECTION_TEMPS[inner_type]
-        total_offset += inner_temp * 0.65
-        inner_label = PROTECTION_LABELS.get(inner_type, inner_type)
-        label = f"{label} + {inner_label}"
+    # Unrecognized outer structure: assume a low-tunnel-level boost
+    total_offset = 6
+    label = protection_type
+    if inner_key:
+        total_offset += PROTECTION_TEMPS[inner_key] * INNER_PROTECTION_EFFICIENCY
+        label = f"{label} + {PROTECTION_LABELS[inner_key]}"
 
     return round(total_offset), label
 
 
+def _protection_from_season_extension(season_extension: str) -> tuple:
+    """
+    Parse a bed's season_extension JSON into a protection offset.
+
+    Returns:
+        Tuple of (offset_degrees, human_readable_type); (0, None) when the bed
+        has no protection or the JSON is unreadable.
+    """
+    if not season_extension:
+        return 0, None
+    try:
+        season_ext = json.loads(season_extension)
+        return calculate_protection_offset(season_ext.get('type'), season_ext.get('innerType'))
+    except (json.JSONDecodeError, TypeError):
+        return 0, None
+
+
+def cache_bed_protection(bed) -> None:
+    """
+    Store the bed's protection offset and label on the bed row.
+
+    Call whenever season_extension changes so validation can read the two
+    cached columns instead of parsing JSON on every request.
+    """
+    bed.protection_offset_cached, bed.protection_type_cached = (
+        _protection_from_season_extension(bed.season_extension)
+    )
+
+
+def _resolve_bed_protection(bed_id, user_id) -> tuple:
+    """
+    Look up the protection offset for one of the user's beds.
+
+    Reads the cached protection columns; beds saved before the cache existed
+    fall back to parsing season_extension.
+    """
+    if not bed_id:
+        return 0, None
+    row = db.session.query(
+        GardenBed.protection_offset_cached,
+        GardenBed.protection_type_cached,
+        GardenBed.season_extension,
+    ).filter_by(id=bed_id, user_id=user_id).one_or_none()
+    if row is None:
+        return 0, None
+    offset, protection_type, season_extension = row
+    if offset is not None:
+        return offset, protection_type
+    return _protection_from_season_extension(season_extension)
+
+
 @utilities_bp.route('/validate-planting', methods=['POST'])
 @login_required
 def validate_planting():
@@ -1469,14 +1576,11 @@ def validate_planting():
     if not plant_id or not planting_date_str:
         return jsonify({'error': 'plantId and plantingDate are required'}), 400
 
-    # Parse planting date
+    # Parse planting date: plain dates and ISO datetimes, including the 'Z'
+    # suffix from JavaScript, all go through fromisoformat
     try:
-        # Handle various date formats
-        if 'T' in planting_date_str:
-            planting_date = parse_iso_date(planting_date_str)
-        else:
-            planting_date = datetime.strptime(planting_date_str, '%Y-%m-%d')
-    except (ValueError, TypeError) as e:
+        planting_date = parse_iso_date(planting_date_str)
+    except (ValueError, TypeError, AttributeError) as e:
         return jsonify({'error': f'Invalid date format: {str(e)}'}), 400
 
     # Get frost dates from property/zone lookup (replaces hardcoded Settings fallback)
@@ -1486,21 +1590,7 @@ def validate_planting():
     frost_date_source = _frost['source']  # 'property' | 'zone' | 'zipcode' | 'default'
 
     # Calculate protection offset from bed's season extension
-    protection_offset = 0
-    protection_type = None
-
-    if bed_id:
-        bed = GardenBed.query.get(bed_id)
-        if bed and bed.season_extension:
-            try:
-                season_ext = json.loads(bed.season_extension)
-                ext_type = season_ext.get('type')
-                inner_type = season_ext.get('innerType')
-                protection_offset, protection_type = calculate_protection_offset(
-                    ext_type, inner_type
-                )
-            except (json.JSONDecodeError, TypeError):
-                pass
+    protection_offset, protection_type = _resolve_bed_protection(bed_id, current_user.id)
 
     # Validate planting conditions
     # Note: validate_planting_for_property() now generates suggestions internally
@@ -1524,202 +1614,285 @@ def validate_planting():
     return jsonify(result)
 
 
-@utilities_bp.route('/validate-plants-batch', methods=['POST'])
-@login_required
-def validate_plants_batch():
-    """
-    Validate multiple plants for a specific date in one request.
-    This is optimized for the plant palette to show which plants can be seeded/transplanted.
+# Background worker for weather fetches that don't touch the database, so
+# they can overlap with the rest of a batch validation request
+_batch_io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='batch-io')
 
-    Request Body:
-        {
-            'plantIds': ['tomato-1', 'cucumber-1', ...],
-            'plantingDate': '2026-02-03',
-            'zipcode': '53209',
-            'propertyId': 1,  # optional
-            'bedId': 1        # optional - for season extension protection
-        }
 
-    Returns:
-        {
-            'results': {
-                'tomato-1': {
-                    'seed': {'valid': bool, 'warnings': [...]},
-                    'transplant': {'valid': bool, 'warnings': [...]},
-                    'indoor_start': {'valid': bool, 'weeks_until_transplant': int, ...}
-                },
-                ...
-            },
-            'date': '2026-02-03',
-            'zipcode': '53209'
-        }
+def _cold_check_params(plant_data):
+    """Return (days_to_maturity, soil_temp_min) for the forward cold danger check."""
+    dtm_val = plant_data.get('daysToMaturity')
+    if dtm_val is None:
+        dtm_val = plant_data.get('days_to_maturity')
+    dtm = int(dtm_val) if dtm_val is not None else 60
+
+    soil_min_val = plant_data.get('soilTempMin')
+    if soil_min_val is None:
+        soil_min_val = plant_data.get('soil_temp_min')
+    soil_temp_min = float(soil_min_val) if soil_min_val is not None else 50
+
+    return dtm, soil_temp_min
+
+
+def _parse_plants_batch_request(data):
     """
-    data = request.json
+    Parse a plants batch validation body and resolve frost dates and bed protection.
 
+    Returns:
+        Tuple of (batch dict, None), or (None, error response) for bad input
+    """
     plant_ids = data.get('plantIds', [])
     planting_date_str = data.get('plantingDate')
     zipcode = data.get('zipcode')
-    property_id = data.get('propertyId')
-    bed_id = data.get('bedId')
 
     if not plant_ids or not planting_date_str:
-        return jsonify({'error': 'plantIds and plantingDate are required'}), 400
+        return None, (jsonify({'error': 'plantIds and plantingDate are required'}), 400)
 
-    # Parse planting date safely (handles 'Z' suffix from JavaScript)
+    # Parse planting date: plain dates and ISO datetimes, including the 'Z'
+    # suffix from JavaScript, all go through fromisoformat
     try:
-        if 'T' in planting_date_str:
-            planting_date = parse_iso_date(planting_date_str)
-        else:
-            planting_date = datetime.strptime(planting_date_str, '%Y-%m-%d')
-    except (ValueError, TypeError) as e:
-        return jsonify({'error': f'Invalid date format: {str(e)}'}), 400
+        planting_date = parse_iso_date(planting_date_str)
+    except (ValueError, TypeError, AttributeError) as e:
+        return None, (jsonify({'error': f'Invalid date format: {str(e)}'}), 400)
 
     # Get frost dates from property/zone lookup (replaces hardcoded Settings fallback)
-    _frost2 = get_frost_dates_for_user(current_user.id, zipcode=zipcode)
-    last_frost_str = _frost2['last_frost'].isoformat()
-    first_frost_str = _frost2['first_frost'].isoformat()
+    frost = get_frost_dates_for_user(current_user.id, zipcode=zipcode)
 
     # Calculate protection offset from bed's season extension
-    protection_offset = 0
-    protection_type = None
+    protection_offset, protection_type = _resolve_bed_protection(data.get('bedId'), current_user.id)
+
+    return {
+        'plant_ids': plant_ids,
+        'planting_date_str': planting_date_str,
+        'planting_date': planting_date,
+        'zipcode': zipcode,
+        'property_id': data.get('propertyId'),
+        'frost': frost,
+        'last_frost_str': frost['last_frost'].isoformat(),
+        'first_frost_str': frost['first_frost'].isoformat(),
+        'protection_offset': protection_offset,
+        'protection_type': protection_type,
+    }, None
+
+
+def _season_validation_kwargs(batch):
+    """Keyword arguments shared by the season_validator batch entry points."""
+    return dict(
+        plant_ids=batch['plant_ids'],
+        planting_date=batch['planting_date'],
+        property_id=batch['property_id'],
+        zipcode=batch['zipcode'],
+        last_frost_str=batch['last_frost_str'],
+        first_frost_str=batch['first_frost_str'],
+        protection_offset=batch['protection_offset'],
+        protection_type=batch['protection_type'],
+    )
 
-    if bed_id:
-        bed = GardenBed.query.get(bed_id)
-        if bed and bed.season_extension:
-            try:
-                season_ext = json.loads(bed.season_extension)
-                ext_type = season_ext.get('type')
-                inner_type = season_ext.get('innerType')
-                protection_offset, protection_type = calculate_protection_offset(
-                    ext_type, inner_type
-                )
-            except (json.JSONDecodeError, TypeError):
-                pass
+
+def _batch_metadata(batch):
+    """Request echo and frost date metadata returned alongside batch results."""
+    return {
+        'date': batch['planting_date_str'],
+        'zipcode': batch['zipcode'],
+        'frostDateSource': batch['frost']['source'],
+        'lastFrostDate': batch['last_frost_str'],
+        'firstFrostDate': batch['first_frost_str'],
+    }
+
+
+def _prepare_plant_validations(batch):
+    """
+    Do all location, weather and season validation work for a batch up front.
+
+    The returned context is everything _validate_one() needs, so per-plant
+    results can be produced without further I/O or database access.
+    """
+    zipcode = batch['zipcode']
+    planting_date = batch['planting_date']
 
     # Resolve lat/lon once for forward-looking cold danger checks
     batch_lat = None
     batch_lon = None
     if zipcode:
         try:
-            geo_result = geocoding_service.validate_address(zipcode)
-            if geo_result:
-                batch_lat = geo_result['latitude']
-                batch_lon = geo_result['longitude']
+            coords = geocoding_service.get_zipcode_coordinates(zipcode)
+            if coords:
+                batch_lat, batch_lon = coords
         except Exception as e:
             logger.warning(f"Batch geocoding failed for zipcode {zipcode}: {e}")
 
-    # Validate each plant for both seeding and transplanting
-    results = {}
+    # Resolve plant data once for the whole batch
+    plants_map = get_plants_by_ids(batch['plant_ids'])
+    planting_day = planting_date.date() if hasattr(planting_date, 'date') else planting_date
+
+    # Start fetching historical minimum air temps for the forward-looking cold
+    # danger checks in the background, spanning the longest growing period in
+    # the batch, so the weather request overlaps the soil temperature lookups
+    cold_future = None
+    if batch_lat is not None and batch_lon is not None and plants_map:
+        try:
+            max_days = max(_cold_check_params(p)[0] for p in plants_map.values())
+            cold_future = _batch_io_executor.submit(
+                fetch_historical_cold_window,
+                batch_lat, batch_lon, planting_day, min(max_days, MAX_COLD_CHECK_DAYS)
+            )
+        except Exception as e:
+            logger.warning(f"Historical cold window fetch failed for zipcode {zipcode}: {e}")
+
+    # Validate all plants for both seeding and transplanting; location, frost
+    # dates and soil temperature are resolved once and shared by both methods
+    method_results = validate_planting_for_property_both_methods(**_season_validation_kwargs(batch))
 
-    for plant_id in plant_ids:
-        plant_results = {
-            'seed': {'valid': True, 'warnings': []},
-            'transplant': {'valid': True, 'warnings': []},
-            'indoor_start': {'valid': False, 'weeks_until_transplant': None}
+    cold_window = None
+    if cold_future is not None:
+        try:
+            cold_window = cold_future.result()
+        except Exception as e:
+            logger.warning(f"Historical cold window fetch failed for zipcode {zipcode}: {e}")
+
+    return {
+        'plants_map': plants_map,
+        'planting_day': planting_day,
+        'last_frost_date': batch['frost']['last_frost'],
+        'seed_results': method_results['seed'],
+        'transplant_results': method_results['transplant'],
+        'cold_window': cold_window,
+    }
+
+
+@dataclass(slots=True)
+class _PlantValidation:
+    """One plant's batch validation result, converted to JSON shape once at the end."""
+    seed: dict
+    transplant: dict
+    indoor_start_valid: bool = False
+    weeks_until_transplant: Optional[int] = None
+    transplant_target_date: Optional[str] = None
+
+    def to_dict(self):
+        indoor_start = {
+            'valid': self.indoor_start_valid,
+            'weeks_until_transplant': self.weeks_until_transplant,
         }
+        if self.transplant_target_date is not None:
+            indoor_start['transplant_target_date'] = self.transplant_target_date
+        return {'seed': self.seed, 'transplant': self.transplant, 'indoor_start': indoor_start}
+
+
+def _validate_one(plant_id, ctx):
+    """Assemble one plant's seed, transplant and indoor start results."""
+    plant_data = ctx['plants_map'].get(plant_id)
+    planting_day = ctx['planting_day']
+    validation = _PlantValidation(
+        seed=ctx['seed_results'][plant_id],
+        transplant=ctx['transplant_results'][plant_id],
+    )
 
-        # Validate for direct seeding
-        seed_result = validate_planting_for_property(
-            plant_id=plant_id,
-            planting_date=planting_date,
-            property_id=property_id,
-            zipcode=zipcode,
-            last_frost_str=last_frost_str,
-            first_frost_str=first_frost_str,
-            protection_offset=protection_offset,
-            protection_type=protection_type,
-            planting_method='seed'
-        )
-        plant_results['seed'] = seed_result
+    # Forward-looking cold danger check (historical cold snaps during growing period)
+    if ctx['cold_window'] is not None and plant_data:
+        try:
+            dtm, soil_temp_min = _cold_check_params(plant_data)
+            is_safe, cold_warning, cold_details = check_future_cold_danger_with_data(
+                plant_id=plant_id,
+                planting_date=planting_day,
+                window=ctx['cold_window'],
+                current_soil_temp=soil_temp_min,
+                days_to_maturity=dtm
+            )
 
-        # Validate for transplanting
-        transplant_result = validate_planting_for_property(
-            plant_id=plant_id,
-            planting_date=planting_date,
-            property_id=property_id,
-            zipcode=zipcode,
-            last_frost_str=last_frost_str,
-            first_frost_str=first_frost_str,
-            protection_offset=protection_offset,
-            protection_type=protection_type,
-            planting_method='transplant'
-        )
-        plant_results['transplant'] = transplant_result
+            if not is_safe and cold_warning:
+                cold_warn_entry = {
+                    'type': 'future_cold_danger',
+                    'message': cold_warning,
+                    'severity': 'warning'
+                }
+                # Append to seed warnings
+                if isinstance(validation.seed.get('warnings'), list):
+                    validation.seed['warnings'].append(cold_warn_entry)
+                # Append to transplant warnings
+                if isinstance(validation.transplant.get('warnings'), list):
+                    validation.transplant['warnings'].append(cold_warn_entry)
+        except Exception as e:
+            logger.warning(f"Forward cold check failed for {plant_id}: {e}")
 
-        # Forward-looking cold danger check (historical cold snaps during growing period)
-        if batch_lat is not None and batch_lon is not None:
-            try:
-                plant_data_cold = get_plant_by_id(plant_id)
-                if plant_data_cold:
-                    dtm_val = plant_data_cold.get('daysToMaturity')
-                    if dtm_val is None:
-                        dtm_val = plant_data_cold.get('days_to_maturity')
-                    dtm = int(dtm_val) if dtm_val is not None else 60
-
-                    soil_min_val = plant_data_cold.get('soilTempMin')
-                    if soil_min_val is None:
-                        soil_min_val = plant_data_cold.get('soil_temp_min')
-                    soil_temp_min = float(soil_min_val) if soil_min_val is not None else 50
-
-                    is_safe, cold_warning, cold_details = check_future_cold_danger(
-                        plant_id=plant_id,
-                        planting_date=planting_date.date() if hasattr(planting_date, 'date') else planting_date,
-                        latitude=batch_lat,
-                        longitude=batch_lon,
-                        current_soil_temp=float(soil_temp_min),
-                        days_to_maturity=int(dtm)
-                    )
+    # Check if can start seeds indoors now for future transplanting
+    if plant_data and plant_data.get('weeksIndoors'):
+        weeks_indoors = plant_data['weeksIndoors']
+        transplant_weeks_before = plant_data.get('transplantWeeksBefore', 0)
 
-                    if not is_safe and cold_warning:
-                        cold_warn_entry = {
-                            'type': 'future_cold_danger',
-                            'message': cold_warning,
-                            'severity': 'warning'
-                        }
-                        # Append to seed warnings
-                        if isinstance(plant_results['seed'].get('warnings'), list):
-                            plant_results['seed']['warnings'].append(cold_warn_entry)
-                        # Append to transplant warnings
-                        if isinstance(plant_results['transplant'].get('warnings'), list):
-                            plant_results['transplant']['warnings'].append(cold_warn_entry)
-            except Exception as e:
-                logger.warning(f"Forward cold check failed for {plant_id}: {e}")
+        # Calculate when to transplant (weeks_before is relative to last frost)
+        try:
+            transplant_target_date = ctx['last_frost_date'] + timedelta(weeks=transplant_weeks_before)
 
-        # Check if can start seeds indoors now for future transplanting
-        plant_data = get_plant_by_id(plant_id)
-        if plant_data and plant_data.get('weeksIndoors'):
-            weeks_indoors = plant_data['weeksIndoors']
-            transplant_weeks_before = plant_data.get('transplantWeeksBefore', 0)
+            # Calculate when to start seeds indoors
+            indoor_start_date = transplant_target_date - timedelta(weeks=weeks_indoors)
 
-            # Calculate when to transplant (weeks_before is relative to last frost)
-            try:
-                last_frost_date = datetime.strptime(last_frost_str, '%Y-%m-%d')
-                transplant_target_date = last_frost_date + timedelta(weeks=transplant_weeks_before)
+            # Check if today is a good time to start seeds indoors
+            days_until_start = (indoor_start_date - planting_day).days
 
-                # Calculate when to start seeds indoors
-                indoor_start_date = transplant_target_date - timedelta(weeks=weeks_indoors)
+            # If within 2 weeks of ideal indoor start time, mark as valid
+            if -14 <= days_until_start <= 14:
+                validation.indoor_start_valid = True
+                validation.weeks_until_transplant = weeks_indoors
+                validation.transplant_target_date = transplant_target_date.strftime('%Y-%m-%d')
+        except (ValueError, TypeError):
+            pass
 
-                # Check if today is a good time to start seeds indoors
-                days_until_start = (indoor_start_date.date() - planting_date.date()).days
+    return validation
 
-                # If within 2 weeks of ideal indoor start time, mark as valid
-                if -14 <= days_until_start <= 14:
-                    plant_results['indoor_start']['valid'] = True
-                    plant_results['indoor_start']['weeks_until_transplant'] = weeks_indoors
-                    plant_results['indoor_start']['transplant_target_date'] = transplant_target_date.strftime('%Y-%m-%d')
-            except (ValueError, TypeError):
-                pass
 
-        results[plant_id] = plant_results
+@utilities_bp.route('/validate-plants-batch', methods=['POST'])
+@login_required
+def validate_plants_batch():
+    """
+    Validate multiple plants for a specific date in one request.
+    This is optimized for the plant palette to show which plants can be seeded/transplanted.
 
-    return jsonify({
-        'results': results,
-        'date': planting_date_str,
-        'zipcode': zipcode,
-        'frostDateSource': _frost2['source'],
-        'lastFrostDate': last_frost_str,
-        'firstFrostDate': first_frost_str,
-    })
+    Request Body:
+        {
+            'plantIds': ['tomato-1', 'cucumber-1', ...],
+            'plantingDate': '2026-02-03',
+            'zipcode': '53209',
+            'propertyId': 1,  # optional
+            'bedId': 1        # optional - for season extension protection
+        }
+
+    Returns:
+        {
+            'results': {
+                'tomato-1': {
+                    'seed': {'valid': bool, 'warnings': [...]},
+                    'transplant': {'valid': bool, 'warnings': [...]},
+                    'indoor_start': {'valid': bool, 'weeks_until_transplant': int, ...}
+                },
+                ...
+            },
+            'date': '2026-02-03',
+            'zipcode': '53209'
+        }
+
+    Query Params:
+        minimal=1: Return only validity booleans, skipping warnings, date
+            suggestions, cold danger and indoor start checks:
+            'results': {'tomato-1': {'seed': bool, 'transplant': bool}, ...}
+    """
+    minimal = request.args.get('minimal', '0').lower() in ('1', 'true')
+
+    batch, error = _parse_plants_batch_request(request.json)
+    if error:
+        return error
+
+    if minimal:
+        validity = validate_planting_validity_both_methods(**_season_validation_kwargs(batch))
+        return jsonify({'results': validity, **_batch_metadata(batch)})
+
+    ctx = _prepare_plant_validations(batch)
+    results = {
+        plant_id: _validate_one(plant_id, ctx).to_dict()
+        for plant_id in dict.fromkeys(batch['plant_ids'])
+    }
+
+    return jsonify({'results': results, **_batch_metadata(batch)})
 
 
 @utilities_bp.route('/validate-planting-date', methods=['POST'])
@@ -1773,12 +1946,11 @@ def validate_planting_date_api():
 
         # Geocode zipcode
         try:
-            geo_result = geocoding_service.validate_address(data['zipcode'])
-            if not geo_result:
+            coords = geocoding_service.get_zipcode_coordinates(data['zipcode'])
+            if not coords:
                 return jsonify({'error': 'Could not geocode zipcode'}), 400
 
-            latitude = geo_result['latitude']
-            longitude = geo_result['longitude']
+            latitude, longitude = coords
         except Exception as e:
             return jsonify({'error': f'Geocoding error: {str(e)}'}), 500
 
@@ -7,11 +7,57 @@ and time ranges.
 
 Phase 2: Space Awareness - Timeline Planting Feature
 """
+import functools
+import logging
 import math
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any, Tuple
-from plant_database import get_plant_by_id
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Dict, Optional, Any, Tuple, Union
+
+import numpy as np
+
+from plant_database import PLANT_DATABASE, get_plant_by_id, get_plants_by_ids
 from migardener_spacing import get_migardener_spacing
+from utils.conflict_kernel import NUMBA_AVAILABLE, find_conflict_matrix, find_conflicts
+
+logger = logging.getLogger(__name__)
+
+# Day ordinal stored for events missing a date, so the kernel never matches them
+_NO_START = np.iinfo(np.int32).max
+_NO_END = np.iinfo(np.int32).min
+
+# Grid positions and footprints below this magnitude are stored as int16: a
+# difference of two such values cannot overflow, and narrow lanes let NumPy
+# test more events per SIMD register
+_COMPACT_LIMIT = 2 ** 14
+
+
+# BedIndex query strategy thresholds (measured with timeit on random beds):
+# beds smaller than this are scanned in plain Python. Otherwise the events
+# in the neighbouring grid buckets are scanned unless the vectorized pass is
+# cheaper; in units of one event in that pass, scanning an event in Python
+# costs _WINDOW_SCAN_COST and the pass itself _VECTOR_CALL_COST on top
+_LINEAR_SCAN_MAX = 16
+_WINDOW_SCAN_COST = 30
+_VECTOR_CALL_COST = 4500
+# The vectorized path tests dates first when fewer than this fraction of
+# the bed's events start in the date range (e.g. years of past plantings)
+_TEMPORAL_FIRST_RATIO = 0.1
+
+
+def _compact_array(values: List[Any]) -> np.ndarray:
+    """int16 array when every value is an integer below _COMPACT_LIMIT, else NumPy's default dtype."""
+    arr = np.array(values)
+    if arr.dtype.kind in 'iu' and (arr.size == 0 or np.abs(arr).max() < _COMPACT_LIMIT):
+        return arr.astype(np.int16)
+    return arr
+
+
+def _compact_scalar(value: Any) -> Any:
+    """A query value safe to combine with _compact_array() output without overflow."""
+    if isinstance(value, (int, np.integer)) and -_COMPACT_LIMIT < value < _COMPACT_LIMIT:
+        return value
+    return float(value)
 
 
 def check_spatial_overlap(
@@ -38,22 +84,45 @@ def check_spatial_overlap(
     Returns:
         True if plantings overlap spatially, False otherwise
     """
-    # Calculate how many grid cells each plant occupies
-    cells_a = math.ceil(plant_a_spacing / bed_grid_size)
-    cells_b = math.ceil(plant_b_spacing / bed_grid_size)
-
-    # Chebyshev distance: max of absolute differences
-    distance = max(
-        abs(event_a_pos[0] - event_b_pos[0]),
-        abs(event_a_pos[1] - event_b_pos[1])
-    )
+    # Calculate how many grid cells each plant occupies (integer-division
+    # ceiling, as in _cells())
+    cells_a = int(-(-plant_a_spacing // bed_grid_size))
+    cells_b = int(-(-plant_b_spacing // bed_grid_size))
 
     # Required spacing is the larger of the two plants
     # (conservative approach - ensures both have enough space)
-    required_distance = max(cells_a, cells_b)
+    return check_spatial_overlap_cells(event_a_pos, event_b_pos,
+                                       cells_a if cells_a > cells_b else cells_b)
+
+
+def check_spatial_overlap_cells(
+    event_a_pos: tuple,
+    event_b_pos: tuple,
+    required_cells: int
+) -> bool:
+    """
+    check_spatial_overlap() for callers that already know the required
+    distance in grid cells (the larger of the two plants' footprints).
+
+    Args:
+        event_a_pos: Tuple of (x, y) grid coordinates for event A
+        event_b_pos: Tuple of (x, y) grid coordinates for event B
+        required_cells: Minimum Chebyshev distance, in cells, that avoids overlap
+
+    Returns:
+        True if plantings overlap spatially, False otherwise
+    """
+    # Chebyshev distance: max of absolute differences. Written out rather
+    # than with max()/abs(), which cost a builtin call each on this hot path
+    dx = event_a_pos[0] - event_b_pos[0]
+    if dx < 0:
+        dx = -dx
+    dy = event_a_pos[1] - event_b_pos[1]
+    if dy < 0:
+        dy = -dy
 
     # Conflict if distance is less than required
-    return distance < required_distance
+    return (dx if dx > dy else dy) < required_cells
 
 
 def check_temporal_overlap(
@@ -66,8 +135,12 @@ def check_temporal_overlap(
     Check if two planting events occupy the same timeframe.
 
     Two date ranges overlap if:
-    - The start of A is before or at the end of B, AND
-    - The start of B is before or at the end of A
+    - The start of A is before the end of B, AND
+    - The start of B is before the end of A
+
+    Dates are compared as whole days (aware values in UTC), so a planting
+    that goes in on the day another is harvested is not a conflict, and
+    timezone-aware request dates compare cleanly with naive stored dates.
 
     Args:
         event_a_start: Start date of event A (transplant or direct seed date)
@@ -78,24 +151,19 @@ def check_temporal_overlap(
     Returns:
         True if time ranges overlap, False otherwise
     """
-    if not all([event_a_start, event_a_end, event_b_start, event_b_end]):
+    if not (event_a_start and event_a_end and event_b_start and event_b_end):
         # Can't determine overlap without all dates
         return False
 
-    # Convert to comparable format if needed
-    if isinstance(event_a_start, str):
-        event_a_start = datetime.fromisoformat(event_a_start.replace('Z', '+00:00'))
-    if isinstance(event_a_end, str):
-        event_a_end = datetime.fromisoformat(event_a_end.replace('Z', '+00:00'))
-    if isinstance(event_b_start, str):
-        event_b_start = datetime.fromisoformat(event_b_start.replace('Z', '+00:00'))
-    if isinstance(event_b_end, str):
-        event_b_end = datetime.fromisoformat(event_b_end.replace('Z', '+00:00'))
-
     # Ranges overlap if: start_a < end_b AND start_b < end_a
     # Uses strict inequality so that sequential plantings (harvest day == plant day)
     # are NOT treated as conflicts — the old plant is removed and space is free.
-    return event_a_start < event_b_end and event_b_start < event_a_end
+    # ISO strings are still accepted here; internal callers parse dates
+    # once per event (_as_view) and compare day ordinals directly
+    return _ranges_overlap(
+        _day_ordinal(_parse_date(event_a_start)), _day_ordinal(_parse_date(event_a_end)),
+        _day_ordinal(_parse_date(event_b_start)), _day_ordinal(_parse_date(event_b_end))
+    )
 
 
 def check_sun_exposure_compatibility(
@@ -180,6 +248,49 @@ def check_sun_exposure_compatibility(
     }
 
 
+@dataclass(slots=True)
+class ConflictEvent:
+    """
+    Event with the PlantingEvent attributes has_conflict() reads, for
+    PlantedItems (planted_item_to_event), not-yet-saved plantings and event
+    dicts (_coerce_event).
+    """
+    id: Optional[int]
+    position_x: Any
+    position_y: Any
+    garden_bed_id: Any
+    plant_id: str
+    variety: Optional[str] = None
+    transplant_date: Any = None
+    direct_seed_date: Any = None
+    seed_start_date: Any = None
+    expected_harvest_date: Any = None
+
+
+def _coerce_event(event: Any) -> Any:
+    """
+    ConflictEvent for an event dict with camelCase keys; any other event is
+    returned as is.
+
+    The public entry points call this once per event, so the helpers behind
+    them read snake_case attributes only.
+    """
+    if not isinstance(event, dict):
+        return event
+    return ConflictEvent(
+        id=event.get('id'),
+        position_x=event.get('positionX'),
+        position_y=event.get('positionY'),
+        garden_bed_id=event.get('gardenBedId'),
+        plant_id=event.get('plantId'),
+        variety=event.get('variety'),
+        transplant_date=event.get('transplantDate'),
+        direct_seed_date=event.get('directSeedDate'),
+        seed_start_date=event.get('seedStartDate'),
+        expected_harvest_date=event.get('expectedHarvestDate'),
+    )
+
+
 def get_in_ground_date(event: Any) -> Optional[datetime]:
     """
     Get the date when a plant starts occupying garden bed space.
@@ -197,10 +308,8 @@ def get_in_ground_date(event: Any) -> Optional[datetime]:
     Returns:
         In-ground start date or None
     """
-    if hasattr(event, 'transplant_date'):
-        return event.transplant_date or event.direct_seed_date
-    else:
-        return event.get('transplantDate') or event.get('directSeedDate')
+    event = _coerce_event(event)
+    return event.transplant_date or event.direct_seed_date
 
 
 def get_primary_planting_date(event: Any) -> Optional[datetime]:
@@ -218,15 +327,554 @@ def get_primary_planting_date(event: Any) -> Optional[datetime]:
     Returns:
         Primary planting date or None
     """
-    if hasattr(event, 'transplant_date'):
-        return event.transplant_date or event.direct_seed_date or event.seed_start_date
+    event = _coerce_event(event)
+    return event.transplant_date or event.direct_seed_date or event.seed_start_date
+
+
+def _bed_settings(garden_bed: Any) -> Tuple[int, Optional[str]]:
+    """Return (grid_size, planning_method) for a GardenBed object or dict."""
+    if hasattr(garden_bed, 'grid_size'):
+        return garden_bed.grid_size, getattr(garden_bed, 'planning_method', None)
+    return garden_bed.get('gridSize', 12), garden_bed.get('planningMethod')
+
+
+def _bed_spacing(plant_id: str, plant: Dict[str, Any], grid_size: int,
+                 planning_method: Optional[str]) -> float:
+    """
+    Spacing in inches a plant needs in a bed using the given planning method.
+    """
+    spacing = plant.get('spacing', 12)  # Default 12" if not specified
+
+    # Use method-specific spacing for MIGardener beds
+    if planning_method == 'migardener':
+        _, spacing = get_migardener_spacing(plant_id, spacing, plant.get('rowSpacing'))
+
+    # SFG: each cell is an independent growing unit.
+    # Spacing determines density within a cell, not multi-cell exclusion.
+    if planning_method == 'square-foot':
+        spacing = min(spacing, grid_size)
+
+    return spacing
+
+
+# (plant_id, grid_size, planning_method) -> effective spacing in inches
+_plant_spacing_cache: Dict[Tuple[str, int, Optional[str]], float] = {}
+
+
+def _spacing(plant_id: str, plant: Dict[str, Any], grid_size: int,
+             planning_method: Optional[str]) -> float:
+    """Memoized _bed_spacing(); plant data is static for the life of the process."""
+    key = (plant_id, grid_size, planning_method)
+    try:
+        return _plant_spacing_cache[key]
+    except KeyError:
+        spacing = _plant_spacing_cache[key] = _bed_spacing(plant_id, plant, grid_size, planning_method)
+        return spacing
+
+
+@functools.lru_cache(maxsize=4096)
+def _cells(plant_id: str, grid_size: int, planning_method: Optional[str]) -> int:
+    """
+    Number of grid cells a plant's spacing covers in a bed configuration
+    (0 for unknown plants), i.e. ceil(spacing / grid_size).
+    """
+    plant = get_plant_by_id(plant_id)
+    if not plant:
+        return 0
+    # Integer-division ceiling avoids a float round trip through math.ceil
+    return int(-(-_spacing(plant_id, plant, grid_size, planning_method) // grid_size))
+
+
+@functools.lru_cache(maxsize=64)
+def _max_cells(grid_size: int, planning_method: Optional[str]) -> int:
+    """Largest footprint, in cells, of any plant in a bed configuration."""
+    return max((_cells(plant['id'], grid_size, planning_method) for plant in PLANT_DATABASE),
+               default=0)
+
+
+@functools.lru_cache(maxsize=1)
+def _max_days_to_maturity() -> int:
+    return max((plant.get('daysToMaturity', 60) for plant in PLANT_DATABASE), default=60)
+
+
+def clear_spacing_cache():
+    """Drop memoized plant spacings (e.g. after the plant database is reloaded)."""
+    _plant_spacing_cache.clear()
+    _cells.cache_clear()
+    _max_cells.cache_clear()
+    _max_days_to_maturity.cache_clear()
+
+
+def _day_ordinal(value: Any) -> Optional[int]:
+    """
+    Proleptic Gregorian day number of a date or datetime (UTC for aware
+    values). Strings must already have been parsed (_parse_date).
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.toordinal()
+
+
+def _ranges_overlap(a_start: int, a_end: int, b_start: int, b_end: int) -> bool:
+    """check_temporal_overlap() for day ordinals that are known to be present."""
+    return a_start < b_end and b_start < a_end
+
+
+def _parse_date(value: Any) -> Any:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value
+
+
+class _EventView:
+    """
+    Snapshot of a PlantingEvent (or lookalike such as ConflictEvent).
+
+    Built once per event by _as_view(), so date parsing happens once instead
+    of on every field access in the hot loop.
+    plant and cells are filled in by BedIndex when the event is registered.
+
+    A plain __slots__ class rather than a dataclass: _as_view() assigns the
+    fields directly, which measured about 40% faster per event than calling
+    a generated __init__.
+    """
+    __slots__ = ('event', 'id', 'x', 'y', 'bed_id', 'plant_id', 'variety',
+                 'start', 'end', 'start_day', 'end_day', 'plant', 'cells')
+
+
+def _as_view(event: Any) -> _EventView:
+    """
+    Build an _EventView for an event object (dicts go through _coerce_event()
+    first).
+
+    start/end are the in-ground start (transplant, else direct seed date - see
+    get_in_ground_date) and expected harvest date with ISO strings parsed;
+    start_day/end_day are their day ordinals (None when a date is missing).
+    """
+    view = _EventView()
+    view.event = event
+    view.id = getattr(event, 'id', None)
+    view.x = event.position_x
+    view.y = event.position_y
+    view.bed_id = event.garden_bed_id
+    view.plant_id = event.plant_id
+    view.variety = getattr(event, 'variety', None)
+    start = event.transplant_date or event.direct_seed_date
+    end = event.expected_harvest_date
+
+    view.start = _parse_date(start)
+    view.end = _parse_date(end)
+    view.start_day = _day_ordinal(view.start)
+    view.end_day = _day_ordinal(view.end)
+    view.plant = None
+    view.cells = 0
+    return view
+
+
+class BedIndex:
+    """
+    Spatial and temporal index of the positioned events in one garden bed.
+
+    Three strategies answer a query, picked by bed size and crowding:
+
+    - Tiny beds are scanned in plain Python (NumPy's per-call overhead
+      dominates below _LINEAR_SCAN_MAX events).
+    - Events are bucketed on a grid whose squares are exactly as wide as
+      the search reach, so every event that can overlap the new planting is
+      in the 3x3 buckets around it. Fractional positions need no extra
+      cell: overlap needs a distance below the reach, so floored
+      coordinates fall in the same or an adjacent bucket. Unless those
+      buckets hold enough events for a whole-bed NumPy pass to be cheaper,
+      only they are tested.
+    - Otherwise the whole bed is tested at once by the numba kernel (or
+      the NumPy fallback if numba cannot be imported), with a
+      sorted copy of the in-ground days: bisecting it for events that start
+      by the new planting's last day (and at most max_span days before its
+      first) leaves only the events that can be in the ground at the same
+      time, whose ends are then checked directly. When those are a small
+      part of the bed, only they are tested for position, on either path.
+
+    Build one with build_bed_index() and pass it to has_conflict() in place
+    of the event list to reuse it across several checks in the same bed;
+    register_event() and unregister_event() keep it current, and footprints
+    are recomputed (configure()) if the bed's grid settings have changed.
+    """
+
+    def __init__(self, bed_id: Any, grid_size: int, planning_method: Optional[str]):
+        self.bed_id = bed_id
+        self.grid_size = grid_size
+        self.planning_method = planning_method
+        # Largest footprint (cells) and in-ground span (days) of the indexed
+        # events: they bound the spatial search reach and the date window
+        self.max_cells = 0
+        self.max_span = 0
+        # slot -> _EventView; slots keep insertion order
+        self._entries: Dict[int, _EventView] = {}
+        # Structure-of-arrays view of _entries, rebuilt lazily after changes
+        self._soa: Optional[Dict[str, np.ndarray]] = None
+        self._next_slot = 0
+        # Bucket width -> {(bx, by): [slot, ...]}, built lazily per reach
+        self._grids: Dict[int, Dict[Tuple[int, int], List[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def events(self) -> List[Any]:
+        """The indexed events, in registration order."""
+        return [view.event for view in self._entries.values()]
+
+    def configure(self, grid_size: int, planning_method: Optional[str]) -> bool:
+        """
+        Update the bed's grid size and planning method (e.g. after the bed
+        was edited), recomputing every event's footprint if either changed.
+
+        Returns True if the index was updated.
+        """
+        if grid_size == self.grid_size and planning_method == self.planning_method:
+            return False
+        self.grid_size = grid_size
+        self.planning_method = planning_method
+        self.max_cells = 0
+        for view in self._entries.values():
+            view.cells = _cells(view.plant_id, grid_size, planning_method)
+            self.max_cells = max(self.max_cells, view.cells)
+        self._soa = None
+        return True
+
+    def register_event(self, event: Any) -> bool:
+        """
+        Add an event to the index.
+
+        Returns False (and skips the event) if it has no position, belongs
+        to another bed, or references an unknown plant.
+        """
+        original = event
+        event = _coerce_event(event)
+        # Events in other beds are rejected before their dates are parsed
+        if event.garden_bed_id != self.bed_id:
+            return False
+        view = _as_view(event)
+        view.event = original
+        if view.x is None or view.y is None:
+            return False
+
+        view.plant = get_plant_by_id(view.plant_id)
+        if not view.plant:
+            return False
+
+        view.cells = _cells(view.plant_id, self.grid_size, self.planning_method)
+
+        slot = self._next_slot
+        self._next_slot += 1
+        self._entries[slot] = view
+        self._soa = None
+        self._grids.clear()
+        self.max_cells = max(self.max_cells, view.cells)
+        self.max_span = max(self.max_span, self._span(view))
+        return True
+
+    def unregister_event(self, event: Any) -> bool:
+        """Remove a previously registered event. Returns False if not found."""
+        for slot, view in self._entries.items():
+            if view.event is event:
+                del self._entries[slot]
+                self._soa = None
+                self._grids.clear()
+                if view.cells == self.max_cells or self._span(view) == self.max_span:
+                    # The event may have set a bound; shrink it back so the
+                    # search reach and date window stay tight
+                    self._refresh_bounds()
+                return True
+        return False
+
+    @staticmethod
+    def _span(view: _EventView) -> int:
+        if view.start_day is None or view.end_day is None:
+            return 0
+        return view.end_day - view.start_day
+
+    def _refresh_bounds(self):
+        """Recompute max_cells and max_span from the indexed events."""
+        views = self._entries.values()
+        self.max_cells = max((view.cells for view in views), default=0)
+        self.max_span = max((self._span(view) for view in views), default=0)
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        if self._soa is None:
+            views = self._entries.values()
+            soa = self._soa = {
+                'slots': np.fromiter(self._entries.keys(), dtype=np.int64, count=len(self._entries)),
+                'x': _compact_array([v.x for v in views]),
+                'y': _compact_array([v.y for v in views]),
+                'cells': _compact_array([v.cells for v in views]),
+                'start': np.array([_NO_START if v.start_day is None or v.end_day is None else v.start_day
+                                   for v in views], dtype=np.int32),
+                'end': np.array([_NO_END if v.start_day is None or v.end_day is None else v.end_day
+                                 for v in views], dtype=np.int32),
+            }
+            # Positions in start-day order; undated events (_NO_START) sort last
+            soa['start_order'] = np.argsort(soa['start'], kind='stable')
+            soa['start_sorted'] = soa['start'][soa['start_order']]
+        return self._soa
+
+    def _kernel_slots(self, x: float, y: float, cells: int,
+                      start_day: Optional[int], end_day: Optional[int],
+                      positions: Optional[np.ndarray] = None) -> np.ndarray:
+        # One fused pass (numba) instead of the NumPy temporaries below. With
+        # `positions` (already filtered by date) only those events are
+        # tested, for position alone
+        soa = self._arrays()
+        slots, xs, ys, footprints = soa['slots'], soa['x'], soa['y'], soa['cells']
+        starts, ends = soa['start'], soa['end']
+        if positions is not None:
+            slots, xs, ys, footprints = slots[positions], xs[positions], ys[positions], footprints[positions]
+            # Day arrays are not read without the date test; views of the
+            # right length avoid gathering them
+            starts, ends = starts[:len(positions)], ends[:len(positions)]
+            start_day = end_day = None
+        x, y, cells = _compact_scalar(x), _compact_scalar(y), _compact_scalar(cells)
+        check_dates = start_day is not None
+        mask = np.empty(len(slots), dtype=np.bool_)
+        find_conflicts(x, y, cells, start_day or 0, end_day or 0, check_dates,
+                       xs, ys, footprints, starts, ends, mask)
+        return slots[mask]
+
+    def _spatial_mask(self, x: float, y: float, cells: int,
+                      positions: Optional[np.ndarray] = None) -> np.ndarray:
+        # Chebyshev distance against every event (or those at `positions`)
+        # at once; the larger of the two footprints is the required distance
+        # (see check_spatial_overlap)
+        soa = self._arrays()
+        xs, ys, footprints = soa['x'], soa['y'], soa['cells']
+        if positions is not None:
+            xs, ys, footprints = xs[positions], ys[positions], footprints[positions]
+        x, y, cells = _compact_scalar(x), _compact_scalar(y), _compact_scalar(cells)
+        distance = np.maximum(np.abs(xs - x), np.abs(ys - y))
+        return distance < np.maximum(footprints, cells)
+
+    def _grid(self, width: int) -> Dict[Tuple[int, int], List[int]]:
+        grid = self._grids.get(width)
+        if grid is None:
+            grid = self._grids[width] = {}
+            for slot, view in self._entries.items():
+                key = (math.floor(view.x) // width, math.floor(view.y) // width)
+                grid.setdefault(key, []).append(slot)
+        return grid
+
+    def _window_slots(self, x: float, y: float, reach: int) -> List[int]:
+        # Slots in the 3x3 buckets of width `reach` around (x, y). Overlap
+        # needs a distance below reach, so floored coordinates differ by at
+        # most reach and land in the same or an adjacent bucket
+        grid = self._grid(reach)
+        bx, by = math.floor(x) // reach, math.floor(y) // reach
+        slots = []
+        for key in ((bx - 1, by - 1), (bx - 1, by), (bx - 1, by + 1),
+                    (bx, by - 1), (bx, by), (bx, by + 1),
+                    (bx + 1, by - 1), (bx + 1, by), (bx + 1, by + 1)):
+            bucket = grid.get(key)
+            if bucket:
+                slots.extend(bucket)
+        return slots
+
+    def _scan_slots(self, slots, x: float, y: float, cells: int,
+                    start_day: Optional[int], end_day: Optional[int]) -> List[int]:
+        # Scalar form of the find_conflicts() test for a handful of slots
+        entries = self._entries
+        hits = []
+        for slot in slots:
+            view = entries[slot]
+            dx = view.x - x
+            if dx < 0:
+                dx = -dx
+            dy = view.y - y
+            if dy < 0:
+                dy = -dy
+            if (dx if dx > dy else dy) >= (view.cells if view.cells > cells else cells):
+                continue
+            if start_day is not None and (
+                    view.start_day is None or view.end_day is None
+                    or view.start_day > end_day or view.end_day < start_day):
+                continue
+            hits.append(slot)
+        return hits
+
+    def _temporal_positions(self, start_day: int, end_day: int) -> np.ndarray:
+        # Only events starting by end_day can be in the ground in the range,
+        # and those starting more than max_span days before start_day have
+        # ended; the ends of what is left are checked directly
+        soa = self._arrays()
+        starts = soa['start_sorted']
+        # int32 keys, so the int32 array is not cast to int64 for the search
+        lo = np.searchsorted(starts, np.int32(start_day - self.max_span), side='left')
+        hi = np.searchsorted(starts, np.int32(end_day), side='right')
+        positions = soa['start_order'][lo:hi]
+        return positions[soa['end'][positions] >= start_day]
+
+    def _bed_slots(self, x: float, y: float, cells: int,
+                   start_day: Optional[int], end_day: Optional[int]) -> np.ndarray:
+        # Whole-bed test with the numba kernel, or the NumPy fallback;
+        # both test only the events in the ground when those are few
+        soa = self._arrays()
+        use_kernel = NUMBA_AVAILABLE
+        if start_day is None:
+            if use_kernel:
+                return self._kernel_slots(x, y, cells, None, None)
+            return soa['slots'][self._spatial_mask(x, y, cells)]
+
+        positions = self._temporal_positions(start_day, end_day)
+        if len(positions) < _TEMPORAL_FIRST_RATIO * len(soa['slots']):
+            # Few events in the ground at the time: test only those for
+            # position. Slots grow with position, so sorting the hits
+            # restores registration order
+            if use_kernel:
+                return np.sort(self._kernel_slots(x, y, cells, None, None, positions))
+            return np.sort(soa['slots'][positions[self._spatial_mask(x, y, cells, positions)]])
+
+        if use_kernel:
+            return self._kernel_slots(x, y, cells, start_day, end_day)
+        in_range = np.zeros(len(soa['slots']), dtype=np.bool_)
+        in_range[positions] = True
+        return soa['slots'][self._spatial_mask(x, y, cells) & in_range]
+
+    def candidates(self, x: float, y: float, cells: int,
+                   start_day: Optional[int] = None, end_day: Optional[int] = None):
+        """
+        Yield an _EventView for each event whose footprint overlaps a planting
+        at (x, y) covering `cells` cells, in registration order. Views carry
+        the dates parsed at registration and the event's plant data.
+
+        When start_day and end_day (day ordinals) are given, events that are
+        not in the ground on any day of that range are dropped too; if either
+        is missing nothing is yielded, since no temporal overlap can be
+        established. The date filter is inclusive: callers still apply the
+        strict rule of check_temporal_overlap() to each candidate.
+        """
+        if not self._entries:
+            return
+        if start_day is not None or end_day is not None:
+            if start_day is None or end_day is None:
+                return
+
+        reach = max(cells, self.max_cells)
+        if reach <= 0:
+            # Zero-spacing plantings never overlap anything
+            return
+
+        window = None
+        if len(self._entries) >= _LINEAR_SCAN_MAX:
+            window = self._window_slots(x, y, reach)
+
+        if window is None:
+            slots = self._scan_slots(self._entries, x, y, cells, start_day, end_day)
+        elif len(window) * _WINDOW_SCAN_COST < len(self._entries) + _VECTOR_CALL_COST:
+            slots = sorted(self._scan_slots(window, x, y, cells, start_day, end_day))
+        else:
+            slots = self._bed_slots(x, y, cells, start_day, end_day).tolist()
+
+        for slot in slots:
+            yield self._entries[slot]
+
+
+def _partition_by_bed(events: List[Any]) -> Dict[Any, List[Any]]:
+    """
+    Group events by garden bed id, preserving order within each bed, with
+    dicts coerced to ConflictEvents.
+
+    Reads only the bed id, so events in other beds are dropped before any
+    view building or date parsing is done for them.
+    """
+    by_bed: Dict[Any, List[Any]] = {}
+    for event in events:
+        event = _coerce_event(event)
+        by_bed.setdefault(event.garden_bed_id, []).append(event)
+    return by_bed
+
+
+def build_bed_index(events: List[Any], garden_bed: Any, bed_id: Any = None) -> BedIndex:
+    """
+    Build a BedIndex from existing events.
+
+    Args:
+        events: PlantingEvent objects or dicts (events in other beds are skipped)
+        garden_bed: GardenBed object or dict with grid_size and planning_method
+        bed_id: Bed the index covers (defaults to the garden bed's own id)
+
+    Returns:
+        BedIndex containing every positioned event of the bed
+    """
+    if bed_id is None:
+        bed_id = garden_bed.id if hasattr(garden_bed, 'id') else garden_bed.get('id')
+    grid_size, planning_method = _bed_settings(garden_bed)
+
+    index = BedIndex(bed_id, grid_size, planning_method)
+    for event in _partition_by_bed(events).get(bed_id, ()):
+        index.register_event(event)
+    return index
+
+
+def _iter_conflicts(new: _EventView, existing_events: Union[List[Any], BedIndex],
+                    garden_bed: Any):
+    """
+    Yield the _EventView of each existing event that conflicts with `new`.
+
+    `new` must have a position and a known plant.
+    """
+    # Without both in-ground dates no temporal overlap can be established
+    if new.start_day is None or new.end_day is None:
+        return
+
+    # Footprint honours MIGardener and square-foot bed spacing rules
+    grid_size, bed_planning_method = _bed_settings(garden_bed)
+    new_cells = _cells(new.plant_id, grid_size, bed_planning_method)
+
+    # Candidates already overlap the new planting spatially (the same rule as
+    # check_spatial_overlap) and are in the ground around its date range
+    if isinstance(existing_events, BedIndex):
+        index = existing_events
+        index.configure(grid_size, bed_planning_method)
     else:
-        return event.get('transplantDate') or event.get('directSeedDate') or event.get('seedStartDate')
+        index = build_bed_index(existing_events, garden_bed, new.bed_id)
+
+    new_id, new_start, new_end = new.id, new.start_day, new.end_day
+    for existing in index.candidates(new.x, new.y, new_cells, new_start, new_end):
+        # Skip if same event (when editing)
+        if new_id and existing.id == new_id:
+            continue
+
+        # Check temporal overlap (the strict rule of check_temporal_overlap,
+        # written out as _ranges_overlap() would cost a call per candidate)
+        if existing.start_day < new_end and new_start < existing.end_day:
+            yield existing
+
+
+def _iso_day(value: Any) -> str:
+    """YYYY-MM-DD for a date or datetime (date.isoformat() is much cheaper than strftime)."""
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.isoformat()
+
+
+def _conflict_details(existing: _EventView) -> Dict[str, Any]:
+    """Conflict entry reported by has_conflict() for a conflicting event."""
+    # Format dates for display
+    start_str = _iso_day(existing.start) if existing.start else 'Unknown'
+    end_str = _iso_day(existing.end) if existing.end else 'Unknown'
+
+    return {
+        'eventId': existing.id,
+        'plantName': existing.plant.get('name', 'Unknown'),
+        'variety': existing.variety,
+        'dates': f"{start_str} to {end_str}",
+        'position': {'x': existing.x, 'y': existing.y},
+        'type': 'both'  # Both spatial and temporal
+    }
 
 
 def has_conflict(
     new_event: Any,
-    existing_events: List[Any],
+    existing_events: Union[List[Any], BedIndex],
     garden_bed: Any
 ) -> Dict[str, Any]:
     """
@@ -243,7 +891,8 @@ def has_conflict(
 
     Args:
         new_event: PlantingEvent object or dict to check
-        existing_events: List of existing PlantingEvent objects or dicts
+        existing_events: List of existing PlantingEvent objects or dicts, or a
+            BedIndex built from them for the new event's bed
         garden_bed: GardenBed object or dict with grid_size and sun_exposure
 
     Returns:
@@ -252,38 +901,18 @@ def has_conflict(
             - conflicts (list): Details of conflicting events
             - sun_exposure_warning (dict): Sun exposure compatibility info (if applicable)
     """
-    # Extract position from new event
-    if hasattr(new_event, 'position_x'):
-        new_x = new_event.position_x
-        new_y = new_event.position_y
-        new_bed_id = new_event.garden_bed_id
-        new_id = getattr(new_event, 'id', None)
-    else:
-        new_x = new_event.get('positionX')
-        new_y = new_event.get('positionY')
-        new_bed_id = new_event.get('gardenBedId')
-        new_id = new_event.get('id')
+    new = _as_view(_coerce_event(new_event))
 
     # If no position data, no conflict possible
-    if new_x is None or new_y is None:
+    if new.x is None or new.y is None:
         return {
             'has_conflict': False,
             'conflicts': [],
             'type': None
         }
 
-    # Get grid size from bed
-    if hasattr(garden_bed, 'grid_size'):
-        grid_size = garden_bed.grid_size
-    else:
-        grid_size = garden_bed.get('gridSize', 12)
-
     # Get plant data for new event
-    if hasattr(new_event, 'plant_id'):
-        new_plant_id = new_event.plant_id
-    else:
-        new_plant_id = new_event.get('plantId')
-
+    new_plant_id = new.plant_id
     new_plant = get_plant_by_id(new_plant_id)
     if not new_plant:
         # Can't check conflicts without plant data
@@ -293,133 +922,13 @@ def has_conflict(
             'type': None
         }
 
-    new_plant_spacing = new_plant.get('spacing', 12)  # Default 12" if not specified
-
-    # Use method-specific spacing for MIGardener beds
-    if hasattr(garden_bed, 'planning_method'):
-        bed_planning_method = garden_bed.planning_method
-    else:
-        bed_planning_method = garden_bed.get('planningMethod')
-
-    if bed_planning_method == 'migardener':
-        mg = get_migardener_spacing(new_plant_id, new_plant_spacing, new_plant.get('rowSpacing'))
-        new_plant_spacing = mg['plant_spacing']
-
-    # SFG: each cell is an independent growing unit.
-    # Spacing determines density within a cell, not multi-cell exclusion.
-    if bed_planning_method == 'square-foot':
-        new_plant_spacing = min(new_plant_spacing, grid_size)
-
-    # Get date range for new event (use in-ground date, not indoor seed start)
-    if hasattr(new_event, 'expected_harvest_date'):
-        new_start = get_in_ground_date(new_event)
-        new_end = new_event.expected_harvest_date
-    else:
-        new_start = get_in_ground_date(new_event)
-        new_end = new_event.get('expectedHarvestDate')
-        if isinstance(new_end, str):
-            new_end = datetime.fromisoformat(new_end.replace('Z', '+00:00'))
-
-    conflicts = []
-
-    for existing in existing_events:
-        # Extract existing event data
-        if hasattr(existing, 'position_x'):
-            exist_x = existing.position_x
-            exist_y = existing.position_y
-            exist_bed_id = existing.garden_bed_id
-            exist_id = existing.id
-            exist_plant_id = existing.plant_id
-        else:
-            exist_x = existing.get('positionX')
-            exist_y = existing.get('positionY')
-            exist_bed_id = existing.get('gardenBedId')
-            exist_id = existing.get('id')
-            exist_plant_id = existing.get('plantId')
-
-        # Skip if no position data
-        if exist_x is None or exist_y is None:
-            continue
-
-        # Skip if different bed
-        if exist_bed_id != new_bed_id:
-            continue
-
-        # Skip if same event (when editing)
-        if new_id and exist_id == new_id:
-            continue
-
-        # Get existing plant data
-        exist_plant = get_plant_by_id(exist_plant_id)
-        if not exist_plant:
-            continue
-
-        exist_plant_spacing = exist_plant.get('spacing', 12)
-
-        # Use method-specific spacing for MIGardener beds
-        if bed_planning_method == 'migardener':
-            mg = get_migardener_spacing(exist_plant_id, exist_plant_spacing, exist_plant.get('rowSpacing'))
-            exist_plant_spacing = mg['plant_spacing']
-
-        # SFG: cap spacing to grid size (same-position conflicts only)
-        if bed_planning_method == 'square-foot':
-            exist_plant_spacing = min(exist_plant_spacing, grid_size)
-
-        # Check spatial overlap
-        spatial_conflict = check_spatial_overlap(
-            (new_x, new_y),
-            (exist_x, exist_y),
-            new_plant_spacing,
-            exist_plant_spacing,
-            grid_size
-        )
-
-        if spatial_conflict:
-            # Get existing event dates (use in-ground date, not indoor seed start)
-            if hasattr(existing, 'expected_harvest_date'):
-                exist_start = get_in_ground_date(existing)
-                exist_end = existing.expected_harvest_date
-            else:
-                exist_start = get_in_ground_date(existing)
-                exist_end = existing.get('expectedHarvestDate')
-                if isinstance(exist_end, str):
-                    exist_end = datetime.fromisoformat(exist_end.replace('Z', '+00:00'))
-
-            # Check temporal overlap
-            temporal_conflict = check_temporal_overlap(
-                new_start,
-                new_end,
-                exist_start,
-                exist_end
-            )
-
-            if temporal_conflict:
-                # Format dates for display
-                if hasattr(existing, 'variety'):
-                    variety = existing.variety
-                else:
-                    variety = existing.get('variety')
-
-                start_str = exist_start.strftime('%Y-%m-%d') if exist_start else 'Unknown'
-                end_str = exist_end.strftime('%Y-%m-%d') if exist_end else 'Unknown'
-
-                conflicts.append({
-                    'eventId': exist_id,
-                    'plantName': exist_plant.get('name', 'Unknown'),
-                    'variety': variety,
-                    'dates': f"{start_str} to {end_str}",
-                    'position': {'x': exist_x, 'y': exist_y},
-                    'type': 'both'  # Both spatial and temporal
-                })
+    conflicts = [
+        _conflict_details(existing)
+        for existing in _iter_conflicts(new, existing_events, garden_bed)
+    ]
 
     # Check sun exposure compatibility
-    bed_sun_exposure = None
-    if hasattr(garden_bed, 'sun_exposure'):
-        bed_sun_exposure = garden_bed.sun_exposure
-    elif isinstance(garden_bed, dict):
-        bed_sun_exposure = garden_bed.get('sunExposure')
-
-    sun_check = check_sun_exposure_compatibility(new_plant_id, bed_sun_exposure)
+    sun_check = check_sun_exposure_compatibility(new_plant_id, _bed_sun_exposure(garden_bed))
 
     result = {
         'has_conflict': len(conflicts) > 0,
@@ -433,12 +942,135 @@ def has_conflict(
     return result
 
 
-def planted_item_to_event(item):
+def _bed_sun_exposure(garden_bed: Any) -> Optional[str]:
+    if hasattr(garden_bed, 'sun_exposure'):
+        return garden_bed.sun_exposure
+    if isinstance(garden_bed, dict):
+        return garden_bed.get('sunExposure')
+    return None
+
+
+# has_conflicts_batch() evaluates at most this many new events per NumPy pass,
+# bounding the (rows x bed events) temporaries to a few MB
+_BATCH_ROWS = 256
+
+
+def _batch_conflict_pairs(new_views: List[_EventView], index: BedIndex):
+    """
+    Yield (row, existing _EventView) for every conflict between new_views and
+    the index, by row and then registration order.
+
+    Each block of rows is tested against the whole bed with (rows x events)
+    broadcasts (or the compiled numba kernel) using the same rules as
+    has_conflict(): Chebyshev distance below the larger footprint, strictly
+    overlapping day ranges, and not the same event.
+    """
+    if not new_views or not len(index):
+        return
+    soa = index._arrays()
+    ex, ey, ecells = soa['x'], soa['y'], soa['cells']
+    estart, eend = soa['start'], soa['end']
+    entries = index._entries
+
+    for first in range(0, len(new_views), _BATCH_ROWS):
+        block = new_views[first:first + _BATCH_ROWS]
+        valid = np.array([v.start_day is not None and v.end_day is not None for v in block])
+        nx = np.array([v.x for v in block], dtype=np.float64)
+        ny = np.array([v.y for v in block], dtype=np.float64)
+        ncells = np.array([
+            _cells(v.plant_id, index.grid_size, index.planning_method) for v in block
+        ], dtype=np.int64)
+        nstart = np.array([v.start_day if ok else 0 for v, ok in zip(block, valid)], dtype=np.int64)
+        nend = np.array([v.end_day if ok else 0 for v, ok in zip(block, valid)], dtype=np.int64)
+
+        if NUMBA_AVAILABLE:
+            mask = np.empty((len(block), len(ex)), dtype=np.bool_)
+            find_conflict_matrix(nx, ny, ncells, nstart, nend, valid,
+                                 ex, ey, ecells, estart, eend, mask)
+        else:
+            nx, ny, ncells = nx[:, None], ny[:, None], ncells[:, None]
+            nstart, nend = nstart[:, None], nend[:, None]
+            distance = np.maximum(np.abs(nx - ex), np.abs(ny - ey))
+            mask = distance < np.maximum(ncells, ecells)
+            mask &= (nstart < eend) & (estart < nend)
+            mask &= valid[:, None]
+
+        for row, col in np.argwhere(mask).tolist():
+            existing = entries[int(soa['slots'][col])]
+            new = block[row]
+            # Skip if same event (when editing)
+            if new.id and existing.id == new.id:
+                continue
+            yield first + row, existing
+
+
+def has_conflicts_batch(
+    new_events: List[Any],
+    existing_events: Union[List[Any], BedIndex],
+    garden_bed: Any
+) -> List[Dict[str, Any]]:
+    """
+    has_conflict() for many new events in the same bed (e.g. a CSV import).
+
+    Instead of one candidate search per new event, every new event is tested
+    against every existing event in a few vectorized passes. New events are
+    not checked against each other.
+
+    Args:
+        new_events: PlantingEvent objects or dicts to check
+        existing_events: List of existing PlantingEvent objects or dicts, or a
+            BedIndex built from them for the bed
+        garden_bed: GardenBed object or dict with id, grid_size and sun_exposure
+
+    Returns:
+        One has_conflict()-shaped result per new event, in order
+    """
+    views = [_as_view(_coerce_event(event)) for event in new_events]
+    results: List[Optional[Dict[str, Any]]] = [None] * len(views)
+    rows_by_bed: Dict[Any, List[int]] = {}
+    for i, view in enumerate(views):
+        if view.x is None or view.y is None or not get_plant_by_id(view.plant_id):
+            # No position or unknown plant: no conflict possible
+            results[i] = {'has_conflict': False, 'conflicts': [], 'type': None}
+        else:
+            rows_by_bed.setdefault(view.bed_id, []).append(i)
+
+    # Like has_conflict(), each new event is checked against the existing
+    # events of its own bed unless the caller passed a prebuilt index
+    conflicts: Dict[int, List[Dict[str, Any]]] = {}
+    if isinstance(existing_events, BedIndex):
+        by_bed = None
+        existing_events.configure(*_bed_settings(garden_bed))
+    else:
+        by_bed = _partition_by_bed(existing_events)
+    for bed_id, rows in rows_by_bed.items():
+        if by_bed is None:
+            index = existing_events
+        else:
+            index = build_bed_index(by_bed.get(bed_id, []), garden_bed, bed_id)
+        for i in rows:
+            conflicts[i] = []
+        for row, existing in _batch_conflict_pairs([views[i] for i in rows], index):
+            conflicts[rows[row]].append(_conflict_details(existing))
+
+    bed_sun_exposure = _bed_sun_exposure(garden_bed)
+    for i in sorted(conflicts):
+        result = {'has_conflict': bool(conflicts[i]), 'conflicts': conflicts[i]}
+        sun_check = check_sun_exposure_compatibility(views[i].plant_id, bed_sun_exposure)
+        if not sun_check['compatible']:
+            result['sun_exposure_warning'] = sun_check
+        results[i] = result
+    return results
+
+
+def planted_item_to_event(item, plants=None):
     """
     Convert a PlantedItem into a lightweight object with the attributes
     that has_conflict() expects (matching PlantingEvent's interface).
+
+    plants: optional {plant_id: plant} already resolved for a batch of items
     """
-    plant = get_plant_by_id(item.plant_id)
+    plant = plants.get(item.plant_id) if plants is not None else get_plant_by_id(item.plant_id)
     dtm = plant.get('daysToMaturity', 60) if plant else 60
     in_ground = item.transplant_date or item.planted_date
 
@@ -452,27 +1084,37 @@ def planted_item_to_event(item):
     else:
         end = None
 
-    return type('PIEvent', (), {
-        'id': item.id,
-        'position_x': item.position_x,
-        'position_y': item.position_y,
-        'garden_bed_id': item.garden_bed_id,
-        'plant_id': item.plant_id,
-        'variety': item.variety,
-        'transplant_date': item.transplant_date,
-        'direct_seed_date': item.planted_date if not item.transplant_date else None,
-        'seed_start_date': None,
-        'expected_harvest_date': end,
-    })()
+    return ConflictEvent(
+        id=item.id,
+        position_x=item.position_x,
+        position_y=item.position_y,
+        garden_bed_id=item.garden_bed_id,
+        plant_id=item.plant_id,
+        variety=item.variety,
+        transplant_date=item.transplant_date,
+        direct_seed_date=item.planted_date if not item.transplant_date else None,
+        seed_start_date=None,
+        expected_harvest_date=end,
+    )
 
 
-def query_candidate_items(garden_bed_id, user_id, exclude_item_id=None):
+def query_candidate_items(garden_bed_id, user_id, exclude_item_id=None,
+                          start_date=None, end_date=None, x_range=None, y_range=None):
     """
     Query PlantedItems in a garden bed and convert them to event-like objects
     for conflict checking. PlantedItems are the ground truth for what's
     physically in the garden — they can't be orphaned like PlantingEvents.
+
+    The optional filters narrow the query to items that could conflict with a
+    new planting, so beds with long histories don't load every past item:
+    start_date/end_date (dates) keep items that may be in the ground after
+    the first and before the last day of the new planting, and
+    x_range/y_range (exclusive (low, high) bounds) keep items positioned
+    inside them. Items that pass may still not conflict; has_conflict()
+    applies the exact rules.
     """
     from models import PlantedItem
+    from sqlalchemy import and_, func, or_
     query = PlantedItem.query.filter(
         PlantedItem.user_id == user_id,
         PlantedItem.garden_bed_id == garden_bed_id,
@@ -481,7 +1123,161 @@ def query_candidate_items(garden_bed_id, user_id, exclude_item_id=None):
     )
     if exclude_item_id is not None:
         query = query.filter(PlantedItem.id != exclude_item_id)
-    return [planted_item_to_event(pi) for pi in query.all()]
+    if start_date is not None and end_date is not None:
+        # Same start/end rules as planted_item_to_event(), compared by day:
+        # the item must go in the ground before end_date and come out after
+        # start_date. The calculated (days to maturity) end is bounded by
+        # the longest maturity of any plant.
+        in_ground = func.coalesce(PlantedItem.transplant_date, PlantedItem.planted_date)
+        after_start = datetime.combine(start_date + timedelta(days=1), time())
+        query = query.filter(
+            in_ground < datetime.combine(end_date, time()),
+            or_(
+                PlantedItem.seed_maturity_date >= after_start,
+                PlantedItem.harvest_date >= after_start,
+                and_(
+                    PlantedItem.harvest_date.is_(None),
+                    in_ground >= after_start - timedelta(days=_max_days_to_maturity()),
+                ),
+            ),
+        )
+    if x_range is not None:
+        query = query.filter(PlantedItem.position_x > x_range[0],
+                             PlantedItem.position_x < x_range[1])
+    if y_range is not None:
+        query = query.filter(PlantedItem.position_y > y_range[0],
+                             PlantedItem.position_y < y_range[1])
+    return _planted_items_to_events(query.all())
+
+
+def _planted_items_to_events(items):
+    # A bed usually repeats a few plants many times; resolve each one once
+    plants = get_plants_by_ids({item.plant_id for item in items})
+    return [planted_item_to_event(item, plants) for item in items]
+
+
+def query_candidate_index(garden_bed, user_id, exclude_item_id=None, bed_id=None,
+                          near_event=None):
+    """
+    query_candidate_items() for a bed, returned as a BedIndex that can be
+    passed to has_conflict() in place of the event list.
+
+    The index keeps the bed's items sorted by in-ground day, so a check only
+    looks at the items in the ground around the new planting's dates (and
+    bucketed by cell, so only nearby ones are compared in large beds).
+    bed_id overrides garden_bed.id as the bed the new events are matched
+    against (see build_bed_index). With near_event, only items that could
+    conflict with that event are loaded, so the index suits checking it
+    alone.
+    """
+    if bed_id is None:
+        bed_id = garden_bed.id
+    filters = {}
+    if near_event is not None:
+        new = _as_view(_coerce_event(near_event))
+        if new.start_day is not None and new.end_day is not None:
+            filters['start_date'] = date.fromordinal(new.start_day)
+            filters['end_date'] = date.fromordinal(new.end_day)
+        if new.x is not None and new.y is not None:
+            grid_size, planning_method = _bed_settings(garden_bed)
+            reach = max(_cells(new.plant_id, grid_size, planning_method),
+                        _max_cells(grid_size, planning_method))
+            filters['x_range'] = (new.x - reach, new.x + reach)
+            filters['y_range'] = (new.y - reach, new.y + reach)
+    return build_bed_index(query_candidate_items(bed_id, user_id, exclude_item_id, **filters),
+                           garden_bed, bed_id)
+
+
+def query_candidate_items_by_bed(user_id, garden_bed_ids):
+    """
+    query_candidate_items() for several beds at once.
+
+    Runs a single query and returns {garden_bed_id: [event, ...]} with an
+    entry only for beds that have positioned items.
+    """
+    from models import PlantedItem
+    query = PlantedItem.query.filter(
+        PlantedItem.user_id == user_id,
+        PlantedItem.garden_bed_id.in_(list(garden_bed_ids)),
+        PlantedItem.position_x.isnot(None),
+        PlantedItem.position_y.isnot(None),
+    ).order_by(PlantedItem.id)
+    return _partition_by_bed(_planted_items_to_events(query.all()))
+
+
+def _skips_conflict_check(event_data: Dict[str, Any]) -> bool:
+    """Steps 1-3 of validate_planting_conflict(): cases that need no check."""
+    # 1. Skip validation if no position data (timeline-only events)
+    # IMPORTANT: Check for None explicitly, not truthiness (0 is valid position!)
+    if event_data.get('position_x') is None or event_data.get('position_y') is None:
+        return True
+
+    # 2. Skip validation if conflict_override=True (user explicitly approved)
+    if event_data.get('conflict_override'):
+        return True
+
+    # 3. Skip validation if missing critical date data
+    return not event_data.get('start_date') or not event_data.get('end_date')
+
+
+def _temp_event(event_data: Dict[str, Any], garden_bed_id: Any, exclude_item_id: Optional[int]):
+    """Temporary event object for conflict checking (id is the item to skip)."""
+    return ConflictEvent(
+        id=exclude_item_id,
+        position_x=event_data['position_x'],
+        position_y=event_data['position_y'],
+        garden_bed_id=garden_bed_id,
+        plant_id=event_data['plant_id'],
+        transplant_date=event_data.get('transplant_date'),
+        direct_seed_date=event_data.get('direct_seed_date'),
+        seed_start_date=event_data.get('seed_start_date'),
+        expected_harvest_date=event_data.get('end_date'),
+    )
+
+
+def _validation_result(result: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """validate_planting_conflict()'s return value for a has_conflict() result."""
+    if result['has_conflict']:
+        return (False, {
+            'error': 'Planting conflict detected',
+            'conflicts': result['conflicts'],
+            'message': f"This position overlaps with {len(result['conflicts'])} existing planting(s). Set conflictOverride=true to force creation."
+        })
+
+    return (True, None)
+
+
+class BedConflictIndex:
+    """
+    validate_planting_conflict() for many new plantings in one garden bed.
+
+    The bed's PlantedItems are queried and indexed once, in the constructor;
+    check() then only runs has_conflict() against the index. Use it when a
+    request validates several plantings for the same bed (e.g. a batch of
+    positions). The index is not updated as plantings are created, so the
+    plantings are checked against what was in the bed beforehand, not
+    against each other.
+    """
+
+    def __init__(self, garden_bed: Any, user_id: int):
+        self.garden_bed = garden_bed
+        self.user_id = user_id
+        self.index = query_candidate_index(garden_bed, user_id)
+
+    def check(
+        self,
+        event_data: Dict[str, Any],
+        exclude_item_id: Optional[int] = None
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Validate one planting in this bed, with validate_planting_conflict()'s
+        arguments and return value. event_data's garden_bed_id is not used.
+        """
+        if _skips_conflict_check(event_data):
+            return (True, None)
+
+        temp_event = _temp_event(event_data, self.garden_bed.id, exclude_item_id)
+        return _validation_result(has_conflict(temp_event, self.index, self.garden_bed))
 
 
 def validate_planting_conflict(
@@ -511,19 +1307,8 @@ def validate_planting_conflict(
     """
     from models import db, PlantingEvent, PlantedItem, GardenBed
 
-    # 1. Skip validation if no position data (timeline-only events)
-    # IMPORTANT: Check for None explicitly, not truthiness (0 is valid position!)
-    if event_data.get('position_x') is None or event_data.get('position_y') is None:
-        return (True, None)
-
-    # 2. Skip validation if conflict_override=True (user explicitly approved)
-    if event_data.get('conflict_override'):
-        return (True, None)
-
-    # 3. Skip validation if missing critical date data
-    start_date = event_data.get('start_date')
-    end_date = event_data.get('end_date')
-    if not start_date or not end_date:
+    # 1-3. Skip validation without a position or dates, or when overridden
+    if _skips_conflict_check(event_data):
         return (True, None)
 
     # 4. Query existing items in same garden bed with positions
@@ -539,53 +1324,53 @@ def validate_planting_conflict(
             'message': f'Garden bed {garden_bed_id} does not exist'
         })
 
-    # Backward compat: convert exclude_event_id → exclude_item_id
+    # Backward compat: convert exclude_event_id → exclude_item_id. Events
+    # record the PlantedItem they were created with; the link is used only
+    # if that item still exists in the event's bed (SQLite does not enforce
+    # ON DELETE SET NULL and reuses ids), otherwise an item is matched by
+    # bed, plant and position.
     if exclude_event_id and not exclude_item_id:
-        evt = PlantingEvent.query.get(exclude_event_id)
+        evt = db.session.query(
+            PlantingEvent.planted_item_id, PlantingEvent.garden_bed_id, PlantingEvent.plant_id,
+            PlantingEvent.position_x, PlantingEvent.position_y, PlantingEvent.user_id,
+        ).filter(PlantingEvent.id == exclude_event_id).first()
         if evt:
-            match = PlantedItem.query.filter_by(
-                garden_bed_id=int(evt.garden_bed_id) if evt.garden_bed_id else None,
-                plant_id=evt.plant_id,
-                position_x=evt.position_x,
-                position_y=evt.position_y,
-                user_id=evt.user_id
-            ).first()
-            if match:
-                exclude_item_id = match.id
-
-    # Query PlantedItems directly — they are ground truth and can't be orphaned
-    candidate_events = query_candidate_items(garden_bed_id, user_id, exclude_item_id)
-
-    # DEBUG: Log candidate items found
-    print(f"[CONFLICT CHECK] pos=({event_data.get('position_x')},{event_data.get('position_y')}), "
-          f"plant={event_data.get('plant_id')}, candidates={len(candidate_events)}")
-    for ce in candidate_events:
-        ce_start = ce.transplant_date or ce.direct_seed_date
-        print(f"  candidate item {ce.id}: plant={ce.plant_id}, pos=({ce.position_x},{ce.position_y}), "
-              f"start={ce_start}, end={ce.expected_harvest_date}")
+            bed_id = int(evt.garden_bed_id) if evt.garden_bed_id else None
+            if evt.planted_item_id is not None:
+                exclude_item_id = db.session.query(PlantedItem.id).filter_by(
+                    id=evt.planted_item_id,
+                    garden_bed_id=bed_id,
+                    user_id=evt.user_id
+                ).scalar()
+            if exclude_item_id is None:
+                exclude_item_id = db.session.query(PlantedItem.id).filter_by(
+                    garden_bed_id=bed_id,
+                    plant_id=evt.plant_id,
+                    position_x=evt.position_x,
+                    position_y=evt.position_y,
+                    user_id=evt.user_id
+                ).limit(1).scalar()
 
     # 5. Create temporary event object for conflict checking
-    temp_event = type('TempEvent', (), {
-        'position_x': event_data['position_x'],
-        'position_y': event_data['position_y'],
-        'garden_bed_id': garden_bed_id,
-        'plant_id': event_data['plant_id'],
-        'transplant_date': event_data.get('transplant_date'),
-        'direct_seed_date': event_data.get('direct_seed_date'),
-        'seed_start_date': event_data.get('seed_start_date'),
-        'expected_harvest_date': end_date,
-        'id': exclude_item_id
-    })()
+    temp_event = _temp_event(event_data, garden_bed_id, exclude_item_id)
+
+    # Query PlantedItems directly — they are ground truth and can't be orphaned
+    # (only those near the new planting and around its dates)
+    candidate_index = query_candidate_index(garden_bed, user_id, exclude_item_id, garden_bed_id,
+                                            near_event=temp_event)
+
+    # Log candidate items found (formatted only when debug logging is on)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[CONFLICT CHECK] pos=(%s,%s), plant=%s, candidates=%d",
+                     event_data.get('position_x'), event_data.get('position_y'),
+                     event_data.get('plant_id'), len(candidate_index))
+        for ce in candidate_index.events():
+            logger.debug("  candidate item %s: plant=%s, pos=(%s,%s), start=%s, end=%s",
+                         ce.id, ce.plant_id, ce.position_x, ce.position_y,
+                         ce.transplant_date or ce.direct_seed_date, ce.expected_harvest_date)
 
     # 6. Call existing has_conflict() function
-    result = has_conflict(temp_event, candidate_events, garden_bed)
+    result = has_conflict(temp_event, candidate_index, garden_bed)
 
     # 7. Return validation result
-    if result['has_conflict']:
-        return (False, {
-            'error': 'Planting conflict detected',
-            'conflicts': result['conflicts'],
-            'message': f"This position overlaps with {len(result['conflicts'])} existing planting(s). Set conflictOverride=true to force creation."
-        })
-
-    return (True, None)
+    return _validation_result(result)
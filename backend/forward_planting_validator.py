@@ -15,6 +15,9 @@ Example:
 import logging
 from datetime import date, timedelta
 from typing import Optional, Dict, List, Tuple
+
+import numpy as np
+
 from historical_soil_temp import get_historical_daily_soil_temps, get_historical_daily_air_temps, get_month_name
 
 logger = logging.getLogger(__name__)
@@ -54,6 +57,11 @@ PLANT_HARDINESS = {
 }
 
 
+# Longest growing period scanned for cold danger. Perennials and long-season
+# crops only have their establishment period checked.
+MAX_COLD_CHECK_DAYS = 120
+
+
 # Germination time estimates (days from planting to emergence)
 # Format: plant_id -> (min_days, max_days, temp_dependent)
 GERMINATION_TIMES = {
@@ -125,6 +133,58 @@ def get_germination_days(plant_id: str, soil_temp: float) -> int:
         return max_days  # Very slow in cold soil
 
 
+def fetch_historical_cold_window(
+    latitude: float,
+    longitude: float,
+    start_date: date,
+    max_days: int
+) -> np.ndarray:
+    """
+    Fetch historical average daily minimum air temps for a run of days.
+
+    Index i of the returned array is the historical minimum for
+    start_date + i days, covering start_date through start_date + max_days
+    inclusive. Days with no historical data are NaN, so they never compare
+    below a threshold.
+
+    One window can be shared by every plant planted on start_date, which
+    avoids re-walking the monthly caches once per plant.
+    """
+    window = np.full(max_days + 1, np.nan)
+    month_temps = {}
+
+    for offset in range(max_days + 1):
+        check_date = start_date + timedelta(days=offset)
+        month = check_date.month
+        if month not in month_temps:
+            month_temps[month] = get_historical_daily_air_temps(latitude, longitude, month) or {}
+        temp = month_temps[month].get(check_date.day)
+        if temp is not None:
+            window[offset] = temp
+
+    return window
+
+
+def _scan_cold_window(temps: np.ndarray, lethal_temp: float) -> Tuple[np.ndarray, int]:
+    """
+    Find days in a temperature window that fall below a lethal threshold.
+
+    Returns:
+        Tuple of (cold_indices, longest_snap_days) where cold_indices are the
+        positions in temps below lethal_temp and longest_snap_days is the
+        longest run of consecutive cold days
+    """
+    cold = temps < lethal_temp
+    cold_indices = np.flatnonzero(cold)
+    if cold_indices.size == 0:
+        return cold_indices, 0
+
+    # Run boundaries: +1 where a cold run starts, -1 just past where it ends
+    edges = np.diff(np.concatenate(([0], cold.view(np.int8), [0])))
+    run_lengths = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+    return cold_indices, int(run_lengths.max())
+
+
 def check_future_cold_danger(
     plant_id: str,
     planting_date: date,
@@ -154,6 +214,31 @@ def check_future_cold_danger(
         - warning_message: Human-readable warning or None
         - danger_details: Dict with 'dates' and 'temps' or None
     """
+    window = fetch_historical_cold_window(
+        latitude, longitude, planting_date, min(days_to_maturity, MAX_COLD_CHECK_DAYS)
+    )
+    return check_future_cold_danger_with_data(
+        plant_id, planting_date, window, current_soil_temp, days_to_maturity
+    )
+
+
+def check_future_cold_danger_with_data(
+    plant_id: str,
+    planting_date: date,
+    window: np.ndarray,
+    current_soil_temp: float,
+    days_to_maturity: int
+) -> Tuple[bool, Optional[str], Optional[Dict]]:
+    """
+    Same as check_future_cold_danger(), using a prefetched temperature window.
+
+    Args:
+        window: Array from fetch_historical_cold_window() starting at
+            planting_date and spanning at least min(days_to_maturity, 120) days
+
+    Returns:
+        Same tuple as check_future_cold_danger()
+    """
     # Get plant's lethal temperature threshold
     lethal_temp = get_plant_hardiness_temp(plant_id)
 
@@ -164,37 +249,28 @@ def check_future_cold_danger(
     # Calculate end of growing season
     # For perennials/long-maturing crops (>120 days), only check first 120 days
     # These are typically perennials that will overwinter or biennials
-    checking_period = min(days_to_maturity, 120)
-    harvest_date = planting_date + timedelta(days=checking_period)
+    checking_period = min(days_to_maturity, MAX_COLD_CHECK_DAYS)
 
     logger.info(f"Checking cold danger for {plant_id}: DTM={days_to_maturity} days, checking period={checking_period} days")
 
-    # Check historical temperatures for each month in the growing period
+    # Scan germination through harvest for historical temps below the lethal threshold
     dangerous_periods = []
 
-    current_check_date = germination_date
-    while current_check_date <= harvest_date:
-        month = current_check_date.month
-        day = current_check_date.day
-
-        # Fetch historical daily AIR temps for this month (not soil - seedlings are exposed to air!)
-        daily_temps = get_historical_daily_air_temps(latitude, longitude, month)
-
-        if daily_temps and day in daily_temps:
-            historical_temp = daily_temps[day]
-
-            # Check if historical temp is below lethal threshold
-            if historical_temp < lethal_temp:
-                dangerous_periods.append({
-                    'date': current_check_date.strftime('%Y-%m-%d'),
-                    'month_name': get_month_name(month),
-                    'day': day,
-                    'historical_temp': historical_temp,
-                    'lethal_temp': lethal_temp,
-                    'margin': round(lethal_temp - historical_temp, 1)
-                })
-
-        current_check_date += timedelta(days=1)
+    cold_indices, longest_snap = _scan_cold_window(
+        window[germination_days:checking_period + 1], lethal_temp
+    )
+    for idx in cold_indices:
+        offset = germination_days + int(idx)
+        check_date = planting_date + timedelta(days=offset)
+        historical_temp = float(window[offset])
+        dangerous_periods.append({
+            'date': check_date.strftime('%Y-%m-%d'),
+            'month_name': get_month_name(check_date.month),
+            'day': check_date.day,
+            'historical_temp': historical_temp,
+            'lethal_temp': lethal_temp,
+            'margin': round(lethal_temp - historical_temp, 1)
+        })
 
     # Analyze results
     if not dangerous_periods:
@@ -218,7 +294,7 @@ def check_future_cold_danger(
     is_fall_decline = days_into_season > (checking_period * 0.6)
 
     # Build warning - add note if checking period was capped for perennials
-    if days_to_maturity > 120:
+    if days_to_maturity > MAX_COLD_CHECK_DAYS:
         period_note = " (checking establishment period only for long-season/perennial crop)"
     else:
         period_note = ""
@@ -252,7 +328,8 @@ def check_future_cold_danger(
         'lethal_threshold': lethal_temp,
         'checking_period_days': checking_period,
         'full_dtm': days_to_maturity,
-        'is_fall_decline': is_fall_decline
+        'is_fall_decline': is_fall_decline,
+        'longest_cold_snap_days': longest_snap
     }
 
     return (False, warning, danger_details)
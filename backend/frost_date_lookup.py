@@ -8,9 +8,12 @@ has not set explicit frost dates on their property.
 
 Zone format: "1a" through "13b" (or just the number like "5" or "5b")
 """
+import threading
 from datetime import date, datetime, timedelta
 from typing import Optional
 
+from flask import g, has_app_context
+
 
 # Average last spring frost and first fall frost by USDA zone.
 # Month/day tuples: (month, day)
@@ -60,6 +63,15 @@ ZONE_FROST_DATES = {
 _zipcode_zone_cache = {}
 _CACHE_EXPIRY = timedelta(hours=24)
 
+# Module-level cache: (user_id, year, zipcode) -> {'result': dict, 'cached_at': datetime}
+# Kept short so property edits made outside the properties API still show up quickly.
+# zipcode comes from the request, so the cache is bounded (oldest entry evicted
+# first) and guarded by a lock, since request threads share it.
+_user_frost_cache = {}
+_user_frost_cache_lock = threading.Lock()
+_USER_FROST_CACHE_EXPIRY = timedelta(minutes=5)
+_USER_FROST_CACHE_MAX_ENTRIES = 1024
+
 
 def _get_zone_from_zipcode(zipcode: str) -> Optional[str]:
     """Derive USDA zone from a ZIP code using the geocoding service API lookup.
@@ -176,12 +188,56 @@ def get_frost_dates_for_user(user_id: int, year: int = None, zipcode: str = None
             'source': 'property' | 'zone' | 'zipcode' | 'default'
             'zone': (only when source='zipcode') the derived zone string
     """
-    from models import Property
     from simulation_clock import get_now
 
     if year is None:
         year = get_now().year
 
+    cache_key = (user_id, year, zipcode)
+
+    # Tier 1: per-request memo (several callers in one request ask for the same dates)
+    request_cache = g.setdefault('_frost_dates', {}) if has_app_context() else None
+    if request_cache is not None and cache_key in request_cache:
+        return dict(request_cache[cache_key])
+
+    # Tier 2: short-lived per-user cache shared across requests
+    with _user_frost_cache_lock:
+        cached = _user_frost_cache.get(cache_key)
+        if cached and (datetime.utcnow() - cached['cached_at']) >= _USER_FROST_CACHE_EXPIRY:
+            del _user_frost_cache[cache_key]
+            cached = None
+
+    if cached:
+        result = cached['result']
+    else:
+        result = _lookup_frost_dates_for_user(user_id, year, zipcode)
+        with _user_frost_cache_lock:
+            _user_frost_cache.pop(cache_key, None)
+            if len(_user_frost_cache) >= _USER_FROST_CACHE_MAX_ENTRIES:
+                _user_frost_cache.pop(next(iter(_user_frost_cache)))
+            _user_frost_cache[cache_key] = {'result': result, 'cached_at': datetime.utcnow()}
+
+    if request_cache is not None:
+        request_cache[cache_key] = result
+    return dict(result)
+
+
+def clear_frost_date_cache(user_id: int = None):
+    """Drop cached frost dates for one user (or everyone) after their property changes."""
+    with _user_frost_cache_lock:
+        if user_id is None:
+            _user_frost_cache.clear()
+        else:
+            for key in [k for k in _user_frost_cache if k[0] == user_id]:
+                del _user_frost_cache[key]
+    if has_app_context():
+        g.pop('_frost_dates', None)
+
+
+def _lookup_frost_dates_for_user(user_id: int, year: int, zipcode: str = None) -> dict:
+    """Uncached frost date lookup; see get_frost_dates_for_user() for the priority order."""
+    from models import Property
+
     # Default fallback (Zone 5b: Milwaukee)
     default_result = {
         'last_frost': date(year, 4, 15),
@@ -3,6 +3,11 @@ Garden Planning Methods Database
 Defines different garden planning methodologies with their spacing rules,
 planting densities, and bed templates.
 """
+import functools
+from collections import namedtuple
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping
 
 # ==================== GARDEN PLANNING METHODS ====================
 
@@ -471,80 +476,210 @@ BED_TEMPLATES = [
     }
 ]
 
+# Row method spacing pair, in inches. Field names match the API's JSON keys
+# (spacing._asdict()).
+Spacing = namedtuple('Spacing', ['rowSpacing', 'plantSpacing'])
+
+# One grid-positioned bed template planting. Templates are written above in the API's JSON
+# shape and stored as Placements; placement_to_dict() restores that shape.
+Placement = namedtuple('Placement', ['plantId', 'row', 'col', 'quantity'])
+
+
+@dataclass(slots=True, frozen=True)
+class GuildPlant:
+    """One plant in a companion planting guild (dataclasses.asdict() for JSON)"""
+    id: str
+    quantity: int
+    role: str
+
+
+# ==================== READ-ONLY VIEWS ====================
+# The tables above are shared reference data: expose read-only views (and
+# tuples for plant lists, spacing pairs and template plantings) so no caller
+# can change them for every other request. JSON responses serialize them
+# unchanged, apart from template plantings (see placement_to_dict()).
+
+GARDEN_METHODS = MappingProxyType(GARDEN_METHODS)
+SFG_SPACING = MappingProxyType({
+    quantity: tuple(plant_list) for quantity, plant_list in SFG_SPACING.items()
+})
+# SFG_SPACING keyed by plant pattern (pattern -> plants per square), in
+# table order
+SFG_QUANTITY = MappingProxyType({
+    plant_pattern: quantity
+    for quantity, plant_list in SFG_SPACING.items()
+    for plant_pattern in plant_list
+})
+ROW_SPACING = MappingProxyType({
+    plant_key: Spacing(*spacing) for plant_key, spacing in ROW_SPACING.items()
+})
+INTENSIVE_SPACING = MappingProxyType(INTENSIVE_SPACING)
+MIGARDENER_SPACING = MappingProxyType({
+    plant_key: Spacing(*spacing) for plant_key, spacing in MIGARDENER_SPACING.items()
+})
+for _guild in PLANT_GUILDS.values():
+    _guild['plants'] = tuple(GuildPlant(**plant) for plant in _guild['plants'])
+del _guild
+PLANT_GUILDS = MappingProxyType(PLANT_GUILDS)
+for _template in BED_TEMPLATES:
+    # Row and intensive templates lay out rows or spacings, not grid cells
+    if 'plants' not in _template or not all('position' in p for p in _template['plants']):
+        continue
+    _template['plants'] = tuple(
+        Placement(p['plantId'], p['position']['row'], p['position']['col'], p['quantity'])
+        for p in _template['plants']
+    )
+del _template
+BED_TEMPLATES = tuple(BED_TEMPLATES)
+
+# Method summaries served by get_methods_list(), built once
+_METHODS_LIST = [
+    {
+        'id': method_id,
+        'name': method_data['name'],
+        'description': method_data['description'],
+        'idealFor': method_data['idealFor']
+    }
+    for method_id, method_data in GARDEN_METHODS.items()
+]
+
+# Template ID -> template; the first template with an ID wins, as with the
+# linear scan this replaces
+_TEMPLATES_BY_ID = {}
+for _template in BED_TEMPLATES:
+    _TEMPLATES_BY_ID.setdefault(_template['id'], _template)
+del _template
+
+# ==================== SPACING LOOKUP INDEXES ====================
+# Pattern -> value for each spacing table, built once at import and ordered
+# longest pattern first, so a plant ID matches its most specific pattern
+# ('lettuce-crisphead' before 'lettuce'). Equal-length patterns keep table
+# order.
+
+def _by_specificity(table):
+    return dict(sorted(table.items(), key=lambda item: -len(item[0])))
+
+_SFG_INDEX = _by_specificity(SFG_QUANTITY)
+_ROW_INDEX = _by_specificity(ROW_SPACING)
+_INTENSIVE_INDEX = _by_specificity(INTENSIVE_SPACING)
+_MIGARDENER_INDEX = _by_specificity(MIGARDENER_SPACING)
+
+# Intensive plants per sq ft by hexagonal spacing (packing efficiency 0.866),
+# for every spacing _resolve_intensive() can return
+_INTENSIVE_DENSITY = {
+    spacing: (144 / (spacing * spacing)) * 0.866
+    for spacing in {*INTENSIVE_SPACING.values(), 12}
+}
+
+def _first_match(index: Mapping[str, Any], plant_id: str, default: Any) -> Any:
+    """Value of the first pattern in index that occurs in plant_id."""
+    # Most IDs are '<pattern>-<n>'. Patterns hold no digits, so every pattern
+    # in such an ID lies within its base, and a base that is itself a pattern
+    # is the longest match: look it up directly before scanning
+    base, _, suffix = plant_id.rpartition('-')
+    if suffix.isdigit() and base in index:
+        return index[base]
+
+    for plant_pattern, value in index.items():
+        if plant_pattern in plant_id:
+            return value
+    return default
+
+# Plant IDs come from a small, fixed set, so each resolver runs its scan once
+# per ID and answers repeats from the cache
+@functools.lru_cache(maxsize=512)
+def _resolve_sfg(plant_id: str) -> float:
+    return _first_match(_SFG_INDEX, plant_id, 1)
+
+@functools.lru_cache(maxsize=512)
+def _resolve_row(plant_id: str) -> Spacing:
+    return _first_match(_ROW_INDEX, plant_id, Spacing(24, 12))
+
+@functools.lru_cache(maxsize=512)
+def _resolve_intensive(plant_id: str) -> float:
+    return _first_match(_INTENSIVE_INDEX, plant_id, 12)
+
+@functools.lru_cache(maxsize=512)
+def _resolve_migardener(plant_id: str) -> Spacing:
+    # Unknown plants use conservative row method defaults
+    return _first_match(_MIGARDENER_INDEX, plant_id, Spacing(18, 8))
+
+def clear_spacing_caches() -> None:
+    """Drop memoized spacing lookups and plant counts."""
+    _resolve_sfg.cache_clear()
+    _resolve_row.cache_clear()
+    _resolve_intensive.cache_clear()
+    _resolve_migardener.cache_clear()
+    calculate_plants_per_bed.cache_clear()
+
 # ==================== HELPER FUNCTIONS ====================
 
-def get_sfg_quantity(plant_id):
+def get_sfg_quantity(plant_id: str) -> float:
     """Get the number of plants per square foot for SFG method"""
-    # Try to match plant ID to SFG spacing
-    for quantity, plant_list in SFG_SPACING.items():
-        for plant_pattern in plant_list:
-            if plant_pattern in plant_id:
-                return quantity
     # Default: 1 per square for unknown plants
-    return 1
+    return _resolve_sfg(plant_id)
 
-def get_row_spacing(plant_id):
-    """Get row and within-row spacing for row gardening"""
-    # Try to find exact match or partial match
-    for plant_key, spacing in ROW_SPACING.items():
-        if plant_key in plant_id:
-            return {'rowSpacing': spacing[0], 'plantSpacing': spacing[1]}
-    # Default spacing for unknown plants
-    return {'rowSpacing': 24, 'plantSpacing': 12}
+def get_row_spacing(plant_id: str) -> Spacing:
+    """Get row and within-row spacing (a Spacing) for row gardening"""
+    return _resolve_row(plant_id)
 
-def get_intensive_spacing(plant_id):
+def get_intensive_spacing(plant_id: str) -> float:
     """Get hexagonal spacing for intensive method"""
-    for plant_key, spacing in INTENSIVE_SPACING.items():
-        if plant_key in plant_id:
-            return spacing
-    # Default spacing for unknown plants
-    return 12
-
-def get_migardener_spacing(plant_id):
-    """Get MIgardener high-intensity row and within-row spacing"""
-    # Try to find exact match or partial match
-    for plant_key, spacing in MIGARDENER_SPACING.items():
-        if plant_key in plant_id:
-            return {'rowSpacing': spacing[0], 'plantSpacing': spacing[1]}
-    # Default spacing for unknown plants (use conservative row method defaults)
-    return {'rowSpacing': 18, 'plantSpacing': 8}
-
-def calculate_plants_per_bed(bed_width, bed_length, plant_id, method='square-foot'):
-    """Calculate how many plants fit in a bed based on method"""
-    bed_area_inches = bed_width * 12 * bed_length * 12
+    return _resolve_intensive(plant_id)
 
-    if method == 'square-foot':
-        squares = (bed_width * bed_length)  # Number of 1 ft squares
-        per_square = get_sfg_quantity(plant_id)
-        return squares * per_square
+def get_intensive_density(plant_id: str) -> float:
+    """Get plants per square foot for intensive method (hexagonal packing)"""
+    return _INTENSIVE_DENSITY[_resolve_intensive(plant_id)]
 
-    elif method == 'row':
-        spacing = get_row_spacing(plant_id)
-        row_spacing_inches = spacing['rowSpacing']
-        plant_spacing_inches = spacing['plantSpacing']
+def get_migardener_spacing(plant_id: str) -> Spacing:
+    """Get MIgardener high-intensity row and within-row spacing (a Spacing)"""
+    return _resolve_migardener(plant_id)
 
-        num_rows = int((bed_width * 12) / row_spacing_inches)
-        plants_per_row = int((bed_length * 12) / plant_spacing_inches)
-        return num_rows * plants_per_row
+def _sfg_plants(bed_width: float, bed_length: float, plant_id: str) -> float:
+    squares = (bed_width * bed_length)  # Number of 1 ft squares
+    per_square = get_sfg_quantity(plant_id)
+    return squares * per_square
 
-    elif method == 'intensive':
-        spacing_inches = get_intensive_spacing(plant_id)
-        # Hexagonal packing efficiency: 0.866
-        plants_per_sq_ft = (144 / (spacing_inches * spacing_inches)) * 0.866
-        return int((bed_width * bed_length) * plants_per_sq_ft)
+def _rows_of_plants(bed_width: float, bed_length: float, spacing: Spacing) -> int:
+    row_spacing_inches = spacing.rowSpacing
+    plant_spacing_inches = spacing.plantSpacing
 
-    elif method == 'migardener':
-        spacing = get_migardener_spacing(plant_id)
-        row_spacing_inches = spacing['rowSpacing']
-        plant_spacing_inches = spacing['plantSpacing']
+    # Floor division stays in integers for whole-foot beds and whole-inch
+    # spacings; int() only converts results from fractional ones
+    num_rows = int((bed_width * 12) // row_spacing_inches)
+    plants_per_row = int((bed_length * 12) // plant_spacing_inches)
+    return num_rows * plants_per_row
 
-        num_rows = int((bed_width * 12) / row_spacing_inches)
-        plants_per_row = int((bed_length * 12) / plant_spacing_inches)
-        return num_rows * plants_per_row
+def _row_plants(bed_width: float, bed_length: float, plant_id: str) -> int:
+    return _rows_of_plants(bed_width, bed_length, get_row_spacing(plant_id))
 
+def _intensive_plants(bed_width: float, bed_length: float, plant_id: str) -> int:
+    return int((bed_width * bed_length) * get_intensive_density(plant_id))
+
+def _migardener_plants(bed_width: float, bed_length: float, plant_id: str) -> int:
+    return _rows_of_plants(bed_width, bed_length, get_migardener_spacing(plant_id))
+
+def _unknown_method_plants(bed_width: float, bed_length: float, plant_id: str) -> int:
     return 1
 
-def get_method_grid_size(method):
+_PLANT_COUNTERS = {
+    'square-foot': _sfg_plants,
+    'row': _row_plants,
+    'intensive': _intensive_plants,
+    'migardener': _migardener_plants,
+}
+
+# Layout views ask for the same few (bed size, plant, method) combinations
+# over and over; the result is a plain number, so it is safe to share
+@functools.lru_cache(maxsize=2048)
+def calculate_plants_per_bed(bed_width: float, bed_length: float, plant_id: str,
+                             method: str = 'square-foot') -> float:
+    """Calculate how many plants fit in a bed based on method"""
+    counter = _PLANT_COUNTERS.get(method, _unknown_method_plants)
+    return counter(bed_width, bed_length, plant_id)
+
+@functools.cache
+def get_method_grid_size(method: str) -> int:
     """Get the grid cell size in inches for a given method"""
     return GARDEN_METHODS.get(method, {}).get('gridSize', 12)
 
@@ -554,19 +689,16 @@ def get_guild_by_id(guild_id):
 
 def get_template_by_id(template_id):
     """Get a bed template by ID"""
-    for template in BED_TEMPLATES:
-        if template['id'] == template_id:
-            return template
-    return None
+    return _TEMPLATES_BY_ID.get(template_id)
+
+def placement_to_dict(placement):
+    """Convert a template Placement to its API shape"""
+    return {
+        'plantId': placement.plantId,
+        'position': {'row': placement.row, 'col': placement.col},
+        'quantity': placement.quantity
+    }
 
 def get_methods_list():
-    """Get list of all available garden methods"""
-    return [
-        {
-            'id': method_id,
-            'name': method_data['name'],
-            'description': method_data['description'],
-            'idealFor': method_data['idealFor']
-        }
-        for method_id, method_data in GARDEN_METHODS.items()
-    ]
+    """Get list of all available garden methods (shared; do not modify)"""
+    return _METHODS_LIST
@@ -8,6 +8,12 @@ direct-seeding and natural plant self-thinning.
 This module mirrors the frontend logic in frontend/src/utils/migardenerSpacing.ts
 to ensure consistent space calculations between client and server.
 """
+import functools
+from collections import namedtuple
+from types import MappingProxyType
+
+# Row and within-row spacing in inches; row_spacing is None for intensive crops
+MigardenerSpacing = namedtuple('MigardenerSpacing', ['row_spacing', 'plant_spacing'])
 
 # MIGardener-specific spacing overrides (in inches)
 # Format: (row_spacing, plant_spacing)
@@ -93,11 +99,21 @@ MIGARDENER_SPACING_OVERRIDES = {
     'bee-balm-1': (30, 24),    # 24" spacing, spreads over time (mint family)
 }
 
+# Shared reference data (and cached by get_migardener_spacing()): expose a
+# read-only view so no caller can change it for every other request
+MIGARDENER_SPACING_OVERRIDES = MappingProxyType({
+    plant_id: MigardenerSpacing(*spacing)
+    for plant_id, spacing in MIGARDENER_SPACING_OVERRIDES.items()
+})
+
 # Fallback multiplier for crops without specific MIGardener overrides
 # Applies a 4:1 density increase to standard spacing
 MIGARDENER_DEFAULT_MULTIPLIER = 0.25
 
 
+# Bed layouts ask for the same plants cell after cell; results are immutable
+# MigardenerSpacing tuples, so they are safe to share
+@functools.lru_cache(maxsize=4096)
 def get_migardener_spacing(plant_id, standard_spacing, standard_row_spacing=None):
     """
     Calculate spacing for a plant in MIGardener bed.
@@ -110,26 +126,54 @@ def get_migardener_spacing(plant_id, standard_spacing, standard_row_spacing=None
         standard_row_spacing (float, optional): The plant's standard row-to-row spacing
 
     Returns:
-        dict: Dictionary with 'row_spacing' and 'plant_spacing' in inches
+        MigardenerSpacing: (row_spacing, plant_spacing) in inches
 
     Examples:
         >>> get_migardener_spacing('lettuce-1', 12, None)
-        {'row_spacing': 4, 'plant_spacing': 4}
+        MigardenerSpacing(row_spacing=4, plant_spacing=1)
 
         >>> get_migardener_spacing('unknown-plant', 8, 16)
-        {'row_spacing': 4.0, 'plant_spacing': 2.0}
+        MigardenerSpacing(row_spacing=4.0, plant_spacing=2.0)
     """
     # Check for specific override first
-    if plant_id in MIGARDENER_SPACING_OVERRIDES:
-        row_spacing, plant_spacing = MIGARDENER_SPACING_OVERRIDES[plant_id]
-        return {'row_spacing': row_spacing, 'plant_spacing': plant_spacing}
+    override = MIGARDENER_SPACING_OVERRIDES.get(plant_id)
+    if override is not None:
+        return override
 
     # Fall back to applying multiplier to standard spacing
     plant_spacing = standard_spacing * MIGARDENER_DEFAULT_MULTIPLIER
     row_spacing = (standard_row_spacing * MIGARDENER_DEFAULT_MULTIPLIER
                    if standard_row_spacing else standard_spacing)
 
-    return {'row_spacing': row_spacing, 'plant_spacing': plant_spacing}
+    return MigardenerSpacing(row_spacing, plant_spacing)
+
+
+# Default grid size in inches, used for rows of intensive crops
+INTENSIVE_GRID_SIZE = 3
+
+
+def _fit(length_inches, spacing_inches):
+    """Whole spacings that fit in a length, as Math.floor(a / b) on the frontend."""
+    # Whole-foot beds and whole-inch spacings (every override but pea-1) stay
+    # in integer floor division; fractional values keep the true division the
+    # frontend uses, which can round differently from // on a float quotient
+    if type(length_inches) is int and type(spacing_inches) is int:
+        return length_inches // spacing_inches
+    return int(length_inches / spacing_inches)
+
+
+def _plants_per_row(bed_length_inches, spacing):
+    return _fit(bed_length_inches, spacing.plant_spacing)
+
+
+def _rows(bed_width_inches, spacing):
+    # If row_spacing is None or 0, this is an intensive crop with no row restrictions
+    # Return maximum grid rows based on bed width and default grid size (3")
+    if spacing.row_spacing is None or spacing.row_spacing == 0:
+        return _fit(bed_width_inches, INTENSIVE_GRID_SIZE)
+
+    # Traditional row-based crops: calculate based on row spacing
+    return _fit(bed_width_inches, spacing.row_spacing)
 
 
 def calculate_migardener_plants_per_row(bed_length_feet, plant_id, standard_spacing, standard_row_spacing=None):
@@ -145,9 +189,8 @@ def calculate_migardener_plants_per_row(bed_length_feet, plant_id, standard_spac
     Returns:
         int: Number of plants that fit in one row
     """
-    bed_length_inches = bed_length_feet * 12
     spacing = get_migardener_spacing(plant_id, standard_spacing, standard_row_spacing)
-    return int(bed_length_inches / spacing['plant_spacing'])
+    return _plants_per_row(bed_length_feet * 12, spacing)
 
 
 def calculate_migardener_rows(bed_width_feet, plant_id, standard_spacing, standard_row_spacing=None):
@@ -164,17 +207,7 @@ def calculate_migardener_rows(bed_width_feet, plant_id, standard_spacing, standa
         int: Number of rows that fit in the bed
     """
     spacing = get_migardener_spacing(plant_id, standard_spacing, standard_row_spacing)
-
-    # If row_spacing is None or 0, this is an intensive crop with no row restrictions
-    # Return maximum grid rows based on bed width and default grid size (3")
-    if spacing['row_spacing'] is None or spacing['row_spacing'] == 0:
-        bed_width_inches = bed_width_feet * 12
-        grid_size = 3  # Default grid size in inches
-        return int(bed_width_inches / grid_size)
-
-    # Traditional row-based crops: calculate based on row spacing
-    bed_width_inches = bed_width_feet * 12
-    return int(bed_width_inches / spacing['row_spacing'])
+    return _rows(bed_width_feet * 12, spacing)
 
 
 # Example usage for testing
@@ -189,6 +222,6 @@ if __name__ == '__main__':
     print("MIGardener Spacing Calculations:")
     print("=" * 70)
     for plant_id, std_spacing, row_spacing in test_cases:
-        result = get_migardener_spacing(plant_id, std_spacing, row_spacing)
+        mg_row, mg_plant = get_migardener_spacing(plant_id, std_spacing, row_spacing)
         print(f"{plant_id:15} | Std: {std_spacing:2}\" | "
-              f"MG Row: {result['row_spacing']:5.1f}\" | MG Plant: {result['plant_spacing']:5.1f}\"")
+              f"MG Row: {mg_row:5.1f}\" | MG Plant: {mg_plant:5.1f}\"")
@@ -19,6 +19,8 @@ import os
 # Ensure backend/ is on sys.path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from sqlalchemy import func, update
+
 from app import app
 from models import db, PlantingEvent
 
@@ -26,43 +28,44 @@ from models import db, PlantingEvent
 def fix_completion_consistency():
     """Fix inconsistent completion state on PlantingEvent rows."""
     with app.app_context():
-        fixed_count = 0
+        # Each case is one set-based UPDATE, run in order so later cases see
+        # earlier fixes; rowcount is the number of rows fixed
+        def fix(*criteria, **values):
+            return db.session.execute(
+                update(PlantingEvent).where(*criteria).values(**values),
+                execution_options={'synchronize_session': False},
+            ).rowcount
 
         # Case 1: completed=True but quantity_completed is None
-        case1 = PlantingEvent.query.filter(
+        case1 = fix(
             PlantingEvent.completed == True,
             PlantingEvent.quantity_completed.is_(None),
             PlantingEvent.quantity.isnot(None),
-        ).all()
-        for event in case1:
-            event.quantity_completed = event.quantity
-            fixed_count += 1
-        print(f"Case 1 (completed=True, qty_completed=None): fixed {len(case1)} rows")
+            quantity_completed=PlantingEvent.quantity,
+        )
+        print(f"Case 1 (completed=True, qty_completed=None): fixed {case1} rows")
 
         # Case 2: quantity_completed >= quantity but completed=False
-        case2 = PlantingEvent.query.filter(
+        case2 = fix(
             PlantingEvent.completed == False,
             PlantingEvent.quantity.isnot(None),
             PlantingEvent.quantity_completed.isnot(None),
             PlantingEvent.quantity_completed >= PlantingEvent.quantity,
-        ).all()
-        for event in case2:
-            event.completed = True
-            fixed_count += 1
-        print(f"Case 2 (qty_completed >= qty, completed=False): fixed {len(case2)} rows")
+            completed=True,
+        )
+        print(f"Case 2 (qty_completed >= qty, completed=False): fixed {case2} rows")
 
-        # Case 3: actual_harvest_date set but completed=False
-        case3 = PlantingEvent.query.filter(
+        # Case 3: actual_harvest_date set but completed=False; also fill a
+        # missing quantity_completed from quantity
+        case3 = fix(
             PlantingEvent.completed == False,
             PlantingEvent.actual_harvest_date.isnot(None),
-        ).all()
-        for event in case3:
-            event.completed = True
-            if event.quantity is not None and event.quantity_completed is None:
-                event.quantity_completed = event.quantity
-            fixed_count += 1
-        print(f"Case 3 (harvested but not completed): fixed {len(case3)} rows")
+            completed=True,
+            quantity_completed=func.coalesce(PlantingEvent.quantity_completed, PlantingEvent.quantity),
+        )
+        print(f"Case 3 (harvested but not completed): fixed {case3} rows")
 
+        fixed_count = case1 + case2 + case3
         if fixed_count > 0:
             db.session.commit()
             print(f"\nTotal: fixed {fixed_count} rows")
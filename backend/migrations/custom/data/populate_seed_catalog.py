@@ -12,8 +12,10 @@ import os
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
+from sqlalchemy import insert
+
 from models import db, SeedInventory
-from plant_database import PLANT_DATABASE
+from plant_database import get_plant_by_id
 
 # Common varieties for each plant, keyed by plant_id
 # Format: [(variety_name, dtm_override_or_None, notes), ...]
@@ -326,16 +328,19 @@ def populate_catalog():
         print(f"Existing global catalog entries: {existing_count}")
 
         # Build a set of existing (plant_id, variety) to avoid duplicates
-        existing = set()
-        for seed in SeedInventory.query.filter_by(is_global=True).all():
-            existing.add((seed.plant_id, seed.variety))
+        existing = set(
+            db.session.query(SeedInventory.plant_id, SeedInventory.variety)
+            .filter_by(is_global=True)
+            .all()
+        )
 
-        imported = 0
+        # Rows for one multi-row INSERT; catalog seeds need no ORM instances
+        rows = []
         skipped = 0
 
         for plant_id, varieties in VARIETIES.items():
             # Verify plant_id exists in PLANT_DATABASE
-            plant = next((p for p in PLANT_DATABASE if p['id'] == plant_id), None)
+            plant = get_plant_by_id(plant_id)
             if not plant:
                 print(f"  WARNING: {plant_id} not in PLANT_DATABASE, skipping")
                 continue
@@ -345,20 +350,21 @@ def populate_catalog():
                     skipped += 1
                     continue
 
-                seed = SeedInventory(
-                    user_id=None,  # Global catalog
-                    plant_id=plant_id,
-                    variety=variety_name,
-                    brand=None,
-                    quantity=0,
-                    is_global=True,
-                    days_to_maturity=dtm,
-                    notes=notes,
-                )
-                db.session.add(seed)
-                imported += 1
+                rows.append({
+                    'user_id': None,  # Global catalog
+                    'plant_id': plant_id,
+                    'variety': variety_name,
+                    'brand': None,
+                    'quantity': 0,
+                    'is_global': True,
+                    'days_to_maturity': dtm,
+                    'notes': notes,
+                })
 
+        if rows:
+            db.session.execute(insert(SeedInventory), rows)
         db.session.commit()
+        imported = len(rows)
         final_count = SeedInventory.query.filter_by(is_global=True).count()
         print(f"Imported: {imported} new varieties")
         print(f"Skipped: {skipped} (already existed)")
@@ -7,12 +7,21 @@ from pathlib import Path
 backend_dir = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(backend_dir))
 import sqlite3
+import os
 
 def add_row_number_column():
     conn = sqlite3.connect(os.path.join(backend_dir, 'instance', 'homestead.db'))
     cursor = conn.cursor()
 
     try:
+        # Check if column already exists
+        cursor.execute("PRAGMA table_info(planting_event)")
+        columns = {col[1] for col in cursor.fetchall()}
+
+        if 'row_number' in columns:
+            print("Column row_number already exists")
+            return
+
         # Add row_number column
         cursor.execute('''
             ALTER TABLE planting_event
@@ -22,12 +31,6 @@ def add_row_number_column():
         conn.commit()
         print("Successfully added row_number column to planting_event table")
 
-    except sqlite3.OperationalError as e:
-        if "duplicate column name" in str(e).lower():
-            print("Column row_number already exists")
-        else:
-            print(f"Error: {e}")
-            raise
     finally:
         conn.close()
 
@@ -45,7 +45,7 @@ def migrate():
     try:
         # Check if column already exists
         cursor.execute("PRAGMA table_info(garden_bed)")
-        columns = [col[1] for col in cursor.fetchall()]
+        columns = {col[1] for col in cursor.fetchall()}
 
         if 'season_extension' in columns:
             print("Column 'season_extension' already exists in garden_bed table")
@@ -35,13 +35,12 @@ def add_variety_column():
 
     with app.app_context():
         try:
-            # Check if variety column already exists
-            result = db.session.execute(text(
-                "SELECT COUNT(*) FROM pragma_table_info('planted_item') WHERE name='variety'"
-            ))
-            column_exists = result.scalar() > 0
+            # Check if variety column already exists (works on any database,
+            # unlike SQLite's pragma_table_info)
+            inspector = db.inspect(db.engine)
+            columns = {col['name'] for col in inspector.get_columns('planted_item')}
 
-            if column_exists:
+            if 'variety' in columns:
                 print("[OK] variety column already exists in planted_item table")
                 return
 
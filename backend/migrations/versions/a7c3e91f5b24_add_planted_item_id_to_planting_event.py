@@ -0,0 +1,48 @@
+"""Add planted_item_id to planting_event
+
+Revision ID: a7c3e91f5b24
+Revises: d3f8b61c2a07
+Create Date: 2026-10-17 14:12:40.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c3e91f5b24'
+down_revision = 'd3f8b61c2a07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('planting_event', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('planted_item_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_planting_event_planted_item', 'planted_item', ['planted_item_id'], ['id'], ondelete='SET NULL')
+        batch_op.create_index(batch_op.f('ix_planting_event_planted_item_id'), ['planted_item_id'], unique=False)
+
+    # Backfill with the match validate_planting_conflict() used to look up
+    # per check: the user's PlantedItem of the same plant at the same cell
+    op.execute(sa.text("""
+        UPDATE planting_event
+        SET planted_item_id = (
+            SELECT MIN(planted_item.id) FROM planted_item
+            WHERE planted_item.user_id = planting_event.user_id
+              AND planted_item.garden_bed_id = planting_event.garden_bed_id
+              AND planted_item.plant_id = planting_event.plant_id
+              AND planted_item.position_x = planting_event.position_x
+              AND planted_item.position_y = planting_event.position_y
+        )
+        WHERE planted_item_id IS NULL
+          AND garden_bed_id IS NOT NULL
+          AND position_x IS NOT NULL
+          AND position_y IS NOT NULL
+    """))
+
+
+def downgrade():
+    with op.batch_alter_table('planting_event', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_planting_event_planted_item_id'))
+        batch_op.drop_constraint('fk_planting_event_planted_item', type_='foreignkey')
+        batch_op.drop_column('planted_item_id')
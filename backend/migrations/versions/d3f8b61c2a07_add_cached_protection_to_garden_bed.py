@@ -0,0 +1,30 @@
+"""Add cached season extension protection columns to garden_bed
+
+Revision ID: d3f8b61c2a07
+Revises: 256f54bf5501
+Create Date: 2026-10-17 10:04:18.552917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3f8b61c2a07'
+down_revision = '256f54bf5501'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows stay NULL; validation falls back to parsing
+    # season_extension until the bed is next saved.
+    with op.batch_alter_table('garden_bed', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('protection_offset_cached', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('protection_type_cached', sa.String(length=100), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('garden_bed', schema=None) as batch_op:
+        batch_op.drop_column('protection_type_cached')
+        batch_op.drop_column('protection_offset_cached')
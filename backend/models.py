@@ -60,6 +60,9 @@ class GardenBed(db.Model):
     planning_method = db.Column(db.String(50), default='square-foot')  # square-foot, row, intensive, raised-bed, permaculture, container
     grid_size = db.Column(db.Integer, default=12)  # inches per grid cell (NOT cell count) - e.g., 12 = 1 foot squares
     season_extension = db.Column(db.Text)  # JSON: {type, layers, material, notes} - protection structure for season extension
+    # Protection offset derived from season_extension, refreshed on bed save (NULL = not yet computed)
+    protection_offset_cached = db.Column(db.Integer, nullable=True)
+    protection_type_cached = db.Column(db.String(100), nullable=True)
     soil_type = db.Column(db.String(20), default='loamy')  # sandy, loamy, clay
     mulch_type = db.Column(db.String(20), default='none')  # none, straw, wood-chips, leaves, grass, compost, black-plastic, clear-plastic
     zone = db.Column(db.String(10))  # Permaculture zone: zone0, zone1, zone2, zone3, zone4, zone5
@@ -172,6 +175,14 @@ class PlantingEvent(db.Model):
     position_y = db.Column(db.Integer)  # Grid Y coordinate (nullable)
     space_required = db.Column(db.Integer)  # Grid cells needed (nullable)
     conflict_override = db.Column(db.Boolean, default=False)  # User allowed conflict
+    # PlantedItem created together with this event; lets conflict checks
+    # exclude it without matching PlantedItems by bed, plant and position
+    planted_item_id = db.Column(
+        db.Integer,
+        db.ForeignKey('planted_item.id', ondelete='SET NULL'),
+        nullable=True,
+        index=True
+    )
 
     # Planting method: determines which fields are used
     planting_method = db.Column(db.String(50), default='individual_plants')  # 'individual_plants' or 'seed_density'
@@ -261,6 +272,7 @@ class PlantingEvent(db.Model):
 
     # Relationships
     user = db.relationship('User', backref='planting_events')
+    planted_item = db.relationship('PlantedItem', foreign_keys=[planted_item_id])
 
     def to_dict(self):
         return {
@@ -309,6 +321,7 @@ class PlantingEvent(db.Model):
             'trellisPositionEndInches': self.trellis_position_end_inches,
             'linearFeetAllocated': self.linear_feet_allocated,
             'exportKey': self.export_key,
+            'plantedItemId': self.planted_item_id,
             'isComplete': self.is_complete
         }
 
@@ -425,6 +425,7 @@ PLANT_DATABASE = [
         'transplant_soil_temp_min': None,
         'transplantWeeksBefore': 0,
         'weeksIndoors': 0,
+        'transplantOk': False,  # Taproot forks or bolts when moved; direct seed only
         
         'germination_days': 10,
         'ideal_seasons': ['spring', 'summer', 'fall'],
@@ -512,6 +513,7 @@ PLANT_DATABASE = [
         'transplant_soil_temp_min': None,
         'transplantWeeksBefore': 0,
         'weeksIndoors': 0,
+        'transplantOk': False,  # Taproot forks or bolts when moved; direct seed only
         
         'germination_days': 4,
         'ideal_seasons': ['spring', 'fall'],
@@ -1979,6 +1981,7 @@ PLANT_DATABASE = [
         'transplant_soil_temp_min': None,
         'transplantWeeksBefore': 0,
         'weeksIndoors': 0,
+        'transplantOk': False,  # Taproot forks or bolts when moved; direct seed only
         'germination_days': 5,
         'ideal_seasons': ['spring', 'fall'],
         'heat_tolerance': 'low',
@@ -3587,12 +3590,28 @@ COMPOST_MATERIALS = {
     'pine-needles': {'type': 'brown', 'cnRatio': 80}
 }
 
+# Plant lookup index, built once at import. PLANT_DATABASE is static for the
+# life of the process (edits go through the source file and a restart), so no
+# invalidation is needed. First occurrence wins, like the old linear scan.
+_PLANTS_BY_ID = {}
+for _plant in PLANT_DATABASE:
+    _PLANTS_BY_ID.setdefault(_plant['id'], _plant)
+del _plant
+
 def get_plant_by_id(plant_id):
     """Get plant details by ID"""
-    for plant in PLANT_DATABASE:
-        if plant['id'] == plant_id:
-            return plant
-    return None
+    try:
+        return _PLANTS_BY_ID.get(plant_id)
+    except TypeError:  # Unhashable ID from a malformed request body
+        return None
+
+def get_plants_by_ids(plant_ids):
+    """Get plant details for several IDs, keyed by plant ID"""
+    return {
+        plant_id: _PLANTS_BY_ID[plant_id]
+        for plant_id in plant_ids
+        if plant_id in _PLANTS_BY_ID
+    }
 
 def get_plants_by_category(category):
     """Get plants by category"""
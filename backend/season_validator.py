@@ -7,9 +7,13 @@ Checks if planting conditions are appropriate based on:
 """
 
 import logging
+from dataclasses import dataclass
 from datetime import datetime, date, timedelta
+
+import numpy as np
+
 from simulation_clock import get_now, get_today
-from plant_database import get_plant_by_id
+from plant_database import get_plant_by_id, get_plants_by_ids
 from soil_temperature import get_soil_temperature_with_adjustments
 from historical_soil_temp import get_historical_soil_temp_for_date, get_historical_daily_soil_temps, get_month_name
 from models import Property, db
@@ -17,6 +21,12 @@ from services.geocoding_service import geocoding_service
 
 logger = logging.getLogger(__name__)
 
+# Frost tolerance levels that need frost-free planting dates
+TENDER_FROST_TOLERANCES = ('very-tender', 'tender')
+
+# Sun exposure used for soil temperature adjustments
+DEFAULT_SUN_EXPOSURE = 'full-sun'  # Must match soil_temperature.py valid values
+
 
 def get_season_from_date(date: datetime) -> str:
     """Get season name from date (Northern Hemisphere)."""
@@ -182,243 +192,41 @@ def validate_planting_conditions(
 
     # 1. Check frost risk for tender plants
     frost_tolerance = plant.get('frostTolerance', 'half-hardy')
-    is_tender = frost_tolerance in ['very-tender', 'tender']
+    is_tender = frost_tolerance in TENDER_FROST_TOLERANCES
 
     if is_tender and last_frost_date and first_frost_date:
-        planting_month_day = (planting_date.month, planting_date.day)
-        last_frost_month_day = (last_frost_date.month, last_frost_date.day)
-        first_frost_month_day = (first_frost_date.month, first_frost_date.day)
-
-        # Check if planting before last spring frost
-        if planting_month_day < last_frost_month_day:
-            tolerance_label = get_frost_tolerance_label(frost_tolerance)
-
-            # If we have protection, adjust the warning
-            if protection_offset >= 15:
-                # Significant protection - change to info level
-                protection_label = protection_type or 'protection'
-                warnings.append({
-                    'type': 'frost_risk_protected',
-                    'message': f"Frost risk mitigated: {plant_name} is {tolerance_label} (last frost {last_frost_date.strftime('%B %d')}), but {protection_label} provides +{protection_offset}°F protection",
-                    'severity': 'info'
-                })
-            elif protection_offset > 0:
-                # Partial protection - still warning but mention protection
-                protection_label = protection_type or 'protection'
-                warnings.append({
-                    'type': 'frost_risk',
-                    'message': f"Frost risk: {plant_name} is {tolerance_label} (last frost {last_frost_date.strftime('%B %d')}). {protection_label} adds +{protection_offset}°F but may not be sufficient",
-                    'severity': 'warning'
-                })
-            else:
-                # No protection
-                warnings.append({
-                    'type': 'frost_risk',
-                    'message': f"Frost risk: {plant_name} is {tolerance_label} and your last frost is {last_frost_date.strftime('%B %d')}",
-                    'severity': 'warning'
-                })
-
-        # Check if planting after first fall frost
-        elif planting_month_day > first_frost_month_day:
-            tolerance_label = get_frost_tolerance_label(frost_tolerance)
-
-            # If we have protection, adjust the warning
-            if protection_offset >= 15:
-                protection_label = protection_type or 'protection'
-                warnings.append({
-                    'type': 'frost_risk_protected',
-                    'message': f"Frost risk mitigated: {plant_name} is {tolerance_label} (first frost {first_frost_date.strftime('%B %d')}), but {protection_label} provides +{protection_offset}°F protection",
-                    'severity': 'info'
-                })
-            elif protection_offset > 0:
-                protection_label = protection_type or 'protection'
-                warnings.append({
-                    'type': 'frost_risk',
-                    'message': f"Frost risk: {plant_name} is {tolerance_label} (first frost {first_frost_date.strftime('%B %d')}). {protection_label} adds +{protection_offset}°F but may not be sufficient",
-                    'severity': 'warning'
-                })
-            else:
-                warnings.append({
-                    'type': 'frost_risk',
-                    'message': f"Frost risk: {plant_name} is {tolerance_label} and your first frost is {first_frost_date.strftime('%B %d')}",
-                    'severity': 'warning'
-                })
+        frost_warning = _frost_risk_warning(
+            plant_name, frost_tolerance, planting_date, last_frost_date, first_frost_date,
+            protection_offset, protection_type
+        )
+        if frost_warning:
+            warnings.append(frost_warning)
 
     # 2. Check soil temperature (if we have coordinates)
     # Note: For transplants, soil temp requirements are less critical since plants are already established
     method_label = 'seeding' if planting_method == 'seed' else 'transplanting'
     if latitude and longitude:
-        # For direct seeding, use germination temp requirements
-        # For transplants, use a lower threshold (established plants are hardier)
-        if planting_method == 'seed':
-            soil_temp_min = plant.get('soil_temp_min') or plant.get('germinationTemp', {}).get('min')
-        else:
-            # Transplants can handle cooler soil - use ~80% of seed requirement (min 40°F)
-            # This keeps warm-season crops realistic (basil 70°F -> 56°F) while being lenient for cool-season
-            plant_min = plant.get('soil_temp_min') or plant.get('germinationTemp', {}).get('min')
-            soil_temp_min = max(40, plant_min * 0.8) if plant_min else 40
+        soil_temp_min = _soil_temp_requirement(plant, planting_method == 'seed')
 
         if soil_temp_min:
             try:
-                # Check if planting date is in the future (more than 1 day ahead)
-                today = get_today()
-                planting_day = planting_date.date() if hasattr(planting_date, 'date') else planting_date
-                days_until_planting = (planting_day - today).days
-
-                logger.info(f"Date check: today={today}, planting_day={planting_day}, days_until={days_until_planting}")
-
-                if days_until_planting > 1:
-                    # Future date: use historical daily averages for precision
-                    logger.info(f"Future planting date detected: {planting_day} ({days_until_planting} days ahead)")
-
-                    # Get daily averages for the planting month
-                    daily_averages = get_historical_daily_soil_temps(
-                        latitude=latitude,
-                        longitude=longitude,
-                        month=planting_day.month
-                    )
-
-                    if daily_averages:
-                        # Get the specific day's historical average
-                        day_of_month = planting_day.day
-                        avg_soil_temp = daily_averages.get(day_of_month)
-
-                        if avg_soil_temp is None:
-                            # Fallback to monthly average if specific day not available
-                            historical_data = get_historical_soil_temp_for_date(
-                                latitude=latitude,
-                                longitude=longitude,
-                                target_date=planting_day
-                            )
-                            if historical_data:
-                                avg_soil_temp = historical_data['average']
-                            else:
-                                avg_soil_temp = None
-
-                        if avg_soil_temp is not None:
-                            # Apply protection offset to effective temperature
-                            effective_temp = avg_soil_temp + protection_offset
-                            month_name = get_month_name(planting_day.month)
-
-                            if effective_temp < soil_temp_min:
-                                # Still too cold even with protection
-                                if protection_offset > 0:
-                                    protection_label = protection_type or 'protection'
-                                    warnings.append({
-                                        'type': 'soil_temp_low',
-                                        'message': f"Soil typically too cold for {method_label}: {plant_name} needs {soil_temp_min}°F, {month_name} {day_of_month} averages {avg_soil_temp:.0f}°F (~{effective_temp:.0f}°F with {protection_label}) (10-yr avg)",
-                                        'severity': 'warning'
-                                    })
-                                else:
-                                    warnings.append({
-                                        'type': 'soil_temp_low',
-                                        'message': f"Soil typically too cold for {method_label}: {plant_name} needs {soil_temp_min}°F, {month_name} {day_of_month} averages {avg_soil_temp:.0f}°F historically (10-yr avg)",
-                                        'severity': 'warning'
-                                    })
-                            elif avg_soil_temp < soil_temp_min and effective_temp >= soil_temp_min:
-                                # Protection makes it viable, but check if it's still marginal (not optimal)
-                                protection_label = protection_type or 'protection'
-
-                                # If effective temp is below optimal (min + 10°F), mark as marginal
-                                if effective_temp < soil_temp_min + 10:
-                                    warning_type = 'soil_temp_marginal'
-                                    message = f"Soil temp adequate for {method_label} with protection but marginal: {plant_name} needs {soil_temp_min}°F, {month_name} {day_of_month} averages {avg_soil_temp:.0f}°F but {protection_label} adds +{protection_offset}°F (~{effective_temp:.0f}°F)"
-                                else:
-                                    warning_type = 'soil_temp_protected'
-                                    message = f"Soil temp optimal for {method_label} with protection: {plant_name} needs {soil_temp_min}°F, {month_name} {day_of_month} averages {avg_soil_temp:.0f}°F and {protection_label} adds +{protection_offset}°F (~{effective_temp:.0f}°F)"
-
-                                warnings.append({
-                                    'type': warning_type,
-                                    'message': message,
-                                    'severity': 'info'
-                                })
-                            elif effective_temp < soil_temp_min + 5:
-                                # Marginal - average is close to minimum
-                                warnings.append({
-                                    'type': 'soil_temp_marginal',
-                                    'message': f"Marginal soil temp for {method_label}: {plant_name} needs {soil_temp_min}°F, {month_name} {day_of_month} averages {avg_soil_temp:.0f}°F (10-yr avg)",
-                                    'severity': 'info'
-                                })
-
-                            # Check for "too hot" conditions for cool-weather crops
-                            heat_tolerance = plant.get('heat_tolerance', 'medium')
-                            is_cool_weather_crop = heat_tolerance == 'low'
-
-                            if is_cool_weather_crop:
-                                max_acceptable_temp = soil_temp_min + 20  # Too hot threshold
-
-                                if avg_soil_temp > max_acceptable_temp:
-                                    # Protection doesn't help with heat - note this in message
-                                    warnings.append({
-                                        'type': 'soil_temp_high',
-                                        'message': f"Too hot: {plant_name} prefers cool weather. {month_name} {day_of_month} averages {avg_soil_temp:.0f}°F, exceeds optimal range (max {max_acceptable_temp:.0f}°F). May bolt or perform poorly (10-yr avg)",
-                                        'severity': 'warning'
-                                    })
-                    else:
-                        logger.warning(f"Could not fetch historical soil temp for {planting_day}")
-                else:
-                    # Today or tomorrow: use current measured soil temperature
-                    soil_temp_data = get_soil_temperature_with_adjustments(
-                        latitude=latitude,
-                        longitude=longitude,
-                        soil_type=soil_type,
-                        sun_exposure=sun_exposure,
-                        mulch_type='none'
-                    )
-
-                    current_soil_temp = soil_temp_data.get('final_soil_temp')
-
-                    if current_soil_temp:
-                        # Apply protection offset
-                        effective_temp = current_soil_temp + protection_offset
-
-                        if effective_temp < soil_temp_min:
-                            # Still too cold even with protection
-                            if protection_offset > 0:
-                                protection_label = protection_type or 'protection'
-                                warnings.append({
-                                    'type': 'soil_temp_low',
-                                    'message': f"Soil too cold for {method_label}: {plant_name} needs {soil_temp_min}°F, current is {current_soil_temp:.0f}°F (~{effective_temp:.0f}°F with {protection_label})",
-                                    'severity': 'warning'
-                                })
-                            else:
-                                warnings.append({
-                                    'type': 'soil_temp_low',
-                                    'message': f"Soil too cold for {method_label}: {plant_name} needs {soil_temp_min}°F soil, current is {current_soil_temp:.0f}°F",
-                                    'severity': 'warning'
-                                })
-                        elif current_soil_temp < soil_temp_min and effective_temp >= soil_temp_min:
-                            # Protection makes it viable, but check if it's still marginal (not optimal)
-                            protection_label = protection_type or 'protection'
-
-                            # If effective temp is below optimal (min + 10°F), mark as marginal
-                            if effective_temp < soil_temp_min + 10:
-                                warning_type = 'soil_temp_marginal'
-                                message = f"Soil temp adequate for {method_label} with protection but marginal: {plant_name} needs {soil_temp_min}°F, current is {current_soil_temp:.0f}°F but {protection_label} adds +{protection_offset}°F (~{effective_temp:.0f}°F)"
-                            else:
-                                warning_type = 'soil_temp_protected'
-                                message = f"Soil temp optimal for {method_label} with protection: {plant_name} needs {soil_temp_min}°F, current is {current_soil_temp:.0f}°F and {protection_label} adds +{protection_offset}°F (~{effective_temp:.0f}°F)"
-
-                            warnings.append({
-                                'type': warning_type,
-                                'message': message,
-                                'severity': 'info'
-                            })
-
-                        # Check for "too hot" conditions for cool-weather crops
-                        heat_tolerance = plant.get('heat_tolerance', 'medium')
-                        is_cool_weather_crop = heat_tolerance == 'low'
-
-                        if is_cool_weather_crop:
-                            max_acceptable_temp = soil_temp_min + 20  # Too hot threshold
-
-                            if current_soil_temp > max_acceptable_temp:
-                                # Protection doesn't help with heat - note this in message
-                                warnings.append({
-                                    'type': 'soil_temp_high',
-                                    'message': f"Too hot: {plant_name} prefers cool weather. Current soil temperature {current_soil_temp:.0f}°F exceeds optimal range (max {max_acceptable_temp:.0f}°F). May bolt or perform poorly",
-                                    'severity': 'warning'
-                                })
+                soil_temp, reading_day = _lookup_soil_temp(
+                    latitude, longitude, planting_date, soil_type, sun_exposure
+                )
+
+                if soil_temp is not None:
+                    # Apply protection offset to effective temperature
+                    effective_temp = soil_temp + protection_offset
+                    too_cold = effective_temp < soil_temp_min
+                    warnings.extend(_soil_temp_warnings(
+                        plant_name, method_label, soil_temp_min, soil_temp,
+                        protection_offset, protection_type, reading_day,
+                        too_cold=too_cold,
+                        protected=not too_cold and soil_temp < soil_temp_min,
+                        marginal=effective_temp < soil_temp_min + 5,
+                        too_hot=(plant.get('heat_tolerance', 'medium') == 'low'
+                                 and soil_temp > soil_temp_min + 20)
+                    ))
             except Exception as e:
                 # Don't fail validation if weather service is unavailable
                 logger.warning(f"Could not fetch soil temperature: {e}")
@@ -426,6 +234,236 @@ def validate_planting_conditions(
     return warnings
 
 
+
+def _method_ruled_out(plant: dict, planting_method: str) -> bool:
+    """
+    True when the plant's metadata says it can't be planted with this method.
+
+    Root crops whose taproot forks or bolts when moved (carrot, radish,
+    turnip) carry transplantOk: False; direct seeding is never ruled out.
+    """
+    if planting_method in ('seed', 'direct'):
+        return False
+    return plant.get('transplantOk') is False
+
+
+def _method_ruled_out_result(plant: dict, plant_id: str, planting_method: str) -> dict:
+    """Validation result for a method the plant doesn't support (no weather lookups)."""
+    message = f"{plant.get('name', plant_id)} does not transplant well; direct seed it instead"
+    return _validation_result(
+        [{'type': 'method_not_supported', 'message': message, 'severity': 'warning'}], None
+    )
+
+
+def _soil_temp_requirement(plant: dict, is_seed: bool):
+    """
+    Minimum soil temperature for seeding or transplanting a plant.
+
+    Direct seeding uses the germination minimum. Transplants can handle cooler
+    soil, so they use ~80% of the seed requirement (min 40°F). This keeps
+    warm-season crops realistic (basil 70°F -> 56°F) while being lenient for
+    cool-season crops.
+    """
+    plant_min = plant.get('soil_temp_min') or plant.get('germinationTemp', {}).get('min')
+    if is_seed:
+        return plant_min
+    return max(40, plant_min * 0.8) if plant_min else 40
+
+
+def _frost_risk_warning(
+    plant_name: str,
+    frost_tolerance: str,
+    planting_date: datetime,
+    last_frost_date: datetime,
+    first_frost_date: datetime,
+    protection_offset: int = 0,
+    protection_type: str = None
+):
+    """
+    Build the frost risk warning for a tender plant, or None if the planting
+    date falls inside the frost-free window.
+    """
+    planting_month_day = (planting_date.month, planting_date.day)
+
+    # Check if planting before last spring frost, then after first fall frost
+    if planting_month_day < (last_frost_date.month, last_frost_date.day):
+        frost_label = 'last frost'
+        frost_date = last_frost_date
+    elif planting_month_day > (first_frost_date.month, first_frost_date.day):
+        frost_label = 'first frost'
+        frost_date = first_frost_date
+    else:
+        return None
+
+    tolerance_label = get_frost_tolerance_label(frost_tolerance)
+    frost_day = frost_date.strftime('%B %d')
+    protection_label = protection_type or 'protection'
+
+    # If we have protection, adjust the warning
+    if protection_offset >= 15:
+        # Significant protection - change to info level
+        return {
+            'type': 'frost_risk_protected',
+            'message': f"Frost risk mitigated: {plant_name} is {tolerance_label} ({frost_label} {frost_day}), but {protection_label} provides +{protection_offset}°F protection",
+            'severity': 'info'
+        }
+    if protection_offset > 0:
+        # Partial protection - still warning but mention protection
+        return {
+            'type': 'frost_risk',
+            'message': f"Frost risk: {plant_name} is {tolerance_label} ({frost_label} {frost_day}). {protection_label} adds +{protection_offset}°F but may not be sufficient",
+            'severity': 'warning'
+        }
+    # No protection
+    return {
+        'type': 'frost_risk',
+        'message': f"Frost risk: {plant_name} is {tolerance_label} and your {frost_label} is {frost_day}",
+        'severity': 'warning'
+    }
+
+
+def _lookup_soil_temp(
+    latitude: float,
+    longitude: float,
+    planting_date: datetime,
+    soil_type: str = 'loamy',
+    sun_exposure: str = 'full'
+) -> tuple:
+    """
+    Look up the soil temperature that applies to a planting date.
+
+    Future dates (more than 1 day ahead) use the 10-year historical average
+    for that day of the month, falling back to the monthly average. Today or
+    tomorrow uses the current measured soil temperature.
+
+    Returns:
+        Tuple of (soil_temp or None, reading_day). reading_day is
+        (month_name, day_of_month) for historical readings, None for current.
+    """
+    today = get_today()
+    planting_day = planting_date.date() if hasattr(planting_date, 'date') else planting_date
+    days_until_planting = (planting_day - today).days
+
+    logger.info(f"Date check: today={today}, planting_day={planting_day}, days_until={days_until_planting}")
+
+    if days_until_planting > 1:
+        # Future date: use historical daily averages for precision
+        logger.info(f"Future planting date detected: {planting_day} ({days_until_planting} days ahead)")
+
+        # Get daily averages for the planting month
+        daily_averages = get_historical_daily_soil_temps(
+            latitude=latitude,
+            longitude=longitude,
+            month=planting_day.month
+        )
+        if not daily_averages:
+            logger.warning(f"Could not fetch historical soil temp for {planting_day}")
+            return None, None
+
+        # Get the specific day's historical average
+        day_of_month = planting_day.day
+        avg_soil_temp = daily_averages.get(day_of_month)
+
+        if avg_soil_temp is None:
+            # Fallback to monthly average if specific day not available
+            historical_data = get_historical_soil_temp_for_date(
+                latitude=latitude,
+                longitude=longitude,
+                target_date=planting_day
+            )
+            if historical_data:
+                avg_soil_temp = historical_data['average']
+
+        return avg_soil_temp, (get_month_name(planting_day.month), day_of_month)
+
+    # Today or tomorrow: use current measured soil temperature
+    soil_temp_data = get_soil_temperature_with_adjustments(
+        latitude=latitude,
+        longitude=longitude,
+        soil_type=soil_type,
+        sun_exposure=sun_exposure,
+        mulch_type='none'
+    )
+    current_soil_temp = soil_temp_data.get('final_soil_temp')
+    return (current_soil_temp or None), None
+
+
+def _soil_temp_warnings(
+    plant_name: str,
+    method_label: str,
+    soil_temp_min: float,
+    soil_temp: float,
+    protection_offset: int,
+    protection_type: str,
+    reading_day: tuple,
+    too_cold: bool,
+    protected: bool,
+    marginal: bool,
+    too_hot: bool
+) -> list:
+    """
+    Build soil temperature warnings from precomputed threshold flags.
+
+    Args:
+        too_cold: Effective temp (soil + protection) is below the minimum
+        protected: Soil is below the minimum but protection makes it viable
+        marginal: Effective temp is within 5°F of the minimum (historical only)
+        too_hot: Cool-weather crop and soil is more than 20°F above the minimum
+        reading_day: (month_name, day_of_month) for historical readings, None for current
+    """
+    warnings = []
+    effective_temp = soil_temp + protection_offset
+    protection_label = protection_type or 'protection'
+
+    if reading_day:
+        month_name, day_of_month = reading_day
+        reading = f"{month_name} {day_of_month} averages {soil_temp:.0f}°F"
+    else:
+        reading = f"current is {soil_temp:.0f}°F"
+
+    if too_cold:
+        # Still too cold even with protection
+        if reading_day:
+            if protection_offset > 0:
+                message = f"Soil typically too cold for {method_label}: {plant_name} needs {soil_temp_min}°F, {reading} (~{effective_temp:.0f}°F with {protection_label}) (10-yr avg)"
+            else:
+                message = f"Soil typically too cold for {method_label}: {plant_name} needs {soil_temp_min}°F, {reading} historically (10-yr avg)"
+        elif protection_offset > 0:
+            message = f"Soil too cold for {method_label}: {plant_name} needs {soil_temp_min}°F, {reading} (~{effective_temp:.0f}°F with {protection_label})"
+        else:
+            message = f"Soil too cold for {method_label}: {plant_name} needs {soil_temp_min}°F soil, {reading}"
+        warnings.append({'type': 'soil_temp_low', 'message': message, 'severity': 'warning'})
+    elif protected:
+        # Protection makes it viable, but check if it's still marginal (not optimal)
+        # If effective temp is below optimal (min + 10°F), mark as marginal
+        if effective_temp < soil_temp_min + 10:
+            warning_type = 'soil_temp_marginal'
+            message = f"Soil temp adequate for {method_label} with protection but marginal: {plant_name} needs {soil_temp_min}°F, {reading} but {protection_label} adds +{protection_offset}°F (~{effective_temp:.0f}°F)"
+        else:
+            warning_type = 'soil_temp_protected'
+            message = f"Soil temp optimal for {method_label} with protection: {plant_name} needs {soil_temp_min}°F, {reading} and {protection_label} adds +{protection_offset}°F (~{effective_temp:.0f}°F)"
+        warnings.append({'type': warning_type, 'message': message, 'severity': 'info'})
+    elif marginal and reading_day:
+        # Marginal - average is close to minimum
+        warnings.append({
+            'type': 'soil_temp_marginal',
+            'message': f"Marginal soil temp for {method_label}: {plant_name} needs {soil_temp_min}°F, {reading} (10-yr avg)",
+            'severity': 'info'
+        })
+
+    # Check for "too hot" conditions for cool-weather crops
+    # Protection doesn't help with heat - note this in message
+    if too_hot:
+        max_acceptable_temp = soil_temp_min + 20
+        if reading_day:
+            message = f"Too hot: {plant_name} prefers cool weather. {reading}, exceeds optimal range (max {max_acceptable_temp:.0f}°F). May bolt or perform poorly (10-yr avg)"
+        else:
+            message = f"Too hot: {plant_name} prefers cool weather. Current soil temperature {soil_temp:.0f}°F exceeds optimal range (max {max_acceptable_temp:.0f}°F). May bolt or perform poorly"
+        warnings.append({'type': 'soil_temp_high', 'message': message, 'severity': 'warning'})
+
+    return warnings
+
+
 def calculate_optimal_planting_dates(
     plant_name: str,
     soil_temp_min: float,
@@ -779,11 +817,305 @@ def validate_planting_for_property(
     Returns:
         Dictionary with valid (bool) and warnings (list)
     """
-    # Default coordinates (will be overridden by property or zipcode)
+    plant = get_plant_by_id(plant_id)
+    if plant and _method_ruled_out(plant, planting_method):
+        return _method_ruled_out_result(plant, plant_id, planting_method)
+
+    latitude, longitude, soil_type = _resolve_location(property_id, zipcode)
+    last_frost_date, first_frost_date = _parse_frost_dates(last_frost_str, first_frost_str)
+
+    # Run validation
+    warnings = validate_planting_conditions(
+        plant_id=plant_id,
+        planting_date=planting_date,
+        latitude=latitude,
+        longitude=longitude,
+        last_frost_date=last_frost_date,
+        first_frost_date=first_frost_date,
+        soil_type=soil_type,
+        sun_exposure=DEFAULT_SUN_EXPOSURE,
+        protection_offset=protection_offset,
+        protection_type=protection_type,
+        planting_method=planting_method
+    )
+
+    # Always generate suggestions when location is available
+    suggestion = None
+    if latitude and longitude:
+        suggestion = _planting_suggestion(
+            plant, plant_id, warnings, planting_date,
+            latitude, longitude, protection_offset, planting_method, last_frost_date
+        )
+
+    return _validation_result(warnings, suggestion)
+
+
+def validate_planting_for_property_batch(
+    plant_ids: list,
+    planting_date: datetime,
+    property_id: int = None,
+    zipcode: str = None,
+    last_frost_str: str = None,
+    first_frost_str: str = None,
+    protection_offset: int = 0,
+    protection_type: str = None,
+    planting_method: str = 'seed'
+) -> dict:
+    """
+    Validate planting conditions for many plants on the same date and location.
+
+    Produces the same per-plant result as validate_planting_for_property(), but
+    resolves the location, frost dates, and soil temperature once for the whole
+    batch and evaluates the per-plant soil temperature thresholds as NumPy
+    arrays. Used by the plant palette batch endpoint.
+
+    Returns:
+        Dictionary of plant_id -> {'valid', 'warnings', 'suggestion'}
+    """
+    ctx = _batch_context(
+        plant_ids, planting_date, property_id, zipcode,
+        last_frost_str, first_frost_str, protection_offset, protection_type
+    )
+    return _evaluate_batch(ctx, planting_method)
+
+
+def validate_planting_for_property_both_methods(
+    plant_ids: list,
+    planting_date: datetime,
+    property_id: int = None,
+    zipcode: str = None,
+    last_frost_str: str = None,
+    first_frost_str: str = None,
+    protection_offset: int = 0,
+    protection_type: str = None
+) -> dict:
+    """
+    Batch-validate plants for both direct seeding and transplanting.
+
+    Location, frost dates, frost risk, and the soil temperature reading do not
+    depend on the planting method, so they are resolved once and shared by
+    both evaluations.
+
+    Returns:
+        {'seed': {plant_id: result}, 'transplant': {plant_id: result}} where each
+        result matches validate_planting_for_property()
+    """
+    ctx = _batch_context(
+        plant_ids, planting_date, property_id, zipcode,
+        last_frost_str, first_frost_str, protection_offset, protection_type
+    )
+    return {
+        'seed': _evaluate_batch(ctx, 'seed'),
+        'transplant': _evaluate_batch(ctx, 'transplant'),
+    }
+
+
+def validate_planting_validity_both_methods(
+    plant_ids: list,
+    planting_date: datetime,
+    property_id: int = None,
+    zipcode: str = None,
+    last_frost_str: str = None,
+    first_frost_str: str = None,
+    protection_offset: int = 0,
+    protection_type: str = None
+) -> dict:
+    """
+    Validity-only variant of validate_planting_for_property_both_methods().
+
+    Skips warning messages and planting date suggestions and only reports
+    whether each plant would be valid, for callers that just grey out icons.
+
+    Returns:
+        Dictionary of plant_id -> {'seed': bool, 'transplant': bool}
+    """
+    ctx = _batch_context(
+        plant_ids, planting_date, property_id, zipcode,
+        last_frost_str, first_frost_str, protection_offset, protection_type
+    )
+    seed = _batch_validity(ctx, 'seed')
+    transplant = _batch_validity(ctx, 'transplant')
+    return {
+        plant_id: {'seed': seed.get(plant_id, True), 'transplant': transplant.get(plant_id, True)}
+        for plant_id in plant_ids
+    }
+
+
+@dataclass(frozen=True)
+class _BatchContext:
+    """Method-independent inputs shared by every plant in a validation batch."""
+    plant_ids: list
+    planting_date: datetime
+    latitude: float
+    longitude: float
+    last_frost_date: datetime
+    protection_offset: int
+    protection_type: str
+    plants_map: dict
+    known_ids: list
+    frost_warnings: dict
+    soil_temp: float
+    reading_day: tuple
+
+
+def _batch_context(
+    plant_ids: list,
+    planting_date: datetime,
+    property_id: int = None,
+    zipcode: str = None,
+    last_frost_str: str = None,
+    first_frost_str: str = None,
+    protection_offset: int = 0,
+    protection_type: str = None
+) -> _BatchContext:
+    """Resolve location, frost risk, and the soil reading for a batch once."""
+    latitude, longitude, soil_type = _resolve_location(property_id, zipcode)
+    last_frost_date, first_frost_date = _parse_frost_dates(last_frost_str, first_frost_str)
+
+    plants_map = get_plants_by_ids(plant_ids)
+    known_ids = [pid for pid in dict.fromkeys(plant_ids) if pid in plants_map]
+    plants = [plants_map[pid] for pid in known_ids]
+
+    # Frost risk for tender plants (the frost window is shared by every plant)
+    frost_warnings = {}
+    if plants and last_frost_date and first_frost_date:
+        tolerances = np.array([p.get('frostTolerance', 'half-hardy') for p in plants])
+        for i in np.flatnonzero(np.isin(tolerances, TENDER_FROST_TOLERANCES)):
+            plant = plants[i]
+            frost_warning = _frost_risk_warning(
+                plant.get('name', known_ids[i]), plant.get('frostTolerance', 'half-hardy'), planting_date,
+                last_frost_date, first_frost_date, protection_offset, protection_type
+            )
+            if frost_warning is None:
+                break  # Date is inside the frost-free window for every plant
+            frost_warnings[known_ids[i]] = frost_warning
+
+    # One soil temperature reading for the batch
+    soil_temp, reading_day = None, None
+    if plants and latitude and longitude:
+        try:
+            soil_temp, reading_day = _lookup_soil_temp(
+                latitude, longitude, planting_date, soil_type, DEFAULT_SUN_EXPOSURE
+            )
+        except Exception as e:
+            # Don't fail validation if weather service is unavailable
+            logger.warning(f"Could not fetch soil temperature: {e}")
+
+    return _BatchContext(
+        plant_ids=plant_ids,
+        planting_date=planting_date,
+        latitude=latitude,
+        longitude=longitude,
+        last_frost_date=last_frost_date,
+        protection_offset=protection_offset,
+        protection_type=protection_type,
+        plants_map=plants_map,
+        known_ids=known_ids,
+        frost_warnings=frost_warnings,
+        soil_temp=soil_temp,
+        reading_day=reading_day,
+    )
+
+
+def _evaluate_batch(ctx: _BatchContext, planting_method: str) -> dict:
+    """Apply one planting method's soil thresholds and suggestions to a batch."""
+    # Plants whose metadata rules out this method skip thresholds and suggestions
+    ruled_out = {
+        pid for pid in ctx.known_ids if _method_ruled_out(ctx.plants_map[pid], planting_method)
+    }
+    known_ids = [pid for pid in ctx.known_ids if pid not in ruled_out]
+    plants = [ctx.plants_map[pid] for pid in known_ids]
+    warnings_by_plant = {
+        pid: [dict(ctx.frost_warnings[pid])] if pid in ctx.frost_warnings else []
+        for pid in known_ids
+    }
+
+    # Soil temperature thresholds compared per plant against the shared reading
+    if plants and ctx.soil_temp is not None:
+        soil_temp = ctx.soil_temp
+        reading_day = ctx.reading_day
+        protection_offset = ctx.protection_offset
+        method_label = 'seeding' if planting_method == 'seed' else 'transplanting'
+        min_values = [_soil_temp_requirement(p, planting_method == 'seed') for p in plants]
+        mins = np.array([m if m else np.nan for m in min_values], dtype=float)
+        has_min = ~np.isnan(mins)
+
+        effective_temp = soil_temp + protection_offset
+        too_cold = has_min & (effective_temp < mins)
+        protected = has_min & ~too_cold & (soil_temp < mins)
+        marginal = has_min & (effective_temp < mins + 5)
+        cool_crop = np.array([p.get('heat_tolerance', 'medium') == 'low' for p in plants])
+        too_hot = has_min & cool_crop & (soil_temp > mins + 20)
+        flagged = too_cold | protected | (marginal if reading_day else False) | too_hot
+
+        for i in np.flatnonzero(flagged):
+            warnings_by_plant[known_ids[i]].extend(_soil_temp_warnings(
+                plants[i].get('name', known_ids[i]), method_label, min_values[i],
+                soil_temp, protection_offset, ctx.protection_type, reading_day,
+                too_cold=too_cold[i], protected=protected[i],
+                marginal=marginal[i], too_hot=too_hot[i]
+            ))
+
+    results = {}
+    for plant_id in ctx.plant_ids:
+        plant = ctx.plants_map.get(plant_id)
+        if plant_id in ruled_out:
+            results[plant_id] = _method_ruled_out_result(plant, plant_id, planting_method)
+            continue
+        warnings = warnings_by_plant.get(plant_id, [])
+        suggestion = None
+        if plant and ctx.latitude and ctx.longitude:
+            suggestion = _planting_suggestion(
+                plant, plant_id, warnings, ctx.planting_date, ctx.latitude, ctx.longitude,
+                ctx.protection_offset, planting_method, ctx.last_frost_date
+            )
+        results[plant_id] = _validation_result(warnings, suggestion)
+
+    return results
+
+
+def _batch_validity(ctx: _BatchContext, planting_method: str) -> dict:
+    """
+    Per-plant validity for one planting method, without building warnings.
+
+    Mirrors _evaluate_batch(): a plant is invalid when its metadata rules out
+    the method, it has a warning-severity frost risk, or the soil is too cold
+    (even with protection) or too hot.
+    """
+    ruled_out = {
+        pid for pid in ctx.known_ids if _method_ruled_out(ctx.plants_map[pid], planting_method)
+    }
+    known_ids = [pid for pid in ctx.known_ids if pid not in ruled_out]
+    invalid = np.array([
+        ctx.frost_warnings.get(pid, {}).get('severity') == 'warning' for pid in known_ids
+    ], dtype=bool)
+
+    if known_ids and ctx.soil_temp is not None:
+        plants = [ctx.plants_map[pid] for pid in known_ids]
+        min_values = [_soil_temp_requirement(p, planting_method == 'seed') for p in plants]
+        mins = np.array([m if m else np.nan for m in min_values], dtype=float)
+        has_min = ~np.isnan(mins)
+        cool_crop = np.array([p.get('heat_tolerance', 'medium') == 'low' for p in plants])
+
+        too_cold = has_min & (ctx.soil_temp + ctx.protection_offset < mins)
+        too_hot = has_min & cool_crop & (ctx.soil_temp > mins + 20)
+        invalid |= too_cold | too_hot
+
+    validity = {pid: False for pid in ctx.known_ids if pid in ruled_out}
+    validity.update((pid, not bool(flag)) for pid, flag in zip(known_ids, invalid))
+    return validity
+
+
+def _resolve_location(property_id: int = None, zipcode: str = None) -> tuple:
+    """
+    Resolve coordinates and soil type from a property, falling back to zipcode.
+
+    Returns:
+        Tuple of (latitude or None, longitude or None, soil_type)
+    """
     latitude = None
     longitude = None
     soil_type = 'loamy'
-    sun_exposure = 'full-sun'  # Must match soil_temperature.py valid values
 
     # Priority 1: Load property data if available
     if property_id:
@@ -799,113 +1131,91 @@ def validate_planting_for_property(
     # Priority 2: Use zipcode if no property coordinates
     if zipcode and not (latitude and longitude):
         try:
-            geo_result = geocoding_service.validate_address(zipcode)
-            if geo_result:
-                latitude = geo_result['latitude']
-                longitude = geo_result['longitude']
+            coords = geocoding_service.get_zipcode_coordinates(zipcode)
+            if coords:
+                latitude, longitude = coords
         except Exception as e:
             logger.warning(f"Could not geocode zipcode {zipcode}: {e}")
 
-    # Parse frost dates
+    return latitude, longitude, soil_type
+
+
+def _parse_frost_dates(last_frost_str: str = None, first_frost_str: str = None) -> tuple:
+    """Parse YYYY-MM-DD frost date strings, returning None for missing or invalid values."""
     last_frost_date = None
     first_frost_date = None
 
     if last_frost_str:
         try:
-            last_frost_date = datetime.strptime(last_frost_str, '%Y-%m-%d')
+            last_frost_date = datetime.fromisoformat(last_frost_str)
         except ValueError:
             pass
 
     if first_frost_str:
         try:
-            first_frost_date = datetime.strptime(first_frost_str, '%Y-%m-%d')
+            first_frost_date = datetime.fromisoformat(first_frost_str)
         except ValueError:
             pass
 
-    # Run validation
-    warnings = validate_planting_conditions(
-        plant_id=plant_id,
-        planting_date=planting_date,
-        latitude=latitude,
-        longitude=longitude,
-        last_frost_date=last_frost_date,
-        first_frost_date=first_frost_date,
-        soil_type=soil_type,
-        sun_exposure=sun_exposure,
-        protection_offset=protection_offset,
-        protection_type=protection_type,
-        planting_method=planting_method
-    )
+    return last_frost_date, first_frost_date
 
-    # Only count 'warning' severity as invalid, not 'info' (marginal conditions)
-    blocking_warnings = [w for w in warnings if w.get('severity') == 'warning']
 
-    # Generate date suggestions to show optimal planting windows
-    # Always generate suggestions when we have location data, not just when there are warnings
-    # This shows users the best planting times even if current date is "acceptable"
-    suggestion = None
+def _planting_suggestion(
+    plant: dict,
+    plant_id: str,
+    warnings: list,
+    planting_date: datetime,
+    latitude: float,
+    longitude: float,
+    protection_offset: int,
+    planting_method: str,
+    last_frost_date: datetime
+):
+    """
+    Generate date suggestions to show optimal planting windows.
+
+    Suggestions are generated whenever we have location data, not just when
+    there are warnings. This shows users the best planting times even if the
+    current date is "acceptable".
+    """
+    if not plant:
+        return None
+
+    plant_name = plant.get('name', plant_id)
+
+    # Get soil temp requirement based on planting method
+    # Note: Frontend may send 'direct' or 'seed' for direct seeding
+    soil_temp_min = _soil_temp_requirement(plant, planting_method in ('seed', 'direct'))
+    if not soil_temp_min:
+        return None
 
-    has_cold_warning = any(
-        w.get('type') in ['soil_temp_marginal', 'soil_temp_low']
-        for w in warnings
-    )
     has_hot_warning = any(
         w.get('type') == 'soil_temp_high'
         for w in warnings
     )
 
-    # Always generate suggestions when location is available
-    if latitude and longitude:
-        # Get plant data to extract requirements
-        plant = get_plant_by_id(plant_id)
-        if plant:
-            plant_name = plant.get('name', plant_id)
-            heat_tolerance = plant.get('heat_tolerance', 'medium')
-            is_cool_weather_crop = heat_tolerance == 'low'
-
-            # Get soil temp requirement based on planting method
-            # Note: Frontend may send 'direct' or 'seed' for direct seeding
-            if planting_method in ('seed', 'direct'):
-                soil_temp_min = plant.get('soil_temp_min') or plant.get('germinationTemp', {}).get('min')
-            else:
-                plant_min = plant.get('soil_temp_min') or plant.get('germinationTemp', {}).get('min')
-                soil_temp_min = max(40, plant_min * 0.8) if plant_min else 40
-
-            if soil_temp_min:
-                # Determine which calculation to use:
-                # - If there's a "too hot" warning, use calculate_cooler_planting_dates (find cooler windows)
-                # - Otherwise, use calculate_optimal_planting_dates (find when soil warms up)
-                if has_hot_warning:
-                    # Too hot now: find cooler planting dates (earlier spring or fall)
-                    suggestion = calculate_cooler_planting_dates(
-                        plant_name=plant_name,
-                        soil_temp_min=soil_temp_min,
-                        latitude=latitude,
-                        longitude=longitude,
-                        current_date=planting_date,
-                        protection_offset=protection_offset,
-                        plant_id=plant_id,
-                        planting_method=planting_method,
-                        last_frost_date=last_frost_date.date() if last_frost_date else None,
-                        frost_tolerance=plant.get('frostTolerance')
-                    )
-                else:
-                    # Not too hot: find optimal planting dates (when soil warms up enough)
-                    suggestion = calculate_optimal_planting_dates(
-                        plant_name=plant_name,
-                        soil_temp_min=soil_temp_min,
-                        latitude=latitude,
-                        longitude=longitude,
-                        current_date=planting_date,
-                        protection_offset=protection_offset,
-                        plant_id=plant_id,
-                        planting_method=planting_method,
-                        last_frost_date=last_frost_date.date() if last_frost_date else None,
-                        frost_tolerance=plant.get('frostTolerance')
-                    )
+    # Determine which calculation to use:
+    # - If there's a "too hot" warning, use calculate_cooler_planting_dates (find cooler windows)
+    # - Otherwise, use calculate_optimal_planting_dates (find when soil warms up)
+    calculate_dates = calculate_cooler_planting_dates if has_hot_warning else calculate_optimal_planting_dates
+    return calculate_dates(
+        plant_name=plant_name,
+        soil_temp_min=soil_temp_min,
+        latitude=latitude,
+        longitude=longitude,
+        current_date=planting_date,
+        protection_offset=protection_offset,
+        plant_id=plant_id,
+        planting_method=planting_method,
+        last_frost_date=last_frost_date.date() if last_frost_date else None,
+        frost_tolerance=plant.get('frostTolerance')
+    )
+
 
+def _validation_result(warnings: list, suggestion) -> dict:
+    """Shape a validation result. Only 'warning' severity blocks planting, not 'info'."""
     return {
-        'valid': len(blocking_warnings) == 0,
+        'valid': not any(w.get('severity') == 'warning' for w in warnings),
         'warnings': warnings,
         'suggestion': suggestion
     }
@@ -4,7 +4,7 @@ Conflict Service Layer
 Business logic for conflict detection and validation.
 Wraps the conflict_checker module with a clean service interface.
 """
-from conflict_checker import has_conflict, validate_planting_conflict, get_primary_planting_date
+from conflict_checker import has_conflicts_batch, validate_planting_conflict, get_primary_planting_date
 from models import PlantingEvent, GardenBed
 
 
@@ -42,44 +42,41 @@ def find_conflicts_in_bed(bed_id, user_id):
     Returns:
         list[dict]: List of conflict objects with details
     """
+    garden_bed = GardenBed.query.get(bed_id)
+    if not garden_bed:
+        return []
+
     # Get all planting events in the bed
     events = PlantingEvent.query.filter_by(
         garden_bed_id=bed_id,
         user_id=user_id
     ).all()
 
-    conflicts = []
+    # Check every event against all others in one vectorized pass
+    results = has_conflicts_batch(events, events, garden_bed)
+    position_of = {event.id: i for i, event in enumerate(events)}
 
-    # Check each event against all others
+    conflicts = []
     for i, event1 in enumerate(events):
-        start_date1 = get_primary_planting_date(event1)
-        if not start_date1 or not event1.expected_harvest_date:
-            continue
-
-        for event2 in events[i+1:]:
-            start_date2 = get_primary_planting_date(event2)
-            if not start_date2 or not event2.expected_harvest_date:
+        for conflict in results[i]['conflicts']:
+            j = position_of[conflict['eventId']]
+            if j <= i:  # Each pair is reported by both events; keep one
                 continue
-
-            # Check for conflict
-            if has_conflict(
-                event1.position_x, event1.position_y,
-                start_date1, event1.expected_harvest_date,
-                event2.position_x, event2.position_y,
-                start_date2, event2.expected_harvest_date
-            ):
-                conflicts.append({
-                    'event1_id': event1.id,
-                    'event1_plant': event1.plant_id,
-                    'event1_variety': event1.variety,
-                    'event1_position': (event1.position_x, event1.position_y),
-                    'event1_dates': (start_date1.isoformat(), event1.expected_harvest_date.isoformat()),
-                    'event2_id': event2.id,
-                    'event2_plant': event2.plant_id,
-                    'event2_variety': event2.variety,
-                    'event2_position': (event2.position_x, event2.position_y),
-                    'event2_dates': (start_date2.isoformat(), event2.expected_harvest_date.isoformat())
-                })
+            event2 = events[j]
+            start_date1 = get_primary_planting_date(event1)
+            start_date2 = get_primary_planting_date(event2)
+            conflicts.append({
+                'event1_id': event1.id,
+                'event1_plant': event1.plant_id,
+                'event1_variety': event1.variety,
+                'event1_position': (event1.position_x, event1.position_y),
+                'event1_dates': (start_date1.isoformat(), event1.expected_harvest_date.isoformat()),
+                'event2_id': event2.id,
+                'event2_plant': event2.plant_id,
+                'event2_variety': event2.variety,
+                'event2_position': (event2.position_x, event2.position_y),
+                'event2_dates': (start_date2.isoformat(), event2.expected_harvest_date.isoformat())
+            })
 
     return conflicts
 
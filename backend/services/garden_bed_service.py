@@ -6,7 +6,8 @@ This service can safely import models (unlike utils/).
 """
 from datetime import datetime
 import json
-from models import db, GardenBed, PlantingEvent
+from models import db, GardenBed, PlantedItem, PlantingEvent
+from services.planting_service import unlink_planting_events
 
 
 def get_mulch_type_on_date(garden_bed_id, user_id, query_date):
@@ -149,6 +150,8 @@ def delete_garden_bed(bed_id, user_id):
         return False, {'error': 'Garden bed not found'}
 
     try:
+        # The bed's PlantedItems are deleted with it (cascade)
+        unlink_planting_events(db.select(PlantedItem.id).filter_by(garden_bed_id=bed.id))
         db.session.delete(bed)
         db.session.commit()
         return True, {'message': 'Garden bed deleted successfully'}
@@ -5,7 +5,13 @@ Supports Geocodio and Google Maps Geocoding APIs.
 
 import requests
 import os
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Tuple
+
+
+# Zipcode coordinates never change, so successful lookups are kept for the
+# life of the process (bounded; oldest entries are evicted first).
+ZIPCODE_CACHE_MAX_ENTRIES = 4096
 
 
 class GeocodingService:
@@ -14,6 +20,10 @@ class GeocodingService:
     def __init__(self):
         self.api_key = os.environ.get('GEOCODING_API_KEY')
         self.provider = os.environ.get('GEOCODING_PROVIDER', 'geocodio')  # or 'google'
+        self._zipcode_coords_cache = {}
+        # The service is a shared singleton; guard eviction against
+        # concurrent requests
+        self._zipcode_coords_lock = threading.Lock()
 
         if not self.api_key:
             print("WARNING: GEOCODING_API_KEY not set in environment variables")
@@ -44,6 +54,36 @@ class GeocodingService:
             return self._google_lookup(address)
         return None
 
+    def get_zipcode_coordinates(self, zipcode: str) -> Optional[Tuple[float, float]]:
+        """
+        Get (latitude, longitude) for a zipcode, caching successful lookups.
+
+        Failed lookups are not cached, so a transient API error is retried on
+        the next call. API exceptions propagate the same as validate_address().
+
+        Args:
+            zipcode: ZIP code (or any address string) to geocode
+
+        Returns:
+            Tuple of (latitude, longitude), or None if not found
+        """
+        with self._zipcode_coords_lock:
+            coords = self._zipcode_coords_cache.get(zipcode)
+        if coords is not None:
+            return coords
+
+        result = self.validate_address(zipcode)
+        if not result:
+            return None
+
+        coords = (result['latitude'], result['longitude'])
+        with self._zipcode_coords_lock:
+            self._zipcode_coords_cache.pop(zipcode, None)
+            if len(self._zipcode_coords_cache) >= ZIPCODE_CACHE_MAX_ENTRIES:
+                self._zipcode_coords_cache.pop(next(iter(self._zipcode_coords_cache)))
+            self._zipcode_coords_cache[zipcode] = coords
+        return coords
+
     def _zipcode_fallback(self, zipcode: str) -> Optional[Dict[str, Any]]:
         """
         Fallback zipcode lookup for common US zipcodes (no API key needed)
@@ -124,6 +124,7 @@ def create_single_planting(user_id, data):
                 db.session.rollback()
                 return False, error_response
 
+        planting_event.planted_item = item
         db.session.add(planting_event)
         db.session.commit()
 
@@ -286,6 +287,7 @@ def create_batch_plantings(user_id, data):
                     db.session.rollback()
                     return False, error_response
 
+            planting_event.planted_item = item
             db.session.add(planting_event)
             created_items.append(item)
 
@@ -362,6 +364,21 @@ def update_planted_item(item_id, user_id, data):
         return False, {'error': str(e)}
 
 
+def unlink_planting_events(item_ids):
+    """
+    Clear PlantingEvent.planted_item_id for PlantedItems about to be deleted.
+
+    The column's ON DELETE SET NULL is not enforced on SQLite (foreign keys
+    are off), so every path that deletes PlantedItems calls this first.
+
+    Args:
+        item_ids: PlantedItem IDs, as a list or a select of PlantedItem.id
+    """
+    PlantingEvent.query.filter(
+        PlantingEvent.planted_item_id.in_(item_ids)
+    ).update({PlantingEvent.planted_item_id: None}, synchronize_session=False)
+
+
 def delete_planted_item(item_id, user_id):
     """
     Delete a planted item.
@@ -378,6 +395,7 @@ def delete_planted_item(item_id, user_id):
         return False, {'error': 'Planted item not found'}
 
     try:
+        unlink_planting_events([item.id])
         db.session.delete(item)
         db.session.commit()
         return True, {'message': 'Planted item deleted successfully'}
@@ -100,13 +100,12 @@ def calculate_space_requirement(plant_id, grid_size=12, planning_method='row'):
             # Standard plant-based calculation
             spacing = plant.get('spacing', 12)
             row_spacing = plant.get('rowSpacing', None)
-            mg_spacing = get_migardener_spacing(plant_id, spacing, row_spacing)
+            row_spacing_val, plant_spacing = get_migardener_spacing(plant_id, spacing, row_spacing)
 
             # Calculate cells based on tighter spacing
-            plant_cells = math.ceil(mg_spacing['plant_spacing'] / grid_size)
+            plant_cells = math.ceil(plant_spacing / grid_size)
 
             # Handle broadcast mode (null rowSpacing)
-            row_spacing_val = mg_spacing.get('row_spacing')
             if row_spacing_val is None or row_spacing_val == 0:
                 # Broadcast/intensive planting: space equally in all directions
                 return plant_cells * plant_cells
@@ -2,11 +2,11 @@
 Square Foot Gardening (SFG) Spacing Calculator
 
 Calculates how many grid cells a plant needs in a Square Foot Gardening bed.
-Uses the existing SFG_SPACING dictionary from garden_methods.py which contains
-Mel Bartholomew's official spacing guidelines.
+Uses the existing SFG_SPACING table from garden_methods.py (via its flat
+SFG_QUANTITY form) which contains Mel Bartholomew's official spacing guidelines.
 """
 
-from garden_methods import SFG_SPACING
+from garden_methods import SFG_QUANTITY
 
 
 def get_sfg_cells_required(plant_id):
@@ -45,19 +45,19 @@ def get_sfg_cells_required(plant_id):
         base_plant = plant_id
 
     # First pass: Look for exact matches (highest priority)
-    for plants_per_square, plant_list in SFG_SPACING.items():
-        if base_plant in plant_list:
-            return 1.0 / plants_per_square
+    plants_per_square = SFG_QUANTITY.get(base_plant)
+    if plants_per_square is not None:
+        return 1.0 / plants_per_square
 
     # Second pass: Look for prefix matches (e.g., 'lettuce-leaf' contains 'lettuce')
     # Only match if pattern starts with base_plant (not vice versa)
     # This prevents 'lettuce' matching 'lettuce-head' which is a different variety
-    for plants_per_square, plant_list in SFG_SPACING.items():
-        for plant_pattern in plant_list:
-            # Only match if the pattern contains the base plant as a prefix
-            # e.g., 'lettuce-leaf' matches 'lettuce' but 'lettuce-head' doesn't
-            if plant_pattern.startswith(base_plant + '-') or plant_pattern == base_plant:
-                return 1.0 / plants_per_square
+    prefix = base_plant + '-'
+    for plant_pattern, plants_per_square in SFG_QUANTITY.items():
+        # Only match if the pattern contains the base plant as a prefix
+        # e.g., 'lettuce-leaf' matches 'lettuce' but 'lettuce-head' doesn't
+        if plant_pattern.startswith(prefix):
+            return 1.0 / plants_per_square
 
     # Default: 1 cell per plant for unknown plants (standard SFG spacing)
     return 1.0
@@ -19,6 +19,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import pytest
 from flask import Flask
 from models import db as _db, User, GardenBed, GardenPlan, TrellisStructure
+from frost_date_lookup import clear_frost_date_cache
 from werkzeug.security import generate_password_hash
 
 
@@ -45,8 +46,10 @@ def db_session(app):
     Per-test database session.
 
     Drops then recreates all tables before each test to guarantee full
-    isolation, even if a previous test's teardown was incomplete.
+    isolation, even if a previous test's teardown was incomplete. Cached
+    frost dates are dropped too, since user IDs repeat across tests.
     """
+    clear_frost_date_cache()
     with app.app_context():
         _db.drop_all()
         _db.create_all()
@@ -151,6 +154,7 @@ def sample_plan(db_session, sample_user):
 # =====================================================================
 
 from flask_login import LoginManager
+from utils.json_provider import OrjsonProvider
 
 
 @pytest.fixture(scope='session')
@@ -162,6 +166,7 @@ def full_app():
     Flask-Login so ``@login_required`` / ``@admin_required`` decorators work.
     """
     test_app = Flask(__name__)
+    test_app.json = OrjsonProvider(test_app)
     test_app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
     test_app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     test_app.config['TESTING'] = True
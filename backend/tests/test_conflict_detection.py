@@ -2,9 +2,9 @@
 Tests for conflict detection module (conflict_checker.py).
 
 Covers spatial overlap, temporal overlap, sun exposure compatibility,
-date helpers, the composite has_conflict() function, planted_item_to_event
-conversion, query_candidate_items DB queries, and the full
-validate_planting_conflict pipeline.
+date helpers, the composite has_conflict() function, the per-bed BedIndex,
+planted_item_to_event conversion, query_candidate_items DB queries, and the
+full validate_planting_conflict pipeline.
 
 Maps to manual test cases CONF-01 through CONF-08 from TEST_GAP_REPORT.md.
 """
@@ -14,20 +14,28 @@ import os
 import math
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 
 # Ensure backend/ is on sys.path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from conflict_checker import (
+    BedConflictIndex,
     check_spatial_overlap,
+    check_spatial_overlap_cells,
     check_temporal_overlap,
     check_sun_exposure_compatibility,
+    build_bed_index,
+    clear_spacing_cache,
     get_in_ground_date,
     get_primary_planting_date,
     has_conflict,
+    has_conflicts_batch,
     planted_item_to_event,
+    query_candidate_index,
     query_candidate_items,
+    query_candidate_items_by_bed,
     validate_planting_conflict,
 )
 
@@ -135,6 +143,21 @@ class TestCheckSpatialOverlap:
         # 24" spacing → required=2, distance (0,0)→(2,0) = 2, 2 < 2 → False
         assert check_spatial_overlap((0, 0), (2, 0), 24, 12, 12) is False
 
+    def test_precomputed_cells_match(self):
+        """check_spatial_overlap_cells() agrees with the spacing-based check."""
+        for pos_b in [(0, 0), (1, 0), (2, 1), (3, 3)]:
+            for spacing_a, spacing_b in [(12, 12), (24, 6), (36, 12), (0, 0)]:
+                required = max(math.ceil(spacing_a / 12), math.ceil(spacing_b / 12))
+                assert (check_spatial_overlap_cells((0, 0), pos_b, required)
+                        == check_spatial_overlap((0, 0), pos_b, spacing_a, spacing_b, 12))
+
+    def test_fractional_spacing_rounds_up(self):
+        """Fractional spacings and positions use the same ceiling as math.ceil."""
+        # ceil(12.5/12)=2: distance 1.5 < 2 → conflict; ceil(11.5/12)=1 → none
+        assert check_spatial_overlap((0, 0), (1.5, 0.5), 12.5, 4.5, 12) is True
+        assert check_spatial_overlap((0, 0), (1.5, 0.5), 11.5, 4.5, 12) is False
+        assert check_spatial_overlap((2, 2), (0.5, 2), 18, 3, 9) is True
+
 
 # =====================================================================
 # Class 2: TestCheckTemporalOverlap  (pure function — no DB)
@@ -208,6 +231,20 @@ class TestCheckTemporalOverlap:
             '2026-06-01T00:00:00Z', '2026-09-01T00:00:00Z'
         ) is True
 
+    def test_same_day_with_times_not_conflict(self):
+        """Harvest and planting on the same day at different times → no conflict."""
+        assert check_temporal_overlap(
+            datetime(2026, 4, 1), datetime(2026, 6, 15, 17, 30),
+            datetime(2026, 6, 15, 9, 0), datetime(2026, 9, 1)
+        ) is False
+
+    def test_aware_and_naive_dates_compare(self):
+        """Request dates with a Z suffix compare with naive stored dates."""
+        assert check_temporal_overlap(
+            '2026-06-01T00:00:00Z', '2026-09-01T00:00:00Z',
+            datetime(2026, 4, 1), datetime(2026, 7, 1)
+        ) is True
+
     def test_year_long_overlap(self):
         """Year-long range overlaps any sub-range."""
         assert check_temporal_overlap(
@@ -313,6 +350,13 @@ class TestGetInGroundDate:
         )
         assert get_primary_planting_date(event) == datetime(2026, 3, 1)
 
+    def test_primary_planting_date_dict_interface(self):
+        """get_primary_planting_date falls back to seedStartDate on dicts."""
+        assert get_primary_planting_date({'seedStartDate': datetime(2026, 3, 1)}) == datetime(2026, 3, 1)
+        assert get_primary_planting_date({'directSeedDate': datetime(2026, 5, 1),
+                                          'seedStartDate': datetime(2026, 3, 1)}) == datetime(2026, 5, 1)
+        assert get_in_ground_date({'seedStartDate': datetime(2026, 3, 1)}) is None
+
     def test_in_ground_excludes_seed_start(self):
         """get_in_ground_date does NOT return seed_start_date."""
         event = _make_event(
@@ -350,6 +394,7 @@ class TestHasConflict:
         result = has_conflict(new, existing, bed)
         assert result['has_conflict'] is True
         assert len(result['conflicts']) == 1
+        assert result['conflicts'][0]['dates'] == '2026-04-01 to 2026-07-01'
 
     def test_same_cell_non_overlapping_dates(self):
         """Same cell, sequential dates → no conflict."""
@@ -500,6 +545,36 @@ class TestHasConflict:
         assert result['has_conflict'] is False
         assert result['conflicts'] == []
 
+    def test_batch_matches_has_conflict(self):
+        """has_conflicts_batch() returns one has_conflict() result per new event."""
+        rng = np.random.default_rng(7)
+        bed = _make_bed(id=1, sun_exposure='shade')
+        plants = ['tomato-1', 'lettuce-1', 'pepper-1', 'squash-1', 'fake-99']
+
+        def random_event(event_id):
+            start = datetime(2026, 3, 1) + timedelta(days=int(rng.integers(0, 120)))
+            return _make_event(
+                id=event_id,
+                position_x=int(rng.integers(0, 8)), position_y=int(rng.integers(0, 8)),
+                garden_bed_id=int(rng.choice([1, 1, 1, 2])),
+                plant_id=str(rng.choice(plants)),
+                transplant_date=start,
+                expected_harvest_date=start + timedelta(days=int(rng.integers(20, 90))),
+            )
+
+        existing = [random_event(i) for i in range(1, 150)]
+        new_events = [random_event(None) for _ in range(300)] + existing[:20]
+        new_events.append(_make_event(garden_bed_id=1, plant_id='tomato-1'))
+
+        expected = [has_conflict(new, existing, bed) for new in new_events]
+        assert has_conflicts_batch(new_events, existing, bed) == expected
+        assert any(result['has_conflict'] for result in expected)
+
+        index = build_bed_index(existing, bed)
+        same_bed = [new for new in new_events if new.garden_bed_id == 1]
+        assert (has_conflicts_batch(same_bed, index, bed)
+                == [has_conflict(new, index, bed) for new in same_bed])
+
 
 # =====================================================================
 # Class 6: TestPlantedItemToEvent  (needs DB for PlantedItem model)
@@ -604,6 +679,27 @@ class TestPlantedItemToEvent:
         # in_ground = transplant(None) or planted(May 1) = May 1
         assert event.expected_harvest_date == planted + timedelta(days=70)
 
+    def test_preresolved_plants(self, db_session, sample_user, sample_bed):
+        """A batch's {plant_id: plant} map gives the same DTM-based end date."""
+        from models import PlantedItem
+        from plant_database import get_plants_by_ids
+
+        item = PlantedItem(
+            user_id=sample_user.id,
+            plant_id='tomato-1',
+            garden_bed_id=sample_bed.id,
+            position_x=0,
+            position_y=0,
+            planted_date=datetime(2026, 5, 1),
+        )
+        db_session.add(item)
+        db_session.flush()
+
+        event = planted_item_to_event(item, get_plants_by_ids(['tomato-1']))
+        assert event.expected_harvest_date == planted_item_to_event(item).expected_harvest_date
+        # Plants missing from the map fall back to a 60 day DTM
+        assert planted_item_to_event(item, {}).expected_harvest_date == datetime(2026, 6, 30)
+
 
 # =====================================================================
 # Class 7: TestValidatePlantingConflict  (full DB pipeline)
@@ -790,6 +886,90 @@ class TestValidatePlantingConflict:
         assert valid is True
         assert err is None
 
+    def test_exclude_event_id_uses_linked_item(self, db_session, sample_user, sample_bed):
+        """exclude_event_id excludes the PlantedItem the event records, else a position match."""
+        from models import PlantingEvent
+        item = self._place_item(
+            db_session, sample_user, sample_bed,
+            'tomato-1', 0, 0,
+            planted=datetime(2026, 4, 1),
+            transplant=datetime(2026, 5, 1),
+            harvest=datetime(2026, 8, 1),
+        )
+        linked = PlantingEvent(user_id=sample_user.id, plant_id='tomato-1',
+                               garden_bed_id=sample_bed.id, position_x=5, position_y=5,
+                               planted_item=item)
+        unlinked = PlantingEvent(user_id=sample_user.id, plant_id='tomato-1',
+                                 garden_bed_id=sample_bed.id, position_x=0, position_y=0)
+        db_session.add_all([linked, unlinked])
+        db_session.commit()
+        assert linked.planted_item_id == item.id
+
+        event_data = {
+            'garden_bed_id': sample_bed.id,
+            'position_x': 0,
+            'position_y': 0,
+            'plant_id': 'tomato-1',
+            'transplant_date': datetime(2026, 5, 1),
+            'start_date': datetime(2026, 5, 1),
+            'end_date': datetime(2026, 8, 1),
+        }
+        assert validate_planting_conflict(event_data, sample_user.id)[0] is False
+        assert validate_planting_conflict(event_data, sample_user.id,
+                                          exclude_event_id=linked.id) == (True, None)
+        assert validate_planting_conflict(event_data, sample_user.id,
+                                          exclude_event_id=unlinked.id) == (True, None)
+
+    def test_stale_link_falls_back_to_position(self, db_session, sample_user, sample_bed):
+        """A link to a deleted item is ignored and the item at the event's cell is excluded."""
+        from models import PlantingEvent
+        self._place_item(
+            db_session, sample_user, sample_bed,
+            'tomato-1', 0, 0,
+            planted=datetime(2026, 4, 1),
+            transplant=datetime(2026, 5, 1),
+            harvest=datetime(2026, 8, 1),
+        )
+        stale = PlantingEvent(user_id=sample_user.id, plant_id='tomato-1',
+                              garden_bed_id=sample_bed.id, position_x=0, position_y=0,
+                              planted_item_id=99999)
+        db_session.add(stale)
+        db_session.commit()
+
+        event_data = {
+            'garden_bed_id': sample_bed.id,
+            'position_x': 0,
+            'position_y': 0,
+            'plant_id': 'tomato-1',
+            'transplant_date': datetime(2026, 5, 1),
+            'start_date': datetime(2026, 5, 1),
+            'end_date': datetime(2026, 8, 1),
+        }
+        assert validate_planting_conflict(event_data, sample_user.id,
+                                          exclude_event_id=stale.id) == (True, None)
+
+    def test_deleting_item_clears_event_link(self, db_session, sample_user, sample_bed):
+        """Deleting a PlantedItem nulls planted_item_id on events that recorded it."""
+        from models import PlantingEvent
+        from services.planting_service import delete_planted_item
+        item = self._place_item(
+            db_session, sample_user, sample_bed,
+            'tomato-1', 0, 0,
+            planted=datetime(2026, 4, 1),
+            transplant=datetime(2026, 5, 1),
+            harvest=datetime(2026, 8, 1),
+        )
+        event = PlantingEvent(user_id=sample_user.id, plant_id='tomato-1',
+                              garden_bed_id=sample_bed.id, position_x=0, position_y=0,
+                              planted_item=item)
+        db_session.add(event)
+        db_session.commit()
+        assert event.to_dict()['plantedItemId'] == item.id
+
+        assert delete_planted_item(item.id, sample_user.id)[0] is True
+        db_session.expire_all()
+        assert db_session.get(PlantingEvent, event.id).planted_item_id is None
+
     def test_sufficient_distance_no_conflict(self, db_session, sample_user, sample_bed):
         """CONF-03: Far apart cells → no conflict."""
         self._place_item(
@@ -860,6 +1040,41 @@ class TestValidatePlantingConflict:
         assert valid is False
         assert len(err['conflicts']) == 2
 
+    def test_bed_conflict_index_matches_validate(self, db_session, sample_user, sample_bed, monkeypatch):
+        """BedConflictIndex.check() gives validate_planting_conflict()'s answers with one query."""
+        import conflict_checker
+        kept = self._place_item(db_session, sample_user, sample_bed, 'tomato-1', 0, 0,
+                                planted=datetime(2026, 4, 1), transplant=datetime(2026, 5, 1),
+                                harvest=datetime(2026, 8, 1))
+        self._place_item(db_session, sample_user, sample_bed, 'pepper-1', 3, 3,
+                         planted=datetime(2026, 5, 1), harvest=datetime(2026, 9, 1))
+
+        def data(x, y, start, **extra):
+            return dict({
+                'garden_bed_id': sample_bed.id, 'position_x': x, 'position_y': y,
+                'plant_id': 'lettuce-1', 'direct_seed_date': start,
+                'start_date': start, 'end_date': start + timedelta(days=45),
+            }, **extra)
+
+        cases = [
+            (data(0, 0, datetime(2026, 6, 1)), None),
+            (data(0, 0, datetime(2026, 8, 1)), None),
+            (data(3, 3, datetime(2026, 6, 1)), None),
+            (data(0, 0, datetime(2026, 6, 1), conflict_override=True), None),
+            (data(None, 0, datetime(2026, 6, 1)), None),
+            (data(0, 0, datetime(2026, 6, 1)), kept.id),
+        ]
+        expected = [validate_planting_conflict(d, sample_user.id, exclude_item_id=e) for d, e in cases]
+        assert [valid for valid, _ in expected] == [False, True, False, True, True, True]
+
+        queries = []
+        real_query = conflict_checker.query_candidate_items
+        monkeypatch.setattr(conflict_checker, 'query_candidate_items',
+                            lambda *a, **kw: queries.append(a) or real_query(*a, **kw))
+        index = BedConflictIndex(sample_bed, sample_user.id)
+        assert [index.check(d, exclude_item_id=e) for d, e in cases] == expected
+        assert len(queries) == 1
+
 
 # =====================================================================
 # Class 8: TestQueryCandidateItems  (DB tests)
@@ -962,3 +1177,234 @@ class TestQueryCandidateItems:
         """Empty bed returns empty list."""
         events = query_candidate_items(sample_bed.id, sample_user.id)
         assert events == []
+
+    def test_by_bed_single_query(self, db_session, sample_user, sample_bed, second_bed):
+        """query_candidate_items_by_bed() groups items per bed, skipping empty beds."""
+        a1 = self._place_item(db_session, sample_user, sample_bed, 0, 0)
+        b1 = self._place_item(db_session, sample_user, second_bed, 0, 0)
+        a2 = self._place_item(db_session, sample_user, sample_bed, 1, 1)
+
+        by_bed = query_candidate_items_by_bed(sample_user.id, [sample_bed.id, second_bed.id, 99999])
+        assert set(by_bed) == {sample_bed.id, second_bed.id}
+        assert [e.id for e in by_bed[sample_bed.id]] == [a1.id, a2.id]
+        assert [e.id for e in by_bed[second_bed.id]] == [b1.id]
+
+    def test_candidate_index(self, db_session, sample_user, sample_bed, second_bed):
+        """query_candidate_index() indexes the bed's items, honouring the exclusion."""
+        keep = self._place_item(db_session, sample_user, sample_bed, 0, 0)
+        excluded = self._place_item(db_session, sample_user, sample_bed, 2, 2)
+        self._place_item(db_session, sample_user, second_bed, 0, 0)
+
+        index = query_candidate_index(sample_bed, sample_user.id, exclude_item_id=excluded.id)
+        assert [e.id for e in index.events()] == [keep.id]
+        new = _make_event(position_x=0, position_y=0, garden_bed_id=sample_bed.id,
+                          plant_id='tomato-1', transplant_date=datetime(2026, 6, 1),
+                          expected_harvest_date=datetime(2026, 7, 1))
+        assert has_conflict(new, index, sample_bed)['conflicts'][0]['eventId'] == keep.id
+
+    def test_filtered_query_keeps_every_conflict(self, db_session, sample_user, sample_bed):
+        """Date and position filters in SQL drop only items that cannot conflict."""
+        from models import PlantedItem
+        import random
+
+        rng = random.Random(3)
+        plants = ['tomato-1', 'lettuce-1', 'pepper-1', 'squash-1']
+        for _ in range(120):
+            planted = datetime(2025, 1, 1) + timedelta(days=rng.randrange(700))
+            db_session.add(PlantedItem(
+                user_id=sample_user.id, plant_id=rng.choice(plants), garden_bed_id=sample_bed.id,
+                position_x=rng.randrange(10), position_y=rng.randrange(10),
+                planted_date=planted,
+                transplant_date=planted + timedelta(days=20) if rng.random() < 0.5 else None,
+                harvest_date=planted + timedelta(days=rng.randrange(30, 120)) if rng.random() < 0.5 else None,
+                save_for_seed=rng.random() < 0.2,
+                seed_maturity_date=planted + timedelta(days=150) if rng.random() < 0.3 else None,
+            ))
+        db_session.flush()
+
+        all_items = query_candidate_items(sample_bed.id, sample_user.id)
+        loaded, conflicts = [], 0
+        for _ in range(40):
+            start = datetime(2025, 1, 1) + timedelta(days=rng.randrange(700))
+            new = _make_event(position_x=rng.randrange(10), position_y=rng.randrange(10),
+                              garden_bed_id=sample_bed.id, plant_id=rng.choice(plants),
+                              direct_seed_date=start,
+                              expected_harvest_date=start + timedelta(days=rng.randrange(1, 90)))
+            index = query_candidate_index(sample_bed, sample_user.id, near_event=new)
+            result = has_conflict(new, index, sample_bed)
+            assert result == has_conflict(new, all_items, sample_bed)
+            loaded.append(len(index))
+            conflicts += result['has_conflict']
+        assert conflicts and max(loaded) < len(all_items)
+
+
+# =====================================================================
+# Class 9: TestBedIndex  (spatial index — uses plant_database)
+# =====================================================================
+
+class TestBedIndex:
+    """Tests for BedIndex / build_bed_index()."""
+
+    def _event(self, event_id, x, y, bed_id=1, plant_id='tomato-1',
+               start=datetime(2026, 5, 1), end=datetime(2026, 8, 1)):
+        return _make_event(
+            id=event_id, position_x=x, position_y=y, garden_bed_id=bed_id,
+            plant_id=plant_id,
+            transplant_date=start,
+            expected_harvest_date=end,
+        )
+
+    def test_only_target_bed_is_viewed(self, monkeypatch):
+        """Events in other beds are dropped before any per-event work."""
+        import conflict_checker
+        viewed = []
+        real_as_view = conflict_checker._as_view
+        monkeypatch.setattr(conflict_checker, '_as_view',
+                            lambda e: viewed.append(e.id) or real_as_view(e))
+        index = build_bed_index([self._event(i, 0, 0, bed_id=i % 3) for i in range(9)], _make_bed(id=1))
+        assert viewed == [1, 4, 7]
+
+        # register_event() checks the bed before building a view too
+        assert index.register_event(self._event(9, 0, 0, bed_id=2)) is False
+        assert viewed == [1, 4, 7]
+
+    def test_skips_unplaceable_events(self):
+        """Other beds, missing positions and unknown plants are not indexed."""
+        bed = _make_bed(id=1)
+        index = build_bed_index([
+            self._event(1, 0, 0),
+            self._event(2, 0, 0, bed_id=2),
+            self._event(3, None, None),
+            self._event(4, 1, 1, plant_id='fake-99'),
+        ], bed)
+        assert len(index) == 1
+
+    def test_candidates_limited_to_footprint(self):
+        """Only events whose footprint overlaps the new planting are returned."""
+        bed = _make_bed(id=1)
+        near, edge, far = self._event(1, 1, 1), self._event(2, 2, 0), self._event(3, 8, 8)
+        index = build_bed_index([near, edge, far], bed)
+        # A 2-cell planting at the origin reaches (1, 1) but not (2, 0)
+        found = [view.event for view in index.candidates(0, 0, 2)]
+        assert found == [near]
+
+    def test_candidates_limited_to_date_range(self):
+        """Events out of the ground for the whole range are not returned."""
+        bed = _make_bed(id=1)
+        spring = self._event(1, 0, 0, start=datetime(2026, 3, 1), end=datetime(2026, 5, 1))
+        summer = self._event(2, 0, 0, start=datetime(2026, 6, 1), end=datetime(2026, 9, 1))
+        undated = self._event(3, 0, 0, start=None, end=None)
+        index = build_bed_index([spring, summer, undated], bed)
+
+        day = lambda *args: datetime(*args).toordinal()
+        found = [view.event for view in index.candidates(0, 0, 1, day(2026, 7, 1), day(2026, 8, 1))]
+        assert found == [summer]
+        found = [view.event for view in index.candidates(0, 0, 1, day(2026, 4, 1), day(2026, 6, 1))]
+        assert found == [spring, summer]
+        assert list(index.candidates(0, 0, 1, day(2026, 7, 1), None)) == []
+
+    def test_dates_parsed_once_at_registration(self):
+        """ISO strings on dict events are parsed when the event is indexed."""
+        event = {
+            'id': 1, 'positionX': 0, 'positionY': 0, 'gardenBedId': 1, 'plantId': 'tomato-1',
+            'transplantDate': '2026-05-01T00:00:00Z', 'expectedHarvestDate': '2026-08-01T00:00:00Z',
+        }
+        index = build_bed_index([event], _make_bed(id=1))
+        view, = index.candidates(0, 0, 1)
+        assert view.start.date().isoformat() == '2026-05-01'
+        assert view.end_day - view.start_day == 92
+
+        new = dict(event, id=None, transplantDate='2026-07-01T00:00:00Z')
+        result = has_conflict(new, index, _make_bed(id=1))
+        assert result['conflicts'][0]['dates'] == '2026-05-01 to 2026-08-01'
+
+    def test_unregister_shrinks_bounds(self):
+        """Removing the largest or longest event tightens max_cells and max_span."""
+        bed = _make_bed(id=1, planning_method='row')
+        pepper = self._event(10, 0, 0, plant_id='pepper-1', end=datetime(2026, 10, 1))
+        lettuce = self._event(11, 5, 5, plant_id='lettuce-1')
+        index = build_bed_index([pepper, lettuce], bed)
+        assert (index.max_cells, index.max_span) == (2, 153)
+
+        assert index.unregister_event(pepper) is True
+        assert (index.max_cells, index.max_span) == (1, 92)
+        assert index.unregister_event(lettuce) is True
+        assert (index.max_cells, index.max_span) == (0, 0)
+
+    def test_dict_events_coerced_once(self):
+        """Dict events are indexed as ConflictEvents; direct registrations keep the dict."""
+        from conflict_checker import ConflictEvent
+        event = {'id': 1, 'positionX': 0, 'positionY': 0, 'gardenBedId': 1, 'plantId': 'tomato-1',
+                 'transplantDate': datetime(2026, 5, 1), 'expectedHarvestDate': datetime(2026, 8, 1)}
+        index = build_bed_index([event, dict(event, id=2, gardenBedId=2)], _make_bed(id=1))
+        stored, = index.events()
+        assert isinstance(stored, ConflictEvent)
+        assert (stored.id, stored.garden_bed_id, stored.plant_id) == (1, 1, 'tomato-1')
+
+        assert index.register_event(dict(event, id=3, gardenBedId=2)) is False
+        direct = dict(event, id=3)
+        assert index.register_event(direct) is True
+        assert index.unregister_event(direct) is True
+        assert len(index) == 1
+
+    def test_spacing_memoized_per_bed_method(self):
+        """Effective spacing is cached per (plant, grid size, planning method)."""
+        from conflict_checker import _plant_spacing_cache
+        clear_spacing_cache()
+        build_bed_index([self._event(1, 0, 0)], _make_bed(id=1, planning_method='square-foot'))
+        build_bed_index([self._event(1, 0, 0)], _make_bed(id=1, planning_method='migardener'))
+        assert set(_plant_spacing_cache) == {
+            ('tomato-1', 12, 'square-foot'), ('tomato-1', 12, 'migardener'),
+        }
+        clear_spacing_cache()
+        assert _plant_spacing_cache == {}
+
+    def test_compact_arrays(self):
+        """Grid positions are stored as int16; fractional or huge ones are not."""
+        bed = _make_bed(id=1)
+        index = build_bed_index([self._event(1, 0, 0), self._event(2, 3, 40000)], bed)
+        soa = index._arrays()
+        assert soa['x'].dtype == np.int16 and soa['cells'].dtype == np.int16
+        assert soa['y'].dtype == np.int64
+        # Far-away query positions must not wrap around in int16 arithmetic
+        assert [v.id for v in index.candidates(65536, 0, 1)] == []
+        assert [v.id for v in index.candidates(3, 40000, 1)] == [2]
+
+        index = build_bed_index([self._event(1, 0.5, 0)], bed)
+        assert index._arrays()['x'].dtype == np.float64
+        assert [v.id for v in index.candidates(0, 0, 1)] == [1]
+
+    def test_bed_settings_change_recomputes_footprints(self):
+        """A prebuilt index follows the bed's grid size when it is used."""
+        bed = _make_bed(id=1, planning_method='row')
+        index = build_bed_index([self._event(10, 0, 0, plant_id='pepper-1')], bed)
+        new = self._event(None, 1, 1, plant_id='lettuce-1')
+        # Pepper 18" on a 12" grid spans 2 cells; on a 24" grid only 1
+        assert has_conflict(new, index, bed)['has_conflict'] is True
+        wide_bed = _make_bed(id=1, grid_size=24, planning_method='row')
+        assert has_conflict(new, index, wide_bed)['has_conflict'] is False
+        assert index.grid_size == 24 and index.max_cells == 1
+        assert index.configure(24, 'row') is False
+
+    def test_prebuilt_index_matches_list(self):
+        """has_conflict() gives the same answer for an index and a list."""
+        bed = _make_bed(id=1, planning_method='row')
+        existing = [self._event(i, i % 6, i // 6) for i in range(1, 37)]
+        new = self._event(None, 2, 2)
+
+        from_list = has_conflict(new, existing, bed)
+        from_index = has_conflict(new, build_bed_index(existing, bed), bed)
+        assert from_list['has_conflict'] is True
+        assert from_index == from_list
+
+    def test_unregister_event(self):
+        """Unregistered events no longer produce conflicts."""
+        bed = _make_bed(id=1)
+        existing = self._event(10, 0, 0)
+        index = build_bed_index([existing], bed)
+        new = self._event(None, 0, 0)
+        assert has_conflict(new, index, bed)['has_conflict'] is True
+
+        assert index.unregister_event(existing) is True
+        assert index.unregister_event(existing) is False
+        assert has_conflict(new, index, bed)['has_conflict'] is False
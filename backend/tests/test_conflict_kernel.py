@@ -0,0 +1,214 @@
+"""
+Tests for the fused conflict kernel (utils/conflict_kernel.py).
+
+Covers:
+- The kernel path in BedIndex marks the same events as the NumPy path,
+  with and without the date test, whole-bed or pruned to in-ground events.
+- Events missing a date never match when dates are checked.
+- find_conflict_matrix() gives has_conflicts_batch() the same results as
+  its NumPy broadcasts.
+- warm_up() reports whether the compiled kernel is in use.
+- With numba installed, the compiled kernels match their Python bodies and
+  can be called from several threads at once.
+- BedIndex's linear, grid-bucket and whole-bed (spatial- or date-first)
+  strategies agree, with the whole-bed test on the kernel and on NumPy.
+- The sorted-start date filter matches a scan of every event.
+"""
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+import conflict_checker
+from conflict_checker import build_bed_index, has_conflicts_batch
+from utils.conflict_kernel import NUMBA_AVAILABLE, find_conflict_matrix, find_conflicts, warm_up
+
+
+def _event(event_id, x, y, start, days, plant_id='tomato-1'):
+    return {
+        'id': event_id, 'positionX': x, 'positionY': y, 'gardenBedId': 1,
+        'plantId': plant_id,
+        'transplantDate': start,
+        'expectedHarvestDate': start + timedelta(days=days) if start else None,
+    }
+
+
+def _bed_slots(index, monkeypatch, use_kernel, x, y, cells, start_day=None, end_day=None):
+    monkeypatch.setattr(conflict_checker, 'NUMBA_AVAILABLE', use_kernel)
+    return index._bed_slots(x, y, cells, start_day, end_day).tolist()
+
+
+class TestFindConflicts:
+
+    @pytest.mark.parametrize('temporal_first_ratio', [0, 2])
+    def test_matches_numpy_path(self, monkeypatch, temporal_first_ratio):
+        rng = random.Random(7)
+        plants = ['tomato-1', 'lettuce-1', 'pepper-1', 'squash-1']
+        events = [
+            _event(i, rng.randrange(12), rng.randrange(6),
+                   datetime(2026, 3, 1) + timedelta(days=rng.randrange(200)),
+                   rng.randrange(20, 120), rng.choice(plants))
+            for i in range(300)
+        ]
+        index = build_bed_index(events, {'id': 1, 'gridSize': 6, 'planningMethod': 'row'})
+        # 0 tests the whole bed with dates; 2 prunes to the in-ground events first
+        monkeypatch.setattr(conflict_checker, '_TEMPORAL_FIRST_RATIO', temporal_first_ratio)
+
+        start = datetime(2026, 6, 1).toordinal()
+        for x, y, cells in [(0, 0, 1), (5, 3, 2), (11, 5, 4)]:
+            for days in [(None, None), (start, start + 30)]:
+                kernel = _bed_slots(index, monkeypatch, True, x, y, cells, *days)
+                assert kernel == _bed_slots(index, monkeypatch, False, x, y, cells, *days)
+
+    def test_undated_events_never_match_dates(self):
+        index = build_bed_index([_event(1, 0, 0, None, 0)], {'id': 1, 'gridSize': 12})
+        soa = index._arrays()
+        mask = np.zeros(1, dtype=np.bool_)
+        args = (soa['x'], soa['y'], soa['cells'], soa['start'], soa['end'], mask)
+
+        assert find_conflicts(0, 0, 1, 0, 0, False, *args) == 1
+        assert find_conflicts(0, 0, 1, 0, 10 ** 6, True, *args) == 0
+        assert not mask[0]
+
+    def test_matrix_matches_batch_broadcast(self, monkeypatch):
+        rng = random.Random(9)
+        plants = ['tomato-1', 'lettuce-1', 'pepper-1', 'squash-1']
+        existing = [
+            _event(i, rng.randrange(8), rng.randrange(8),
+                   None if i % 9 == 0 else datetime(2026, 3, 1) + timedelta(days=rng.randrange(150)),
+                   rng.randrange(20, 90), rng.choice(plants))
+            for i in range(1, 60)
+        ]
+        new_events = [
+            _event(None, rng.randrange(8) + 0.5 * rng.randrange(2), rng.randrange(8),
+                   None if i % 7 == 0 else datetime(2026, 3, 1) + timedelta(days=rng.randrange(150)),
+                   rng.randrange(1, 60), rng.choice(plants))
+            for i in range(40)
+        ] + existing[:5]
+        bed = {'id': 1, 'gridSize': 6, 'planningMethod': 'row'}
+
+        monkeypatch.setattr(conflict_checker, 'NUMBA_AVAILABLE', False)
+        broadcast = has_conflicts_batch(new_events, existing, bed)
+        monkeypatch.setattr(conflict_checker, 'NUMBA_AVAILABLE', True)
+        kernel = has_conflicts_batch(new_events, existing, bed)
+
+        assert any(result['has_conflict'] for result in broadcast)
+        assert kernel == broadcast
+
+    def test_warm_up(self):
+        assert warm_up() is NUMBA_AVAILABLE
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason='numba unavailable (NumPy fallback)')
+class TestCompiledKernel:
+
+    def _arrays(self, rng, n, positions):
+        xs = rng.integers(0, 12, n).astype(positions)
+        ys = rng.integers(0, 12, n).astype(positions)
+        cells = rng.integers(1, 4, n).astype(np.int16)
+        starts = rng.integers(0, 200, n).astype(np.int32)
+        ends = (starts + rng.integers(0, 90, n)).astype(np.int32)
+        return xs, ys, cells, starts, ends
+
+    @pytest.mark.parametrize('positions', [np.int16, np.float64])
+    def test_find_conflicts_matches_python(self, positions):
+        rng = np.random.default_rng(3)
+        events = self._arrays(rng, 500, positions)
+        compiled = np.zeros(500, dtype=np.bool_)
+        python = np.zeros(500, dtype=np.bool_)
+        for args in [(4, 4, 2, 50, 120, True), (0, 11, 1, 0, 0, False)]:
+            count = find_conflicts(*args, *events, compiled)
+            assert count == find_conflicts.py_func(*args, *events, python)
+            assert compiled.tolist() == python.tolist()
+
+    def test_find_conflict_matrix_matches_python(self):
+        rng = np.random.default_rng(4)
+        events = self._arrays(rng, 200, np.float64)
+        xs, ys, cells, starts, ends = self._arrays(rng, 30, np.float64)
+        new = (xs, ys, cells.astype(np.int64), starts.astype(np.int64),
+               ends.astype(np.int64), rng.integers(0, 2, 30).astype(np.bool_))
+        compiled = np.zeros((30, 200), dtype=np.bool_)
+        python = np.zeros((30, 200), dtype=np.bool_)
+        find_conflict_matrix(*new, *events, compiled)
+        find_conflict_matrix.py_func(*new, *events, python)
+        assert compiled.any()
+        assert compiled.tolist() == python.tolist()
+
+    def test_concurrent_calls(self):
+        rng = np.random.default_rng(5)
+        events = self._arrays(rng, 2000, np.int16)
+        expected = find_conflicts.py_func(6, 6, 2, 20, 80, True, *events,
+                                          np.zeros(2000, dtype=np.bool_))
+
+        def check(_):
+            return find_conflicts(6, 6, 2, 20, 80, True, *events, np.zeros(2000, dtype=np.bool_))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert set(pool.map(check, range(64))) == {expected}
+
+
+class TestBedIndexStrategies:
+
+    @pytest.mark.parametrize('use_kernel', [False, True])
+    @pytest.mark.parametrize('fractional', [False, True])
+    def test_strategies_agree(self, monkeypatch, fractional, use_kernel):
+        rng = random.Random(11)
+        plants = ['tomato-1', 'lettuce-1', 'pepper-1', 'squash-1']
+        offset = 0.5 if fractional else 0
+        events = [
+            _event(i, rng.randrange(20) + offset * rng.randrange(2), rng.randrange(10),
+                   datetime(2026, 3, 1) + timedelta(days=rng.randrange(200)),
+                   rng.randrange(20, 120), rng.choice(plants))
+            for i in range(400)
+        ]
+        index = build_bed_index(events, {'id': 1, 'gridSize': 6, 'planningMethod': 'row'})
+        start = datetime(2026, 6, 1).toordinal()
+        queries = [(x, y, cells, days)
+                   for x, y in [(0, 0), (7.5, 4), (19, 9)]
+                   for cells in [1, 3]
+                   for days in [(None, None), (start, start + 30)]]
+
+        def run():
+            return [[v.id for v in index.candidates(x, y, cells, *days)]
+                    for x, y, cells, days in queries]
+
+        # Whole-bed tests go through the kernel or the NumPy fallback either
+        # way; the kernel's Python body runs when numba is not installed
+        monkeypatch.setattr(conflict_checker, 'NUMBA_AVAILABLE', use_kernel)
+        monkeypatch.setattr(conflict_checker, '_LINEAR_SCAN_MAX', 10 ** 6)
+        linear = run()
+        monkeypatch.setattr(conflict_checker, '_LINEAR_SCAN_MAX', 0)
+        monkeypatch.setattr(conflict_checker, '_WINDOW_SCAN_COST', 0)
+        window = run()
+        monkeypatch.setattr(conflict_checker, '_WINDOW_SCAN_COST', 10 ** 6)
+        monkeypatch.setattr(conflict_checker, '_TEMPORAL_FIRST_RATIO', 0)
+        vectorized = run()
+        monkeypatch.setattr(conflict_checker, '_TEMPORAL_FIRST_RATIO', 2)
+        temporal_first = run()
+
+        assert any(linear)
+        assert linear == window == vectorized == temporal_first
+
+    def test_temporal_mask_matches_scan(self):
+        rng = random.Random(5)
+        events = [
+            _event(i, rng.randrange(10), rng.randrange(10),
+                   None if i % 7 == 0 else datetime(2026, 3, 1) + timedelta(days=rng.randrange(200)),
+                   rng.randrange(1, 150))
+            for i in range(200)
+        ]
+        index = build_bed_index(events, {'id': 1, 'gridSize': 12})
+        for event in events[::5]:
+            index.unregister_event(event)
+        views = list(index._entries.values())
+
+        base = datetime(2026, 3, 1).toordinal()
+        for start_day, end_day in [(base - 30, base), (base + 60, base + 60), (base + 100, base + 400)]:
+            expected = [
+                i for i, v in enumerate(views)
+                if v.start_day is not None and v.end_day is not None
+                and v.start_day <= end_day and start_day <= v.end_day
+            ]
+            assert sorted(index._temporal_positions(start_day, end_day).tolist()) == expected
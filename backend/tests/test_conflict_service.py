@@ -0,0 +1,54 @@
+"""
+Tests for services/conflict_service.py.
+
+Covers:
+- find_conflicts_in_bed() reports each overlapping pair once, in event order.
+- Events without positions or harvest dates are ignored.
+- Other users' events and missing beds produce no conflicts.
+"""
+from datetime import datetime
+
+from models import PlantingEvent
+from services.conflict_service import audit_all_conflicts, find_conflicts_in_bed
+
+
+def _event(db_session, user, bed, x, y, start, end, plant_id='tomato-1'):
+    event = PlantingEvent(user_id=user.id, plant_id=plant_id, event_type='planting',
+                          garden_bed_id=bed.id, position_x=x, position_y=y,
+                          direct_seed_date=start, expected_harvest_date=end)
+    db_session.add(event)
+    db_session.flush()
+    return event
+
+
+class TestFindConflictsInBed:
+
+    def test_reports_each_pair_once(self, db_session, sample_user, sample_bed):
+        a = _event(db_session, sample_user, sample_bed, 0, 0, datetime(2026, 5, 1), datetime(2026, 8, 1))
+        b = _event(db_session, sample_user, sample_bed, 0, 0, datetime(2026, 6, 1), datetime(2026, 9, 1))
+        c = _event(db_session, sample_user, sample_bed, 0, 0, datetime(2026, 7, 1), datetime(2026, 7, 15))
+        # Far away, and back-to-back in time: no conflict
+        _event(db_session, sample_user, sample_bed, 5, 5, datetime(2026, 5, 1), datetime(2026, 8, 1))
+        _event(db_session, sample_user, sample_bed, 0, 0, datetime(2026, 9, 1), datetime(2026, 10, 1))
+
+        conflicts = find_conflicts_in_bed(sample_bed.id, sample_user.id)
+        assert [(pair['event1_id'], pair['event2_id']) for pair in conflicts] == [
+            (a.id, b.id), (a.id, c.id), (b.id, c.id),
+        ]
+        assert conflicts[0]['event1_position'] == (0, 0)
+        assert conflicts[0]['event2_dates'] == ('2026-06-01T00:00:00', '2026-09-01T00:00:00')
+
+    def test_unplaced_and_undated_events_ignored(self, db_session, sample_user, sample_bed):
+        _event(db_session, sample_user, sample_bed, 0, 0, datetime(2026, 5, 1), datetime(2026, 8, 1))
+        _event(db_session, sample_user, sample_bed, None, None, datetime(2026, 5, 1), datetime(2026, 8, 1))
+        _event(db_session, sample_user, sample_bed, 0, 0, datetime(2026, 5, 1), None)
+
+        assert find_conflicts_in_bed(sample_bed.id, sample_user.id) == []
+
+    def test_other_users_and_missing_beds(self, db_session, sample_user, sample_bed):
+        _event(db_session, sample_user, sample_bed, 0, 0, datetime(2026, 5, 1), datetime(2026, 8, 1))
+        _event(db_session, sample_user, sample_bed, 0, 0, datetime(2026, 6, 1), datetime(2026, 9, 1))
+
+        assert find_conflicts_in_bed(sample_bed.id, sample_user.id + 1) == []
+        assert find_conflicts_in_bed(99999, sample_user.id) == []
+        assert list(audit_all_conflicts(sample_user.id)) == [sample_bed.id]
@@ -0,0 +1,96 @@
+"""
+Tests for forward_planting_validator cold danger checks.
+
+Historical air temperatures are stubbed so the tests run offline.
+
+Covers:
+- fetch_historical_cold_window() lines up days across month boundaries and
+  leaves days without history as NaN.
+- check_future_cold_danger() flags days below the hardiness threshold only
+  between germination and the (capped) checking period.
+- One prefetched window serves plants with different growing periods.
+- _scan_cold_window() finds cold days and the longest consecutive cold snap.
+"""
+from datetime import date
+
+import numpy as np
+import pytest
+
+import forward_planting_validator as fpv
+
+
+def _air_temps(latitude, longitude, month):
+    """Cold January/February, mild afterwards; Feb 20 is a hard freeze."""
+    temps = {day: 20.0 if month <= 2 else 45.0 for day in range(1, 29)}
+    if month == 2:
+        temps[20] = 5.0
+    return temps
+
+
+@pytest.fixture
+def stub_air_temps(monkeypatch):
+    calls = []
+
+    def fake(latitude, longitude, month):
+        calls.append(month)
+        return _air_temps(latitude, longitude, month)
+
+    monkeypatch.setattr(fpv, 'get_historical_daily_air_temps', fake)
+    return calls
+
+
+class TestColdWindow:
+
+    def test_window_spans_months(self, stub_air_temps):
+        window = fpv.fetch_historical_cold_window(43.1, -87.9, date(2026, 1, 25), 40)
+        assert window.shape == (41,)
+        assert window[0] == 20.0
+        # Jan 29-31 have no stubbed history
+        assert np.isnan(window[4:7]).all()
+        assert window[26] == 5.0  # Feb 20
+        # Each month is looked up once, not once per day
+        assert stub_air_temps == [1, 2, 3]
+
+
+class TestScanColdWindow:
+
+    def test_longest_snap(self):
+        temps = np.array([40, 20, 25, 40, np.nan, 10, 12, 11, 40, 30])
+        cold_indices, longest = fpv._scan_cold_window(temps, 32)
+        assert cold_indices.tolist() == [1, 2, 5, 6, 7, 9]
+        assert longest == 3
+
+    def test_no_cold_days(self):
+        cold_indices, longest = fpv._scan_cold_window(np.array([40.0, np.nan, 50.0]), 32)
+        assert cold_indices.size == 0
+        assert longest == 0
+
+
+class TestFutureColdDanger:
+
+    def test_freeze_after_germination_is_flagged(self, stub_air_temps):
+        is_safe, warning, details = fpv.check_future_cold_danger(
+            'tomato-1', date(2026, 2, 1), 43.1, -87.9, 60, 60
+        )
+        assert is_safe is False
+        assert 'February 20' in warning
+        assert details['worst_period']['historical_temp'] == 5.0
+        assert details['worst_period']['margin'] == 27.0
+        # Germination takes 5 days for tomato, so Feb 1-5 are not checked
+        assert details['dangerous_periods'][0]['date'] == '2026-02-06'
+        # Feb 6-28 are all below 32°F
+        assert details['longest_cold_snap_days'] == 23
+
+    def test_hardy_plant_is_safe(self, stub_air_temps):
+        assert fpv.check_future_cold_danger(
+            'garlic-1', date(2026, 2, 1), 43.1, -87.9, 60, 60
+        ) == (True, None, None)
+
+    def test_shared_window_matches_per_plant_fetch(self, stub_air_temps):
+        planting_date = date(2026, 1, 10)
+        window = fpv.fetch_historical_cold_window(43.1, -87.9, planting_date, fpv.MAX_COLD_CHECK_DAYS)
+        for plant_id, dtm in [('pea-1', 60), ('tomato-1', 30), ('carrot-1', 200), ('kale-1', 50)]:
+            expected = fpv.check_future_cold_danger(plant_id, planting_date, 43.1, -87.9, 45, dtm)
+            assert fpv.check_future_cold_danger_with_data(
+                plant_id, planting_date, window, 45, dtm
+            ) == expected
@@ -0,0 +1,94 @@
+"""
+Tests for frost_date_lookup.get_frost_dates_for_user caching.
+
+Covers:
+- Repeat lookups are served from cache without re-querying Property.
+- Property create/update/delete through the API invalidates the cache.
+- clear_frost_date_cache() drops entries for a single user.
+- The cache is bounded (oldest entry evicted) and expired entries are
+  dropped on read.
+"""
+from datetime import date, datetime
+
+from flask import g
+
+import frost_date_lookup
+from frost_date_lookup import get_frost_dates_for_user, clear_frost_date_cache
+from models import db, Property
+
+
+def _frost(client):
+    return client.get('/api/frost-dates?year=2026').get_json()
+
+
+class TestFrostDateCache:
+
+    def test_repeat_lookups_use_cache(self, app, sample_user, monkeypatch):
+        calls = []
+        real_lookup = frost_date_lookup._lookup_frost_dates_for_user
+
+        def counting_lookup(*args, **kwargs):
+            calls.append(args)
+            return real_lookup(*args, **kwargs)
+
+        monkeypatch.setattr(frost_date_lookup, '_lookup_frost_dates_for_user', counting_lookup)
+
+        first = get_frost_dates_for_user(sample_user.id, year=2026)
+        second = get_frost_dates_for_user(sample_user.id, year=2026)
+        assert first == second == {
+            'last_frost': date(2026, 4, 15),
+            'first_frost': date(2026, 10, 15),
+            'source': 'default',
+        }
+        assert len(calls) == 1
+
+        # Returned dicts are copies; mutating one must not poison the cache
+        first['source'] = 'mutated'
+        assert get_frost_dates_for_user(sample_user.id, year=2026)['source'] == 'default'
+
+    def test_clear_single_user(self, app, sample_user):
+        get_frost_dates_for_user(sample_user.id, year=2026)
+        db.session.add(Property(user_id=sample_user.id, name='Farm', width=100, length=100, zone='7a'))
+        db.session.flush()
+
+        # Still cached until the user's entries are cleared
+        assert get_frost_dates_for_user(sample_user.id, year=2026)['source'] == 'default'
+        clear_frost_date_cache(sample_user.id)
+        assert get_frost_dates_for_user(sample_user.id, year=2026)['source'] == 'zone'
+
+    def test_cache_is_bounded(self, app, sample_user, monkeypatch):
+        monkeypatch.setattr(frost_date_lookup, '_USER_FROST_CACHE_MAX_ENTRIES', 3)
+        for zipcode in ['10001', '10002', '10003', '10004']:
+            get_frost_dates_for_user(sample_user.id, year=2026, zipcode=zipcode)
+
+        assert [key[2] for key in frost_date_lookup._user_frost_cache] == ['10002', '10003', '10004']
+
+    def test_expired_entries_dropped_on_read(self, app, sample_user):
+        get_frost_dates_for_user(sample_user.id, year=2026)
+        key = (sample_user.id, 2026, None)
+        frost_date_lookup._user_frost_cache[key]['cached_at'] = datetime(2000, 1, 1)
+        g.pop('_frost_dates', None)
+        db.session.add(Property(user_id=sample_user.id, name='Farm', width=100, length=100, zone='7a'))
+        db.session.flush()
+
+        assert get_frost_dates_for_user(sample_user.id, year=2026)['source'] == 'zone'
+        assert frost_date_lookup._user_frost_cache[key]['cached_at'] > datetime(2000, 1, 1)
+
+    def test_property_api_invalidates_cache(self, auth_client_a):
+        assert _frost(auth_client_a)['source'] == 'default'
+
+        resp = auth_client_a.post('/api/properties', json={
+            'name': 'Homestead', 'width': 100, 'length': 200,
+            'lastFrostDate': '2026-05-01', 'firstFrostDate': '2026-09-30',
+        })
+        assert resp.status_code == 201
+        prop_id = resp.get_json()['id']
+        body = _frost(auth_client_a)
+        assert body['source'] == 'property'
+        assert body['lastFrostDate'] == '2026-05-01'
+
+        auth_client_a.put(f'/api/properties/{prop_id}', json={'lastFrostDate': '2026-05-10'})
+        assert _frost(auth_client_a)['lastFrostDate'] == '2026-05-10'
+
+        auth_client_a.delete(f'/api/properties/{prop_id}')
+        assert _frost(auth_client_a)['source'] == 'default'
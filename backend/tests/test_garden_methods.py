@@ -0,0 +1,190 @@
+"""
+Tests for garden_methods spacing lookups.
+
+Covers:
+- Spacing getters match the longest table pattern contained in the plant ID.
+- Unknown plants fall back to each method's default spacing.
+- SFG_QUANTITY is SFG_SPACING keyed by plant pattern.
+- Repeated lookups are answered from the resolver caches.
+- Bed templates are found by ID; grid plantings are stored as Placements
+  and served in their original JSON shape.
+- calculate_plants_per_bed() results per method, memoized.
+- get_methods_list() summarizes every method; grid sizes are cached.
+- Reference tables are read-only and still serialize through the data API.
+- Guild plants are frozen GuildPlant records, served as dicts.
+"""
+import pytest
+
+from garden_methods import (
+    BED_TEMPLATES,
+    GARDEN_METHODS,
+    GuildPlant,
+    MIGARDENER_SPACING,
+    PLANT_GUILDS,
+    Placement,
+    ROW_SPACING,
+    SFG_QUANTITY,
+    SFG_SPACING,
+    Spacing,
+    _by_specificity,
+    _first_match,
+    _resolve_sfg,
+    calculate_plants_per_bed,
+    clear_spacing_caches,
+    get_intensive_density,
+    get_intensive_spacing,
+    get_method_grid_size,
+    get_methods_list,
+    get_migardener_spacing,
+    get_row_spacing,
+    get_sfg_quantity,
+    get_guild_by_id,
+    get_template_by_id,
+    placement_to_dict,
+)
+
+
+class TestSpacingLookups:
+
+    def test_sfg_quantity(self):
+        assert get_sfg_quantity('tomato-1') == 1
+        assert get_sfg_quantity('lettuce-1') == 4
+        assert get_sfg_quantity('lettuce-crisphead-1') == 1
+        assert get_sfg_quantity('watermelon-1') == 0.5
+        assert get_sfg_quantity('carrot-1') == 16
+
+    def test_row_and_migardener_spacing(self):
+        assert get_row_spacing('tomato-1') == Spacing(rowSpacing=36, plantSpacing=24)
+        assert get_migardener_spacing('pea-1')._asdict() == {'rowSpacing': 60, 'plantSpacing': 1.5}
+        assert get_intensive_spacing('squash-1') == 24
+        assert get_intensive_density('squash-1') == (144 / (24 * 24)) * 0.866
+        assert get_intensive_density('not-a-plant') == 0.866
+
+    def test_most_specific_pattern_wins(self):
+        index = _by_specificity({'lettuce': 4, 'lettuce-head': 1, 'kale': 1})
+        assert list(index) == ['lettuce-head', 'lettuce', 'kale']
+        assert _first_match(index, 'lettuce-head-1', None) == 1
+        assert _first_match(index, 'lettuce-1', None) == 4
+        # Base-ID lookups and the substring scan agree
+        assert _first_match(index, 'lettuce-head-12', None) == 1
+        assert _first_match(index, 'red-lettuce-head', None) == 1
+        assert _first_match(index, 'kale-lettuce-1', None) == 4
+
+    def test_unknown_plant_defaults(self):
+        assert get_sfg_quantity('not-a-plant') == 1
+        assert get_row_spacing('not-a-plant') == (24, 12)
+        assert get_intensive_spacing('not-a-plant') == 12
+        assert get_migardener_spacing('not-a-plant') == (18, 8)
+
+    def test_repeat_lookups_are_cached(self):
+        _resolve_sfg.cache_clear()
+        get_sfg_quantity('radish-1')
+        get_sfg_quantity('radish-1')
+        info = _resolve_sfg.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_flat_sfg_table(self):
+        assert SFG_QUANTITY['lettuce-head'] == 1
+        assert SFG_QUANTITY['bean-pole'] == 8
+        assert sorted(SFG_QUANTITY) == sorted(p for plants in SFG_SPACING.values() for p in plants)
+        with pytest.raises(TypeError):
+            SFG_QUANTITY['not-a-plant'] = 1
+
+    def test_row_tables_hold_spacing_pairs(self):
+        assert ROW_SPACING['kale'].rowSpacing == 18
+        assert MIGARDENER_SPACING['bean-bush'] == Spacing(18, 5.5)
+
+
+class TestTemplateLookup:
+
+    def test_every_template_is_indexed(self):
+        for template in BED_TEMPLATES:
+            assert get_template_by_id(template['id']) is template
+
+    def test_unknown_template(self):
+        assert get_template_by_id('not-a-template') is None
+
+    def test_grid_plantings_are_placements(self):
+        placement = get_template_by_id('sfg-4x4-beginner')['plants'][4]
+        assert placement == Placement('lettuce-1', 1, 0, 4)
+        assert placement_to_dict(placement) == {
+            'plantId': 'lettuce-1', 'position': {'row': 1, 'col': 0}, 'quantity': 4
+        }
+        # Intensive plantings have no grid position and keep their dicts
+        assert get_template_by_id('intensive-4x8-production')['plants'][0]['spacing'] == 12
+
+    def test_api_serves_positions(self, client):
+        template = client.get('/api/bed-templates/sfg-4x4-beginner').get_json()
+        assert template['plants'][4] == {
+            'plantId': 'lettuce-1', 'position': {'row': 1, 'col': 0}, 'quantity': 4
+        }
+
+
+class TestPlantsPerBed:
+
+    def test_methods(self):
+        assert calculate_plants_per_bed(4, 8, 'lettuce-1', 'square-foot') == 128
+        assert calculate_plants_per_bed(4, 8, 'carrot-1', 'row') == 192
+        assert calculate_plants_per_bed(4, 8, 'tomato-1', 'intensive') == 12
+        assert calculate_plants_per_bed(4, 8, 'pea-1', 'migardener') == 0
+        assert calculate_plants_per_bed(10, 8, 'pea-1', 'migardener') == 128
+        assert calculate_plants_per_bed(4, 8, 'tomato-1', 'unknown') == 1
+
+    def test_results_are_memoized(self):
+        clear_spacing_caches()
+        calculate_plants_per_bed(4, 8, 'carrot-1', 'row')
+        calculate_plants_per_bed(4, 8, 'carrot-1', 'row')
+        assert calculate_plants_per_bed.cache_info().hits == 1
+        clear_spacing_caches()
+        assert calculate_plants_per_bed.cache_info().currsize == 0
+
+
+class TestMethodsList:
+
+    def test_summarizes_every_method(self):
+        methods = get_methods_list()
+        assert [m['id'] for m in methods] == list(GARDEN_METHODS)
+        for m in methods:
+            assert m['name'] == GARDEN_METHODS[m['id']]['name']
+            assert set(m) == {'id', 'name', 'description', 'idealFor'}
+
+    def test_grid_size(self):
+        assert get_method_grid_size('migardener') == 3
+        assert get_method_grid_size('not-a-method') == 12
+        get_method_grid_size('migardener')
+        assert get_method_grid_size.cache_info().hits >= 1
+
+
+class TestReadOnlyTables:
+
+    def test_tables_cannot_be_modified(self):
+        with pytest.raises(TypeError):
+            GARDEN_METHODS['new-method'] = {}
+        with pytest.raises(AttributeError):
+            SFG_SPACING[1].append('not-a-plant')
+        assert isinstance(BED_TEMPLATES, tuple)
+
+    def test_data_api_serializes_tables(self, client):
+        guilds = client.get('/api/guilds').get_json()
+        assert guilds['three-sisters']['name'] == PLANT_GUILDS['three-sisters']['name']
+
+        methods = client.get('/api/garden-methods').get_json()
+        assert set(methods['details']) == set(GARDEN_METHODS)
+
+        templates = client.get('/api/bed-templates').get_json()
+        assert [t['id'] for t in templates] == [t['id'] for t in BED_TEMPLATES]
+
+
+class TestGuildPlants:
+
+    def test_guild_plants_are_records(self):
+        plant = get_guild_by_id('three-sisters')['plants'][0]
+        assert plant == GuildPlant(id='corn-1', quantity=4, role='Structure for beans')
+        with pytest.raises(AttributeError):
+            plant.quantity = 5
+
+    def test_api_serves_plant_dicts(self, client):
+        guild = client.get('/api/plant-guilds/three-sisters').get_json()
+        assert guild['plants'][0] == {'id': 'corn-1', 'quantity': 4, 'role': 'Structure for beans'}
+        guilds = client.get('/api/guilds').get_json()
+        assert guilds['three-sisters'] == guild
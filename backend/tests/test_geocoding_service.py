@@ -218,5 +218,40 @@ class TestEdgeCases:
         assert zone in ["8a", "9a"], "Should fall back to regional lookup"
 
 
+class TestZipcodeCoordinateCache:
+    """Test cached zipcode -> (lat, lon) resolution"""
+
+    def setup_method(self):
+        self.service = GeocodingService()
+        self.calls = []
+
+        def fake_validate(address):
+            self.calls.append(address)
+            if address == '00000':
+                return None
+            return {'latitude': 1.0, 'longitude': 2.0, 'formatted_address': address}
+
+        self.service.validate_address = fake_validate
+
+    def test_repeat_lookup_is_cached(self):
+        """Second lookup for the same zipcode does not geocode again"""
+        assert self.service.get_zipcode_coordinates('12345') == (1.0, 2.0)
+        assert self.service.get_zipcode_coordinates('12345') == (1.0, 2.0)
+        assert self.calls == ['12345']
+
+    def test_failed_lookup_not_cached(self):
+        """Misses are retried so a transient API failure is not remembered"""
+        assert self.service.get_zipcode_coordinates('00000') is None
+        assert self.service.get_zipcode_coordinates('00000') is None
+        assert self.calls == ['00000', '00000']
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Oldest entry is evicted once the cache is full"""
+        monkeypatch.setattr(sys.modules[GeocodingService.__module__], 'ZIPCODE_CACHE_MAX_ENTRIES', 2)
+        for zipcode in ('11111', '22222', '33333'):
+            self.service.get_zipcode_coordinates(zipcode)
+        assert list(self.service._zipcode_coords_cache) == ['22222', '33333']
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,71 @@
+"""
+Tests for POST /api/indoor-seed-starts/from-planting-event.
+
+Covers:
+- Indoor start date is weeksIndoors before the transplant date.
+- A linked planting event gets its seed start, transplant and harvest dates
+  updated in the same transaction.
+- Linking to a missing or another user's event returns 404 and creates nothing.
+- Direct-seeded plants are rejected.
+"""
+from datetime import datetime
+
+from models import db, IndoorSeedStart, PlantingEvent
+
+
+def _post(client, **payload):
+    return client.post('/api/indoor-seed-starts/from-planting-event', json=payload)
+
+
+def _event(user):
+    event = PlantingEvent(user_id=user.id, plant_id='tomato-1', event_type='planting',
+                          direct_seed_date=datetime(2026, 5, 15))
+    db.session.add(event)
+    db.session.commit()
+    return event
+
+
+class TestIndoorStartFromPlantingEvent:
+
+    def test_creates_start_without_event(self, auth_client_a):
+        resp = _post(auth_client_a, plantId='tomato-1', transplantDate='2026-05-15T00:00:00Z')
+        assert resp.status_code == 201
+        calc = resp.get_json()['calculation']
+        # Tomato: 6 weeks indoors
+        assert calc['weeksIndoors'] == 6
+        assert calc['indoorStartDate'].startswith('2026-04-03')
+        assert resp.get_json()['indoorSeedStart']['plantingEventId'] is None
+
+    def test_links_and_updates_event(self, auth_client_a, user_a):
+        event = _event(user_a)
+        resp = _post(auth_client_a, plantId='tomato-1', transplantDate='2026-05-15T00:00:00Z',
+                     plantingEventId=event.id)
+        assert resp.status_code == 201
+        assert resp.get_json()['indoorSeedStart']['plantingEventId'] == event.id
+
+        db.session.expire_all()
+        event = db.session.get(PlantingEvent, event.id)
+        assert event.seed_start_date.date().isoformat() == '2026-04-03'
+        assert event.transplant_date.date().isoformat() == '2026-05-15'
+        assert event.expected_harvest_date is not None
+
+    def test_other_users_event_is_not_found(self, auth_client_a, user_b):
+        event = _event(user_b)
+        resp = _post(auth_client_a, plantId='tomato-1', transplantDate='2026-05-15T00:00:00Z',
+                     plantingEventId=event.id)
+        assert resp.status_code == 404
+        assert IndoorSeedStart.query.count() == 0
+
+        db.session.expire_all()
+        assert db.session.get(PlantingEvent, event.id).seed_start_date is None
+
+    def test_missing_event_is_not_found(self, auth_client_a):
+        resp = _post(auth_client_a, plantId='tomato-1', transplantDate='2026-05-15T00:00:00Z',
+                     plantingEventId=99999)
+        assert resp.status_code == 404
+        assert IndoorSeedStart.query.count() == 0
+
+    def test_direct_seeded_plant_rejected(self, auth_client_a):
+        resp = _post(auth_client_a, plantId='carrot-1', transplantDate='2026-05-15T00:00:00Z')
+        assert resp.status_code == 400
+        assert resp.get_json()['canStartIndoors'] is False
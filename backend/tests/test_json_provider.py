@@ -0,0 +1,81 @@
+"""
+Tests for the orjson-backed Flask JSON provider.
+
+Covers:
+- Output matches Flask's default provider (sorted keys, RFC 822 dates,
+  integer dict keys).
+- NumPy scalars and arrays serialize directly.
+- Read-only mappings serialize as objects on the orjson and stdlib paths.
+- Namedtuples serialize as arrays; NaN and Infinity as null.
+- Request bodies parse through the provider.
+"""
+import json
+import math
+from collections import namedtuple
+from datetime import date, datetime
+from types import MappingProxyType
+
+import numpy as np
+import pytest
+from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+from utils.json_provider import OrjsonProvider
+
+
+@pytest.fixture
+def json_app():
+    json_app = Flask(__name__)
+    json_app.json = OrjsonProvider(json_app)
+
+    @json_app.route('/echo', methods=['POST'])
+    def echo():
+        return jsonify(request.get_json())
+
+    return json_app
+
+
+class TestOrjsonProvider:
+
+    def test_matches_default_provider(self, json_app):
+        payload = {
+            'b': [1, 2.5, None, True],
+            'a': {'nested': 'ok'},
+            'days': {12: 40.5, 3: 38.0},
+            'when': datetime(2026, 4, 15, 8, 30),
+            'day': date(2026, 4, 15),
+        }
+        expected = DefaultJSONProvider(json_app).dumps(payload)
+        assert json.loads(json_app.json.dumps(payload)) == json.loads(expected)
+        assert list(json.loads(json_app.json.dumps(payload))) == ['a', 'b', 'day', 'days', 'when']
+
+    def test_numpy_values(self, json_app):
+        out = json_app.json.dumps({'temps': np.array([1.5, 2.0]), 'flag': np.bool_(True)})
+        assert json.loads(out) == {'flag': True, 'temps': [1.5, 2.0]}
+
+    def test_mapping_proxy(self, json_app):
+        table = MappingProxyType({'b': (1, 2), 'a': MappingProxyType({'x': 1})})
+        assert json.loads(json_app.json.dumps(table)) == {'a': {'x': 1}, 'b': [1, 2]}
+        assert json.loads(json_app.json.dumps(table, indent=2)) == {'a': {'x': 1}, 'b': [1, 2]}
+
+    def test_namedtuple(self, json_app):
+        Spacing = namedtuple('Spacing', ['rowSpacing', 'plantSpacing'])
+        payload = {'spacing': Spacing(36, 24), 'nested': [Spacing(18, 8.5)]}
+        expected = DefaultJSONProvider(json_app).dumps(payload)
+        assert json.loads(json_app.json.dumps(payload)) == json.loads(expected)
+        assert json.loads(json_app.json.dumps(payload)) == {
+            'nested': [[18, 8.5]], 'spacing': [36, 24]
+        }
+
+    def test_non_finite_floats_are_null(self, json_app):
+        out = json_app.json.dumps({'nan': math.nan, 'inf': math.inf, 'temps': np.array([np.nan])})
+        assert json.loads(out) == {'inf': None, 'nan': None, 'temps': [None]}
+
+    def test_unsupported_type_raises(self, json_app):
+        with pytest.raises(TypeError):
+            json_app.json.dumps({'obj': object()})
+
+    def test_request_round_trip(self, json_app):
+        resp = json_app.test_client().post('/echo', json={'plantIds': ['tomato-1'], 'n': 3})
+        assert resp.status_code == 200
+        assert resp.get_json() == {'n': 3, 'plantIds': ['tomato-1']}
@@ -0,0 +1,26 @@
+"""
+Tests for plant_database lookups.
+
+Covers:
+- get_plant_by_id() returns the same dict as a scan of PLANT_DATABASE.
+- Unknown and unhashable IDs return None.
+- get_plants_by_ids() skips unknown IDs.
+"""
+from plant_database import PLANT_DATABASE, get_plant_by_id, get_plants_by_ids
+
+
+class TestPlantLookup:
+
+    def test_every_plant_is_indexed(self):
+        for plant in PLANT_DATABASE:
+            assert get_plant_by_id(plant['id']) is plant
+
+    def test_unknown_ids(self):
+        assert get_plant_by_id('not-a-plant') is None
+        assert get_plant_by_id(None) is None
+        assert get_plant_by_id(['tomato-1']) is None
+
+    def test_batch_lookup(self):
+        plants = get_plants_by_ids(['tomato-1', 'not-a-plant', 'lettuce-1', 'tomato-1'])
+        assert set(plants) == {'tomato-1', 'lettuce-1'}
+        assert plants['tomato-1'] is get_plant_by_id('tomato-1')
@@ -0,0 +1,55 @@
+"""
+Tests for season extension temperature offsets in utilities_bp.
+
+Covers:
+- calculate_protection_offset(): outer structures, inner structures at
+  65% efficiency, unknown types, and 'none'.
+- calculate_heat_protection_offset(): shade cloth reduction; float factors
+  keep their own label.
+"""
+import pytest
+
+from blueprints.utilities_bp import (
+    calculate_protection_offset,
+    calculate_heat_protection_offset,
+)
+
+
+class TestProtectionOffset:
+
+    @pytest.mark.parametrize('protection_type', [None, '', 'none'])
+    def test_no_protection(self, protection_type):
+        assert calculate_protection_offset(protection_type) == (0, None)
+
+    def test_outer_only(self):
+        assert calculate_protection_offset('cold-frame') == (10, 'Cold Frame')
+        assert calculate_protection_offset('row-cover', 'none') == (4, 'Row Cover')
+
+    def test_inner_structure_at_65_percent(self):
+        # 10 + 10 * 0.65 = 16.5 -> 16 (banker's rounding)
+        assert calculate_protection_offset('greenhouse', 'cold-frame') == (16, 'Greenhouse + Cold Frame')
+        # 8 + 4 * 0.65 = 10.6 -> 11
+        assert calculate_protection_offset('high-tunnel', 'row-cover') == (11, 'High Tunnel + Row Cover')
+
+    def test_unknown_inner_is_ignored(self):
+        assert calculate_protection_offset('low-tunnel', 'bubble-wrap') == (6, 'Low Tunnel')
+
+    def test_unknown_outer_uses_default_boost(self):
+        assert calculate_protection_offset('hoop-house') == (6, 'hoop-house')
+        assert calculate_protection_offset('hoop-house', 'row-cover') == (9, 'hoop-house + Row Cover')
+
+
+class TestHeatProtectionOffset:
+
+    @pytest.mark.parametrize('shade_factor,expected', [(30, 6), (50, 10), (70, 14), (45, 9), (50.0, 10)])
+    def test_shade_cloth(self, shade_factor, expected):
+        ext = {'shadeCloth': {'installed': True, 'shadeFactor': shade_factor}}
+        assert calculate_heat_protection_offset(ext) == (expected, f'{shade_factor}% Shade Cloth')
+
+    @pytest.mark.parametrize('ext', [
+        {},
+        {'shadeCloth': {'installed': False, 'shadeFactor': 50}},
+        {'shadeCloth': {'installed': True, 'shadeFactor': 0}},
+    ])
+    def test_no_shade(self, ext):
+        assert calculate_heat_protection_offset(ext) == (0, None)
@@ -0,0 +1,201 @@
+"""
+Tests for season_validator planting validation.
+
+Weather, geocoding, and date-suggestion lookups are stubbed so the tests
+exercise the frost window and soil temperature threshold logic offline.
+
+Covers:
+- validate_planting_for_property_batch() matches the per-plant
+  validate_planting_for_property() result for every plant, method,
+  protection level, and historical/current soil reading.
+- validate_planting_for_property_both_methods() matches the single-method
+  batch and resolves location and soil temperature only once.
+- validate_planting_validity_both_methods() agrees with the full result's
+  'valid' flag.
+- Plants flagged transplantOk False (carrot, radish, turnip) are invalid
+  for transplanting without weather lookups, in the scalar and batch paths.
+- Threshold classification: too cold, protected, marginal, too hot.
+"""
+from datetime import datetime
+
+import pytest
+
+import season_validator as sv
+from simulation_clock import get_now
+
+
+PLANT_IDS = [
+    'tomato-1', 'pepper-1', 'lettuce-1', 'spinach-1', 'carrot-1',
+    'bean-bush-1', 'pea-1', 'cucumber-1', 'basil-1', 'kale-1', 'not-a-plant',
+]
+
+
+@pytest.fixture
+def stub_weather(monkeypatch):
+    """Fixed soil temperatures: historical = 35 + 3 * month, current = 52°F."""
+    monkeypatch.setattr(sv.geocoding_service, 'get_zipcode_coordinates',
+                        lambda zipcode: (43.1, -87.9))
+    monkeypatch.setattr(sv, 'get_historical_daily_soil_temps',
+                        lambda latitude, longitude, month: {d: 35 + 3 * month for d in range(1, 32)})
+    monkeypatch.setattr(sv, 'get_soil_temperature_with_adjustments',
+                        lambda **kwargs: {'final_soil_temp': 52})
+    monkeypatch.setattr(sv, 'calculate_optimal_planting_dates',
+                        lambda **kwargs: {'kind': 'optimal', 'soil_temp_min': kwargs['soil_temp_min']})
+    monkeypatch.setattr(sv, 'calculate_cooler_planting_dates',
+                        lambda **kwargs: {'kind': 'cooler', 'soil_temp_min': kwargs['soil_temp_min']})
+
+
+def _dates():
+    year = get_now().year
+    today = datetime.combine(get_now().date(), datetime.min.time())
+    return [datetime(year, month, 10) for month in range(1, 13)] + [today]
+
+
+class TestBatchMatchesScalar:
+
+    @pytest.mark.parametrize('method', ['seed', 'transplant'])
+    @pytest.mark.parametrize('protection', [(0, None), (6, 'Low Tunnel'), (16, 'Cold Frame')])
+    def test_batch_matches_per_plant(self, app, stub_weather, method, protection):
+        offset, label = protection
+        year = get_now().year
+        kwargs = dict(
+            zipcode='53209',
+            last_frost_str=f'{year}-04-15',
+            first_frost_str=f'{year}-10-15',
+            protection_offset=offset,
+            protection_type=label,
+            planting_method=method,
+        )
+        for planting_date in _dates():
+            batch = sv.validate_planting_for_property_batch(
+                plant_ids=PLANT_IDS, planting_date=planting_date, **kwargs
+            )
+            for plant_id in PLANT_IDS:
+                single = sv.validate_planting_for_property(
+                    plant_id=plant_id, planting_date=planting_date, **kwargs
+                )
+                assert batch[plant_id] == single, (plant_id, planting_date)
+
+    def test_both_methods_share_lookups(self, app, stub_weather, monkeypatch):
+        lookups = []
+        real_lookup = sv._lookup_soil_temp
+        monkeypatch.setattr(sv, '_lookup_soil_temp',
+                            lambda *args: lookups.append(args) or real_lookup(*args))
+        year = get_now().year
+        kwargs = dict(
+            zipcode='53209',
+            last_frost_str=f'{year}-04-15',
+            first_frost_str=f'{year}-10-15',
+            protection_offset=6,
+            protection_type='Low Tunnel',
+        )
+        planting_date = datetime(year, 3, 10)
+
+        both = sv.validate_planting_for_property_both_methods(
+            plant_ids=PLANT_IDS, planting_date=planting_date, **kwargs
+        )
+        assert len(lookups) == 1
+        for method in ('seed', 'transplant'):
+            assert both[method] == sv.validate_planting_for_property_batch(
+                plant_ids=PLANT_IDS, planting_date=planting_date, planting_method=method, **kwargs
+            )
+        # Each method gets its own warning lists
+        assert both['seed']['tomato-1']['warnings'] is not both['transplant']['tomato-1']['warnings']
+
+    @pytest.mark.parametrize('protection', [(0, None), (6, 'Low Tunnel'), (16, 'Cold Frame')])
+    def test_validity_matches_full_result(self, app, stub_weather, protection):
+        offset, label = protection
+        year = get_now().year
+        kwargs = dict(
+            zipcode='53209',
+            last_frost_str=f'{year}-04-15',
+            first_frost_str=f'{year}-10-15',
+            protection_offset=offset,
+            protection_type=label,
+        )
+        for planting_date in _dates():
+            validity = sv.validate_planting_validity_both_methods(
+                plant_ids=PLANT_IDS, planting_date=planting_date, **kwargs
+            )
+            full = sv.validate_planting_for_property_both_methods(
+                plant_ids=PLANT_IDS, planting_date=planting_date, **kwargs
+            )
+            for plant_id in PLANT_IDS:
+                assert validity[plant_id] == {
+                    method: full[method][plant_id]['valid'] for method in ('seed', 'transplant')
+                }, (plant_id, planting_date)
+
+    def test_without_location_only_frost_rules_apply(self, app):
+        year = get_now().year
+        batch = sv.validate_planting_for_property_batch(
+            plant_ids=['tomato-1', 'lettuce-1'],
+            planting_date=datetime(year, 3, 1),
+            last_frost_str=f'{year}-04-15',
+            first_frost_str=f'{year}-10-15',
+        )
+        assert batch['tomato-1']['valid'] is False
+        assert [w['type'] for w in batch['tomato-1']['warnings']] == ['frost_risk']
+        assert batch['lettuce-1'] == {'valid': True, 'warnings': [], 'suggestion': None}
+
+
+class TestMethodMetadata:
+
+    def test_transplant_ruled_out(self, app, stub_weather, monkeypatch):
+        lookups = []
+        monkeypatch.setattr(sv, 'calculate_optimal_planting_dates',
+                            lambda **kwargs: lookups.append(kwargs['plant_id']))
+        year = get_now().year
+        kwargs = dict(zipcode='53209', last_frost_str=f'{year}-04-15', first_frost_str=f'{year}-10-15')
+        planting_date = datetime(year, 5, 10)
+        plant_ids = ['carrot-1', 'radish-1', 'turnip-1', 'lettuce-1']
+
+        both = sv.validate_planting_for_property_both_methods(
+            plant_ids=plant_ids, planting_date=planting_date, **kwargs
+        )
+        for plant_id in ('carrot-1', 'radish-1', 'turnip-1'):
+            result = both['transplant'][plant_id]
+            assert result['valid'] is False
+            assert [w['type'] for w in result['warnings']] == ['method_not_supported']
+            assert result == sv.validate_planting_for_property(
+                plant_id=plant_id, planting_date=planting_date, planting_method='transplant', **kwargs
+            )
+            assert both['seed'][plant_id]['valid'] is True
+        assert both['transplant']['lettuce-1']['valid'] is True
+        # Transplant suggestions are only computed for lettuce
+        assert lookups.count('lettuce-1') == 2
+        assert lookups.count('carrot-1') == 1
+
+        validity = sv.validate_planting_validity_both_methods(
+            plant_ids=plant_ids, planting_date=planting_date, **kwargs
+        )
+        assert validity['carrot-1'] == {'seed': True, 'transplant': False}
+        assert validity['lettuce-1'] == {'seed': True, 'transplant': True}
+
+
+class TestSoilTempWarnings:
+
+    def _types(self, **flags):
+        warnings = sv._soil_temp_warnings(
+            'Lettuce', 'seeding', 40, 50, 0, None, ('April', 10), **flags
+        )
+        return [w['type'] for w in warnings]
+
+    def test_flags_map_to_warning_types(self):
+        none = dict(too_cold=False, protected=False, marginal=False, too_hot=False)
+        assert self._types(**{**none, 'too_cold': True}) == ['soil_temp_low']
+        assert self._types(**{**none, 'marginal': True}) == ['soil_temp_marginal']
+        assert self._types(**{**none, 'too_hot': True}) == ['soil_temp_high']
+        assert self._types(**none) == []
+
+    def test_marginal_only_for_historical_readings(self):
+        warnings = sv._soil_temp_warnings(
+            'Lettuce', 'seeding', 40, 42, 0, None, None,
+            too_cold=False, protected=False, marginal=True, too_hot=False
+        )
+        assert warnings == []
+
+    def test_transplant_requirement_is_relaxed(self):
+        plant = {'soil_temp_min': 70}
+        assert sv._soil_temp_requirement(plant, is_seed=True) == 70
+        assert sv._soil_temp_requirement(plant, is_seed=False) == 56
+        assert sv._soil_temp_requirement({}, is_seed=False) == 40
@@ -634,5 +634,39 @@ class TestLookupTableSync:
             assert row == 4 and plant == 1, \
                 f"{plant_id} should be (4, 1), got ({row}, {plant})"
 
+    def test_migardener_overrides_read_only(self):
+        """MIGARDENER_SPACING_OVERRIDES cannot be modified"""
+        from migardener_spacing import MIGARDENER_SPACING_OVERRIDES
+        with pytest.raises(TypeError):
+            MIGARDENER_SPACING_OVERRIDES['tomato-1'] = (1, 1)
+
+    def test_migardener_spacing_pairs(self):
+        """get_migardener_spacing returns (row, plant) pairs"""
+        from migardener_spacing import get_migardener_spacing
+        assert get_migardener_spacing('tomato-1', 24, 36) == (24, 18)
+        assert get_migardener_spacing('unknown-plant', 8, 16) == (4.0, 2.0)
+        assert get_migardener_spacing('unknown-plant', 8) == (8, 2.0)
+        assert get_migardener_spacing('spinach-1', 6) == (None, 4)
+
+    def test_migardener_spacing_memoized(self):
+        """Repeat lookups return the same cached MigardenerSpacing"""
+        from migardener_spacing import get_migardener_spacing
+        first = get_migardener_spacing('unknown-plant', 10, 20)
+        assert (first.row_spacing, first.plant_spacing) == (5.0, 2.5)
+        assert get_migardener_spacing('unknown-plant', 10, 20) is first
+
+    def test_migardener_row_helpers(self):
+        """Rows and plants per row divide the bed by the MIGardener spacing"""
+        from migardener_spacing import (
+            calculate_migardener_plants_per_row, calculate_migardener_rows,
+        )
+        assert calculate_migardener_rows(4, 'tomato-1', 24, 36) == 2
+        assert calculate_migardener_plants_per_row(10, 'tomato-1', 24, 36) == 6
+        # Intensive crops fill the bed width in 3" grid rows
+        assert calculate_migardener_rows(4, 'spinach-1', 6) == 16
+        # Fractional spacings divide like the frontend's Math.floor(a / b):
+        # 87.6 / 1.825 is 48, where 87.6 // 1.825 would give 47
+        assert calculate_migardener_plants_per_row(7.3, 'unknown-plant', 7.3) == 48
+
 
 # Run tests with: cd backend && pytest tests/test_space_calculation_sync.py -v
@@ -0,0 +1,68 @@
+"""
+Tests for POST /api/spacing-calculator.
+
+Covers:
+- Each planning method returns the expected totals for a known plant.
+- Unknown method and malformed bed dimensions return 400.
+"""
+import pytest
+
+
+def _post(client, **payload):
+    return client.post('/api/spacing-calculator', json=payload)
+
+
+class TestSpacingCalculatorMethods:
+
+    def test_square_foot(self, client):
+        resp = _post(client, plantId='tomato-1', bedWidth=4, bedLength=4, method='square-foot')
+        assert resp.status_code == 200
+        body = resp.get_json()
+        assert body['method'] == 'square-foot'
+        assert body['perSquare'] == 1
+        assert body['totalSquares'] == 16
+        assert body['totalPlants'] == 16
+        assert body['gridSize'] == 12
+
+    def test_row(self, client):
+        resp = _post(client, plantId='tomato-1', bedWidth=4, bedLength=8, method='row')
+        body = resp.get_json()
+        # 48" / 36" rows = 1 row, 96" / 24" = 4 plants per row
+        assert body['numRows'] == 1
+        assert body['plantsPerRow'] == 4
+        assert body['totalPlants'] == 4
+
+    def test_intensive(self, client):
+        resp = _post(client, plantId='tomato-1', bedWidth=4, bedLength=8, method='intensive')
+        body = resp.get_json()
+        assert body['spacing'] == 18
+        assert body['pattern'] == 'hexagonal'
+        assert body['totalPlants'] == int(32 * (144 / (18 * 18)) * 0.866)
+
+    def test_migardener(self, client):
+        resp = _post(client, plantId='lettuce-1', bedWidth=4, bedLength=8, method='migardener')
+        body = resp.get_json()
+        assert body['numRows'] == 12
+        assert body['plantsPerRow'] == 24
+        assert body['totalPlants'] == 288
+        assert body['plantsPerSqFt'] == 9.0
+
+    def test_default_method_is_square_foot(self, client):
+        resp = _post(client, plantId='carrot-1', bedWidth=4, bedLength=4)
+        assert resp.get_json()['totalPlants'] == 256
+
+
+class TestSpacingCalculatorValidation:
+
+    def test_invalid_method_returns_400(self, client):
+        resp = _post(client, plantId='tomato-1', bedWidth=4, bedLength=8, method='invalid-method')
+        assert resp.status_code == 400
+
+    def test_missing_plant_id_returns_400(self, client):
+        resp = _post(client, bedWidth=4, bedLength=8, method='row')
+        assert resp.status_code == 400
+
+    @pytest.mark.parametrize('width', [None, 'four', 0, -2, True])
+    def test_bad_dimensions_return_400(self, client, width):
+        resp = _post(client, plantId='tomato-1', bedWidth=width, bedLength=8, method='migardener')
+        assert resp.status_code == 400
@@ -0,0 +1,208 @@
+"""
+Tests for POST /api/validate-plants-batch.
+
+No zipcode or property is sent, so frost dates fall back to the Zone 5b
+default (Apr 15 / Oct 15) and no geocoding or weather lookups happen.
+
+Covers:
+- Tender plants before last frost are invalid for seed and transplant.
+- Hardy plants are valid with no frost warnings; carrot cannot be transplanted.
+- Indoor-start window is computed from weeksIndoors/transplantWeeksBefore.
+- Unknown plant IDs still get a result entry.
+- Bed season extension protection is applied, only for the caller's beds.
+- Bed create/update caches the protection offset, and validation uses it.
+- With a zipcode, forward cold danger warnings come from the historical
+  air temperature window fetched in the background.
+- ?minimal=1 returns only seed/transplant validity booleans.
+- Missing fields and malformed dates return 400.
+"""
+import json
+
+import pytest
+
+import forward_planting_validator
+import season_validator
+from models import db, GardenBed
+from simulation_clock import get_now
+
+
+YEAR = get_now().year
+
+
+def _post(client, **payload):
+    return client.post('/api/validate-plants-batch', json=payload)
+
+
+class TestValidatePlantsBatch:
+
+    def test_requires_auth(self, client):
+        resp = _post(client, plantIds=['tomato-1'], plantingDate=f'{YEAR}-02-18')
+        assert resp.status_code == 401
+
+    def test_tender_plant_before_last_frost(self, auth_client_a):
+        resp = _post(auth_client_a, plantIds=['tomato-1'], plantingDate=f'{YEAR}-02-18')
+        assert resp.status_code == 200
+        body = resp.get_json()
+        tomato = body['results']['tomato-1']
+
+        for method in ('seed', 'transplant'):
+            assert tomato[method]['valid'] is False
+            assert any(w['type'] == 'frost_risk' for w in tomato[method]['warnings'])
+
+        assert body['frostDateSource'] == 'default'
+        assert body['lastFrostDate'] == f'{YEAR}-04-15'
+        assert body['firstFrostDate'] == f'{YEAR}-10-15'
+
+    def test_indoor_start_window(self, auth_client_a):
+        # Tomato: transplant 2 weeks before last frost (Apr 1), start 6 weeks earlier (Feb 18)
+        resp = _post(auth_client_a, plantIds=['tomato-1'], plantingDate=f'{YEAR}-02-18')
+        indoor = resp.get_json()['results']['tomato-1']['indoor_start']
+        assert indoor['valid'] is True
+        assert indoor['weeks_until_transplant'] == 6
+        assert indoor['transplant_target_date'] == f'{YEAR}-04-01'
+
+    def test_indoor_start_outside_window(self, auth_client_a):
+        resp = _post(auth_client_a, plantIds=['tomato-1'], plantingDate=f'{YEAR}-06-01')
+        indoor = resp.get_json()['results']['tomato-1']['indoor_start']
+        assert indoor['valid'] is False
+        assert indoor['weeks_until_transplant'] is None
+
+    def test_hardy_plant_is_valid(self, auth_client_a):
+        resp = _post(auth_client_a, plantIds=['lettuce-1', 'carrot-1'], plantingDate=f'{YEAR}-03-20')
+        results = resp.get_json()['results']
+        for plant_id in ('lettuce-1', 'carrot-1'):
+            assert results[plant_id]['seed']['valid'] is True
+        assert results['lettuce-1']['transplant']['valid'] is True
+        # Carrot is direct seed only (transplantOk: False)
+        assert results['carrot-1']['transplant']['valid'] is False
+
+    def test_iso_datetime_with_z_suffix(self, auth_client_a):
+        resp = _post(auth_client_a, plantIds=['tomato-1'], plantingDate=f'{YEAR}-02-18T12:00:00.000Z')
+        assert resp.status_code == 200
+        assert resp.get_json()['results']['tomato-1']['indoor_start']['valid'] is True
+
+    def test_unknown_plant_gets_entry(self, auth_client_a):
+        resp = _post(auth_client_a, plantIds=['not-a-plant'], plantingDate=f'{YEAR}-05-01')
+        result = resp.get_json()['results']['not-a-plant']
+        assert result['seed']['valid'] is True
+        assert result['indoor_start']['valid'] is False
+
+    def test_minimal_returns_booleans(self, auth_client_a):
+        resp = auth_client_a.post('/api/validate-plants-batch?minimal=1', json={
+            'plantIds': ['tomato-1', 'lettuce-1', 'not-a-plant'], 'plantingDate': f'{YEAR}-02-18',
+        })
+        assert resp.status_code == 200
+        body = resp.get_json()
+        assert body['results'] == {
+            'tomato-1': {'seed': False, 'transplant': False},
+            'lettuce-1': {'seed': True, 'transplant': True},
+            'not-a-plant': {'seed': True, 'transplant': True},
+        }
+        assert body['frostDateSource'] == 'default'
+
+    def test_missing_fields_return_400(self, auth_client_a):
+        assert _post(auth_client_a, plantingDate=f'{YEAR}-05-01').status_code == 400
+        assert _post(auth_client_a, plantIds=['tomato-1']).status_code == 400
+
+    @pytest.mark.parametrize('planting_date', ['not-a-date', f'{YEAR}-02-30', 20260218])
+    def test_invalid_date_returns_400(self, auth_client_a, planting_date):
+        resp = _post(auth_client_a, plantIds=['tomato-1'], plantingDate=planting_date)
+        assert resp.status_code == 400
+
+
+class TestBedProtection:
+
+    def _bed(self, user, season_extension):
+        bed = GardenBed(user_id=user.id, name='Covered', width=4.0, length=8.0,
+                        season_extension=json.dumps(season_extension))
+        db.session.add(bed)
+        db.session.commit()
+        return bed
+
+    def test_bed_protection_is_applied(self, auth_client_a, user_a):
+        bed = self._bed(user_a, {'type': 'greenhouse', 'innerType': 'cold-frame'})
+        resp = _post(auth_client_a, plantIds=['tomato-1'], plantingDate=f'{YEAR}-02-18', bedId=bed.id)
+        seed = resp.get_json()['results']['tomato-1']['seed']
+        # Greenhouse + cold frame = +16°F, enough to downgrade frost risk to info
+        assert [w['type'] for w in seed['warnings']] == ['frost_risk_protected']
+        assert 'Greenhouse + Cold Frame provides +16°F' in seed['warnings'][0]['message']
+        assert seed['valid'] is True
+
+    def test_other_users_bed_is_ignored(self, auth_client_a, user_b):
+        bed = self._bed(user_b, {'type': 'greenhouse', 'innerType': 'cold-frame'})
+        resp = _post(auth_client_a, plantIds=['tomato-1'], plantingDate=f'{YEAR}-02-18', bedId=bed.id)
+        seed = resp.get_json()['results']['tomato-1']['seed']
+        assert [w['type'] for w in seed['warnings']] == ['frost_risk']
+        assert seed['valid'] is False
+
+    def test_bed_api_caches_protection(self, auth_client_a):
+        resp = auth_client_a.post('/api/garden-beds', json={
+            'name': 'Tunnel', 'width': 4, 'length': 8,
+            'seasonExtension': {'type': 'low-tunnel'},
+        })
+        bed_id = resp.get_json()['id']
+        bed = db.session.get(GardenBed, bed_id)
+        assert (bed.protection_offset_cached, bed.protection_type_cached) == (6, 'Low Tunnel')
+
+        auth_client_a.put(f'/api/garden-beds/{bed_id}', json={
+            'seasonExtension': {'type': 'greenhouse', 'innerType': 'cold-frame'},
+        })
+        db.session.expire_all()
+        bed = db.session.get(GardenBed, bed_id)
+        assert (bed.protection_offset_cached, bed.protection_type_cached) == (16, 'Greenhouse + Cold Frame')
+
+        auth_client_a.put(f'/api/garden-beds/{bed_id}', json={'seasonExtension': None})
+        db.session.expire_all()
+        bed = db.session.get(GardenBed, bed_id)
+        assert (bed.protection_offset_cached, bed.protection_type_cached) == (0, None)
+
+    def test_cached_protection_is_used(self, auth_client_a, user_a):
+        # Cached columns win over the raw JSON once populated
+        bed = self._bed(user_a, {'type': 'row-cover'})
+        bed.protection_offset_cached = 16
+        bed.protection_type_cached = 'Greenhouse + Cold Frame'
+        db.session.commit()
+        resp = _post(auth_client_a, plantIds=['tomato-1'], plantingDate=f'{YEAR}-02-18', bedId=bed.id)
+        seed = resp.get_json()['results']['tomato-1']['seed']
+        assert [w['type'] for w in seed['warnings']] == ['frost_risk_protected']
+
+
+@pytest.fixture
+def stub_location_weather(monkeypatch):
+    """Geocode every zipcode to Milwaukee; mild soil, hard freeze every March night."""
+    monkeypatch.setattr(season_validator.geocoding_service, 'get_zipcode_coordinates',
+                        lambda zipcode: (43.1, -87.9))
+    monkeypatch.setattr(season_validator.geocoding_service, '_lookup_zone_via_api',
+                        lambda zipcode: None)
+    monkeypatch.setattr(season_validator, 'get_historical_daily_soil_temps',
+                        lambda latitude, longitude, month: {d: 60.0 for d in range(1, 32)})
+    monkeypatch.setattr(season_validator, 'get_soil_temperature_with_adjustments',
+                        lambda **kwargs: {'final_soil_temp': 60.0})
+    monkeypatch.setattr(
+        forward_planting_validator, 'get_historical_daily_air_temps',
+        lambda latitude, longitude, month: {d: 10.0 if month == 3 else 45.0 for d in range(1, 32)}
+    )
+
+
+class TestForwardColdDanger:
+
+    def test_cold_danger_added_to_both_methods(self, auth_client_a, stub_location_weather):
+        resp = _post(auth_client_a, plantIds=['lettuce-1', 'garlic-1'],
+                     plantingDate=f'{YEAR}-02-20', zipcode='53209')
+        results = resp.get_json()['results']
+        for method in ('seed', 'transplant'):
+            lettuce = [w['type'] for w in results['lettuce-1'][method]['warnings']]
+            assert 'future_cold_danger' in lettuce
+            # Garlic survives sub-zero temps
+            garlic = [w['type'] for w in results['garlic-1'][method]['warnings']]
+            assert 'future_cold_danger' not in garlic
+
+    def test_cold_window_failure_is_not_fatal(self, auth_client_a, stub_location_weather, monkeypatch):
+        def unavailable(*args):
+            raise RuntimeError('weather service down')
+
+        monkeypatch.setattr(forward_planting_validator, 'get_historical_daily_air_temps', unavailable)
+        resp = _post(auth_client_a, plantIds=['lettuce-1'], plantingDate=f'{YEAR}-02-20', zipcode='53209')
+        assert resp.status_code == 200
+        warnings = resp.get_json()['results']['lettuce-1']['seed']['warnings']
+        assert 'future_cold_danger' not in [w['type'] for w in warnings]
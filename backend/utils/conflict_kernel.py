@@ -0,0 +1,139 @@
+"""
+Fused spatial + temporal conflict kernel for conflict_checker.BedIndex.
+
+The NumPy path in BedIndex builds several temporary arrays per check
+(|dx|, |dy|, their maximum, the per-event requirement, the mask). This
+kernel does the whole test in one loop over the bed's arrays, writing only
+into a caller-supplied mask, and is compiled with numba (pinned in
+requirements.txt). If numba cannot be imported, e.g. on a platform without
+a wheel, the loop would be slower than NumPy, so callers check
+NUMBA_AVAILABLE and fall back to the NumPy path.
+
+find_conflict_matrix() is the bulk form used by has_conflicts_batch(): one
+row per new planting. It is compiled without parallel=True: a bed's rows
+are few, and numba's default threading layer is not safe when several
+request threads call parallel functions at once.
+
+Compiled code is cached on disk (cache=True); warm_up() loads or compiles
+it for the array types BedIndex builds, so the cost lands at app startup
+instead of on the first conflict check a user makes. The compiled kernel
+releases the GIL while it runs (nogil=True), so conflict checks from
+concurrent request threads are not serialized on it.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - NumPy fallback when numba is unavailable
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def find_conflicts(new_x, new_y, new_cells, new_start, new_end, check_dates,
+                   xs, ys, cells, starts, ends, out_mask):
+    """
+    Mark the events that overlap a new planting.
+
+    An event overlaps when its Chebyshev distance from (new_x, new_y) is less
+    than the larger of the two footprints (in cells) and, if check_dates is
+    set, its [start, end] day range intersects [new_start, new_end]. Day
+    ranges are inclusive; callers apply the exact date rule afterwards.
+
+    Args:
+        new_x, new_y: Grid position of the new planting
+        new_cells: Footprint of the new planting in cells
+        new_start, new_end: Day ordinals of the new planting
+        check_dates: Whether to apply the date test at all
+        xs, ys, cells, starts, ends: Per-event arrays of equal length
+        out_mask: uint8/bool array of the same length, overwritten
+
+    Returns:
+        Number of events marked
+    """
+    count = 0
+    for i in range(xs.shape[0]):
+        dx = xs[i] - new_x
+        if dx < 0:
+            dx = -dx
+        dy = ys[i] - new_y
+        if dy < 0:
+            dy = -dy
+        distance = dx if dx > dy else dy
+        required = cells[i] if cells[i] > new_cells else new_cells
+
+        hit = distance < required
+        if hit and check_dates:
+            hit = starts[i] <= new_end and new_start <= ends[i]
+        out_mask[i] = hit
+        if hit:
+            count += 1
+    return count
+
+
+def find_conflict_matrix(new_xs, new_ys, new_cells, new_starts, new_ends, new_valid,
+                         xs, ys, cells, starts, ends, out_mask):
+    """
+    find_conflicts() for many new plantings at once, for bulk checks.
+
+    Row i of out_mask marks the events that overlap new planting i. Unlike
+    find_conflicts() the date test is always applied and is strict, the
+    rule has_conflict() uses; rows with new_valid[i] unset (a missing date)
+    mark nothing.
+
+    Args:
+        new_xs, new_ys, new_cells, new_starts, new_ends, new_valid: Per-new-
+            planting arrays of equal length
+        xs, ys, cells, starts, ends: Per-event arrays of equal length
+        out_mask: bool array of shape (new plantings, events), overwritten
+    """
+    for i in range(new_xs.shape[0]):
+        for j in range(xs.shape[0]):
+            hit = False
+            if new_valid[i]:
+                dx = xs[j] - new_xs[i]
+                if dx < 0:
+                    dx = -dx
+                dy = ys[j] - new_ys[i]
+                if dy < 0:
+                    dy = -dy
+                distance = dx if dx > dy else dy
+                required = cells[j] if cells[j] > new_cells[i] else new_cells[i]
+                hit = (distance < required and starts[j] < new_ends[i]
+                       and new_starts[i] < ends[j])
+            out_mask[i, j] = hit
+
+
+if NUMBA_AVAILABLE:  # pragma: no cover - exercised only with numba installed
+    # BedIndex always passes arrays of equal length, so indexing by
+    # range(len(xs)) cannot go out of bounds
+    find_conflicts = njit(cache=True, nogil=True, boundscheck=False)(find_conflicts)
+    find_conflict_matrix = njit(cache=True, nogil=True, boundscheck=False)(find_conflict_matrix)
+
+
+def warm_up() -> bool:
+    """
+    Compile (or load from cache) find_conflicts() for BedIndex's array types:
+    int16 grid positions and footprints, or float64 positions when a bed has
+    fractional ones, with int32 day ordinals.
+
+    Returns:
+        True if the numba kernel is in use, False on the NumPy fallback
+    """
+    if not NUMBA_AVAILABLE:
+        return False
+
+    mask = np.zeros(1, dtype=np.bool_)
+    days = np.zeros(1, dtype=np.int32)
+    compact = np.zeros(1, dtype=np.int16)
+    wide = np.zeros(1, dtype=np.float64)
+    find_conflicts(0, 0, 1, 0, 0, True, compact, compact, compact, days, days, mask)
+    find_conflicts(0.0, 0.0, 1, 0, 0, True, wide, wide, compact, days, days, mask)
+
+    matrix = np.zeros((1, 1), dtype=np.bool_)
+    new_cells = np.zeros(1, dtype=np.int64)
+    new_days = np.zeros(1, dtype=np.int64)
+    for positions in (compact, wide):
+        find_conflict_matrix(wide, wide, new_cells, new_days, new_days, mask,
+                             positions, positions, compact, days, days, matrix)
+    return True
@@ -0,0 +1,66 @@
+"""
+Flask JSON provider backed by orjson.
+
+orjson is a C extension that serializes and parses JSON several times faster
+than the stdlib json module, which matters for the large plant validation
+payloads. Output matches Flask's default provider: keys are sorted, and
+dates/datetimes still go through Flask's default hook (RFC 822 strings).
+Read-only mappings (MappingProxyType, used for reference tables) serialize
+as objects on both paths, and namedtuples (Spacing, MigardenerSpacing, ...)
+as arrays, as the stdlib does for any tuple.
+
+One difference is deliberate: NaN and Infinity serialize as null rather
+than the stdlib's bare NaN/Infinity tokens, which are not JSON and make the
+browser's JSON.parse reject the whole response.
+
+If orjson is not installed the provider falls back to Flask's stdlib
+implementation, so it is always safe to install.
+"""
+from types import MappingProxyType
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def _default(o):
+    if isinstance(o, MappingProxyType):
+        return dict(o)
+    # orjson serializes plain tuples itself but not tuple subclasses
+    if isinstance(o, tuple):
+        return list(o)
+    return DefaultJSONProvider.default(o)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """DefaultJSONProvider with orjson dumps/loads when available."""
+
+    default = staticmethod(_default)
+
+    def dumps(self, obj, **kwargs):
+        # Explicit stdlib options (indent, separators, ...) keep the stdlib path
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+
+        option = (
+            orjson.OPT_SORT_KEYS
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Pretty-printed responses (debug mode or compact=False) keep the stdlib path
+        if orjson is None or self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(f"{self.dumps(obj)}\n", mimetype=self.mimetype)
@@ -140,6 +140,7 @@ export const PLANT_DATABASE: Plant[] = [
     plantingDepth: 0.25,
     germinationTemp: { min: 45, max: 85 },
     transplantWeeksBefore: 0,
+    transplantOk: false, // Taproot forks or bolts when moved; direct seed only
     notes: 'Can be overwintered in ground with mulch. Sweetens with cold.',
     daysToSeed: 120,
   },
@@ -182,6 +183,7 @@ export const PLANT_DATABASE: Plant[] = [
     plantingDepth: 0.5,
     germinationTemp: { min: 45, max: 85 },
     transplantWeeksBefore: 0,
+    transplantOk: false, // Taproot forks or bolts when moved; direct seed only
     notes: 'Fast growing. Great for spring and fall.',
     daysToSeed: 60,
   },
@@ -203,6 +205,7 @@ export const PLANT_DATABASE: Plant[] = [
     plantingDepth: 0.5,
     germinationTemp: { min: 45, max: 85 },
     transplantWeeksBefore: 0,
+    transplantOk: false, // Taproot forks or bolts when moved; direct seed only
     notes: 'Both roots and greens are edible.',
     daysToSeed: 120,
   },
@@ -78,6 +78,7 @@ export interface Plant {
   soilTempMin?: number; // Minimum soil temperature for germination (Fahrenheit)
   transplantWeeksBefore: number; // weeks before last frost
   weeksIndoors?: number; // weeks to start indoors before transplanting (0 = direct seed)
+  transplantOk?: boolean; // false = does not transplant well (direct seed only)
   germinationDays?: number; // Days from planting to emergence
   idealSeasons?: ('spring' | 'summer' | 'fall' | 'winter')[]; // Best planting seasons
   heatTolerance?: 'low' | 'medium' | 'high' | 'excellent'; // General heat tolerance
@@ -376,6 +377,9 @@ export interface PlantingEvent {
   // Export key for linking PlantingEvent back to GardenPlanItem succession
   // Format: "{planItemId}_{date}_{index}" or "{planItemId}_trellis_{trellisId}_{date}_{index}"
   exportKey?: string;
+
+  // PlantedItem created together with this event (null if none or deleted)
+  plantedItemId?: number;
 }
 
 // Trellis structure for linear vine crop allocation